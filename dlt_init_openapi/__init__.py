@@ -3,12 +3,15 @@
 from enum import Enum
 from importlib.metadata import version
 from pathlib import Path
-from typing import cast
+from typing import Any, Optional, cast
 
 import httpcore
 import httpx
 from loguru import logger
 
+from dlt_init_openapi.parser.spec_files import SpecFiles, is_archive, open_spec_files
+from dlt_init_openapi.utils.download_cache import DownloadCache, download_spec
+from dlt_init_openapi.utils.inflection import inf
 from dlt_init_openapi.utils.misc import import_class_from_string
 
 from .config import Config
@@ -45,6 +48,12 @@ class Project:  # pylint: disable=too-many-instance-attributes
         self.renderer = renderer
         self.config = config
 
+    def __enter__(self) -> "Project":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
     def parse(self) -> None:
         self.openapi.parse(self.doc)
 
@@ -52,15 +61,30 @@ class Project:  # pylint: disable=too-many-instance-attributes
         logger.info("Running heuristics on parsed output")
         self.detector.run(self.openapi)
         logger.success("Heuristics completed")
+        logger.debug(f"Inflection cache stats: {inf.stats()}")
+
+    def compact(self) -> None:
+        """Release the spec document, the raw spec and the openapi models once detection is done.
+        Rendering only needs the detection results, the project can't be parsed or detected again afterwards.
+        """
+        self.doc = None
+        self.openapi.compact()
+
+    def close(self) -> None:
+        """Close the files of the spec, the project can't be parsed or detected again afterwards"""
+        self.openapi.close()
 
     def render(self, dry: bool = False) -> None:
         logger.info("Rendering project")
+        selected_endpoints = self.openapi.endpoints.endpoint_ids_to_render
         if self.config.endpoint_filter:
             filtered_endpoints = self.config.endpoint_filter(self.openapi.endpoints)
             if filtered_endpoints:
-                self.openapi.endpoints.set_ids_to_render(filtered_endpoints)
+                selected_endpoints = filtered_endpoints
             else:
                 logger.warning("You have not selected any endpoints, all endpoints will be rendered.")
+        # also renders parents of selected transformers
+        self.openapi.endpoints.set_ids_to_render(selected_endpoints)
         self.renderer.run(self.openapi, dry=dry)
         logger.success(f"Rendered project to: {self.config.project_dir}")
         logger.info("You can now run your pipeline from this folder with 'python pipeline.py'.")
@@ -87,20 +111,29 @@ class Project:  # pylint: disable=too-many-instance-attributes
                     logger.warning(w.msg)
 
 
-def _get_document(*, config: Config, timeout: int = 60) -> bytes:
+def _get_document(*, config: Config, spec_files: Optional[SpecFiles] = None, timeout: int = 60) -> bytes:
+    """Get the root document of the spec, read from `spec_files` if the spec is already open"""
     if config.spec_url is not None and config.spec_path is not None:
         raise ValueError("Provide URL or Path, not both.")
     if config.spec_url is not None:
         logger.info(f"Downloading spec from {config.spec_url}")
         try:
-            response = httpx.get(config.spec_url, timeout=timeout)
-            logger.success("Download complete")
-            return response.content
+            if config.use_cache:
+                return DownloadCache(config).download(config.spec_url, timeout=timeout)
+            return download_spec(config.spec_url, timeout=timeout)
         except (httpx.HTTPError, httpcore.NetworkError) as e:
             raise ValueError("Could not get OpenAPI document from provided URL") from e
     elif config.spec_path is not None:
         logger.info(f"Reading spec from {config.spec_path}")
-        return Path(config.spec_path).read_bytes()
+        spec_path = Path(config.spec_path)
+        if not (spec_path.is_dir() or is_archive(spec_path)):
+            return spec_path.read_bytes()
+        if spec_files is not None:
+            logger.info(f"Using {spec_files.root} as root document")
+            return spec_files.read(spec_files.root)
+        with open_spec_files(spec_path, config.spec_root) as spec_files:
+            logger.info(f"Using {spec_files.root} as root document")
+            return spec_files.read(spec_files.root)
     else:
         raise ValueError("No URL or Path provided")
 
@@ -108,14 +141,18 @@ def _get_document(*, config: Config, timeout: int = 60) -> bytes:
 def _get_project_for_url_or_path(  # pylint: disable=too-many-arguments
     config: Config = None,
 ) -> Project:
-    doc = _get_document(config=config)
+    # the files of a spec are opened once, the parser closes them
+    spec_files = (
+        open_spec_files(config.spec_path, config.spec_root) if config.spec_path and not config.spec_url else None
+    )
+    doc = _get_document(config=config, spec_files=spec_files)
 
     renderer_cls = cast(BaseRenderer, import_class_from_string(config.renderer_class))
     detector_cls = cast(BaseDetector, import_class_from_string(config.detector_class))
 
     return Project(
         doc=doc,
-        openapi=OpenapiParser(config),
+        openapi=OpenapiParser(config, spec_files),
         detector=detector_cls(config),  # type: ignore
         renderer=renderer_cls(config),  # type: ignore
         config=config,
@@ -132,11 +169,13 @@ def create_new_client(
     Returns:
         The project.
     """
-    project = _get_project_for_url_or_path(
+    with _get_project_for_url_or_path(
         config=config,
-    )
-    project.parse()
-    project.detect()
-    project.render()
-    project.print_warnings()
+    ) as project:
+        project.parse()
+        project.detect()
+        if config.compact:
+            project.compact()
+        project.render()
+        project.print_warnings()
     return project
@@ -1,16 +1,18 @@
 import pathlib
 import sys
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 import questionary
 import typer
 from dlt.cli import utils
 from loguru import logger
 
-from dlt_init_openapi.cli.cli_endpoint_selection import questionary_endpoint_selection
+from dlt_init_openapi.cli.cli_endpoint_selection import questionary_path_selection
 from dlt_init_openapi.config import Config
 from dlt_init_openapi.exceptions import DltOpenAPITerminalException
+from dlt_init_openapi.parser.spec_cache import SpecCache
 from dlt_init_openapi.utils import update_rest_api
+from dlt_init_openapi.utils.download_cache import DownloadCache
 
 app = typer.Typer(add_completion=False)
 
@@ -45,12 +47,18 @@ def init(
     interactive: bool = typer.Option(True, help="Wether to select needed endpoints interactively"),
     log_level: int = typer.Option(20, help="Set logging level for stdout output, defaults to 20 (INFO)"),
     global_limit: int = typer.Option(0, help="Set a global limit on the generated source"),
+    jobs: int = typer.Option(1, help="Number of processes that parse and detect the endpoints of the spec"),
+    include_path: Optional[List[str]] = typer.Option(
+        None, help="Only parse endpoints with a path matching this regex, can be used multiple times."
+    ),
     allow_openapi_2: bool = typer.Option(
         False,
         "--allow-openapi-2",
         help="Allow to use OpenAPI v2. specs. Migration of the spec to 3.0 is recommended though.",
     ),
     update_rest_api_source: bool = typer.Option(False, help="Update the locally cached rest_api verified source."),
+    cache: bool = typer.Option(True, help="Cache downloaded and validated specs on disk to speed up repeated runs."),
+    clear_cache: bool = typer.Option(False, help="Clear the on disk cache before running."),
     version: bool = typer.Option(False, "--version", callback=_print_version, help="Print the version and exit"),
 ) -> None:
     """Generate a new dlt pipeline"""
@@ -64,8 +72,12 @@ def init(
         interactive=interactive,
         log_level=log_level,
         global_limit=global_limit,
+        jobs=jobs,
+        include_path=include_path,
         update_rest_api_source=update_rest_api_source,
         allow_openapi_2=allow_openapi_2,
+        cache=cache,
+        clear_cache=clear_cache,
     )
 
 
@@ -79,8 +91,12 @@ def _init_command_wrapped(
     interactive: bool = True,
     log_level: int = 20,
     global_limit: int = 0,
+    jobs: int = 1,
+    include_path: Optional[List[str]] = None,
     update_rest_api_source: bool = False,
     allow_openapi_2: bool = False,
+    cache: bool = True,
+    clear_cache: bool = False,
 ) -> None:
 
     from dlt_init_openapi import create_new_client
@@ -108,14 +124,22 @@ def _init_command_wrapped(
                 "project_name": source,
                 "package_name": source,
                 "output_path": output_path,
-                "endpoint_filter": questionary_endpoint_selection if interactive else None,
+                "path_filter": questionary_path_selection if interactive else None,
                 "global_limit": global_limit,
+                "jobs": jobs,
+                "include_paths": include_path or None,
                 "spec_url": url,
                 "spec_path": path,
                 "allow_openapi_2": allow_openapi_2,
+                "use_cache": cache,
             },
         )
 
+        if clear_cache:
+            logger.info("Clearing on disk cache")
+            SpecCache(config).clear()
+            DownloadCache(config).clear()
+
         if config.project_dir.exists():
             if not interactive:
                 logger.info("Non interactive mode selected, overwriting existing source.")
@@ -1,10 +1,31 @@
-from typing import List, Set
+from typing import Dict, List, Set
 
 import questionary
 
+from dlt_init_openapi.parser.endpoint_index import EndpointIndex, IndexedEndpoint
 from dlt_init_openapi.parser.endpoints import Endpoint, EndpointCollection
 
 
+def questionary_path_selection(index: EndpointIndex) -> Set[str]:
+    """Path selection with questionary before parsing. Returns a Set of paths, only they and their parents get parsed"""
+    endpoints_by_path: Dict[str, List[IndexedEndpoint]] = {}
+    for indexed_endpoint in index.endpoints:
+        endpoints_by_path.setdefault(indexed_endpoint.path, []).append(indexed_endpoint)
+    choices: List[questionary.Choice] = []
+    for path in index.paths:
+        text = [("bold", path)]
+        for indexed_endpoint in endpoints_by_path.get(path, []):
+            text.append(("italic", f" {indexed_endpoint.method} {indexed_endpoint.operation_id or ''}".rstrip()))
+        choices.append(questionary.Choice(text, path))
+    selected_paths: List[str] = questionary.checkbox(
+        "Which paths would you like to generate resources for? Press enter to continue, "
+        + "if you do not select any paths, all of them will be rendered.",
+        choices,
+    ).ask()
+
+    return set(selected_paths)
+
+
 def questionary_endpoint_selection(endpoints: EndpointCollection) -> Set[str]:
     """Endpoint selection with questionary. Returns a Set of endpoint names and a set of endpoints to deselect"""
     choices: List[questionary.Choice] = []
@@ -9,7 +9,7 @@ from pydantic import BaseModel
 
 from dlt_init_openapi.utils.misc import snake_case
 
-from .typing import TEndpointFilter
+from .typing import TEndpointFilter, TPathFilter
 
 REST_API_SOURCE_LOCATION = str(pathlib.Path(__file__).parent.resolve() / "../rest_api")
 
@@ -31,6 +31,14 @@ class Config(BaseModel):
     """Commands to run after code generation"""
     include_methods: List[str] = ["get"]
     """HTTP methods to render from OpenAPI spec"""
+    spec_root: Optional[str] = None
+    """Path of the root document if the spec is a directory or archive, found by its name if not set"""
+    include_paths: Optional[List[str]] = None
+    """Regular expressions, only endpoints with a matching path and their possible parents are parsed"""
+    prune_spec: bool = True
+    """Drop operations and components that no included endpoint references before validating the spec"""
+    validate_per_path: bool = False
+    """Validate every path on its own, in `jobs` processes. Invalid paths that are not included are skipped"""
     fallback_openapi_title: str = "openapi"
     """Fallback title when openapi info.title is missing or empty"""
     project_folder_suffix: str = "_pipeline"
@@ -41,6 +49,8 @@ class Config(BaseModel):
     """Suffix for dataset"""
     endpoint_filter: Optional[TEndpointFilter] = None
     """filter for endpoint rendering"""
+    path_filter: Optional[TPathFilter] = None
+    """Selects paths from an index of the spec before parsing, only they and their parents are parsed"""
     name_resources_by_operation: bool = False
     """always name resources by operation id, useful for testing"""
     renderer_class: str = "dlt_init_openapi.renderer.default.DefaultRenderer"
@@ -55,6 +65,18 @@ class Config(BaseModel):
     """default to render for unrequired parameters that do not have a default in the spec"""
     allow_openapi_2: bool = False
     """Allow to use OpenAPI 2 specs"""
+    use_cache: bool = False
+    """Cache loaded and validated specs on disk and reuse them when the same spec is parsed again"""
+    cache_dir: Optional[Path] = None
+    """Folder for the on disk cache, defaults to openapi_cache in the dlt data dir"""
+    cache_max_size_mb: int = 512
+    """Maximum size of the on disk cache of downloads and specs, least recently used entries are evicted first"""
+    jobs: int = 1
+    """Number of processes that parse and detect the endpoints, endpoints are split between them"""
+    compact: bool = False
+    """Release the spec and the openapi models after detection, only the detection results needed to render are kept"""
+    component_cache_size: int = 4096
+    """Maximum number of resolved and parsed components kept in memory while parsing a spec"""
 
     # internal, do not set via config file
     project_dir: Path = None
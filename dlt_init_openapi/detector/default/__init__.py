@@ -3,7 +3,7 @@ Default open source detector
 """
 
 import json
-from typing import Dict, List, Optional, Tuple, Union, cast
+from typing import Dict, List, Optional, Tuple, Union
 
 from dlt_init_openapi.config import Config
 from dlt_init_openapi.detector.base_detector import GLOBAL_WARNING_KEY, BaseDetector
@@ -14,14 +14,8 @@ from dlt_init_openapi.parser.models import DataPropertyPath
 from dlt_init_openapi.parser.openapi_parser import OpenapiParser
 from dlt_init_openapi.parser.pagination import Pagination
 from dlt_init_openapi.parser.parameters import Parameter
-from dlt_init_openapi.utils.misc import snake_case
-from dlt_init_openapi.utils.paths import (
-    get_non_var_path_parts,
-    get_path_parts,
-    get_path_var_names,
-    path_looks_like_list,
-    table_names_from_paths,
-)
+from dlt_init_openapi.utils.misc import normalize_name, snake_case
+from dlt_init_openapi.utils.paths import ParsedPath, PathTrie, table_names_from_paths
 
 from .const import (
     DEFAULT_MAXIMUM_PAGINATOR_OFFSET,
@@ -47,8 +41,6 @@ from .warnings import (
     UnsupportedSecuritySchemeWarning,
 )
 
-Tree = Dict[str, Union["str", "Tree"]]
-
 
 class DefaultDetector(BaseDetector):
 
@@ -145,7 +137,7 @@ class DefaultDetector(BaseDetector):
             name = endpoint.payload.name if endpoint.payload else None
             # try to use the singularized last path element
             if not name:
-                parts = get_non_var_path_parts(endpoint.path)
+                parts = endpoint.parsed_path.non_var_parts
                 if len(parts):
                     name = utils.inf.singularize(parts[-1])
             endpoint.detected_resource_name = snake_case(name)
@@ -174,15 +166,15 @@ class DefaultDetector(BaseDetector):
             ppayload = endpoint.parent.payload
 
             # Find the actual last param name in the path
-            if not (path_params := get_path_var_names(endpoint.path)):
+            if not (path_params := endpoint.parsed_path.var_names):
                 continue
             param_name = path_params[-1]
 
-            # try to match the path var to a property on the parent payload
+            # try to match the path var to a property on the parent payload, prefer the same name in other case
             input_prop = None
-            for prop in ppayload.schema.all_properties:
-                if prop.name.lower() == param_name.lower():
-                    input_prop = prop
+            if matches := ppayload.schema.normalized_properties_map.get(normalize_name(param_name)):
+                same_name = [prop for prop in matches if prop.name.lower() == param_name.lower()]
+                input_prop = (same_name or matches)[-1]
 
             # fall back to primary key detected on the parent payload
             if not input_prop and endpoint.parent.primary_key:
@@ -198,23 +190,40 @@ class DefaultDetector(BaseDetector):
             )
 
     def detect_paginators_and_responses(self, endpoints: EndpointCollection) -> None:
-        # iterate over endpoints and detect response and pagination settings
+        """Map stage of the detection, runs the per endpoint heuristics in a process pool if `config.jobs` is set.
+        Warnings are added in the order of the endpoints either way.
+        """
+        if self.config.jobs > 1 and len(endpoints.endpoints) > 1:
+            from .parallel import detect_endpoints_in_parallel
+
+            detections = detect_endpoints_in_parallel(self, endpoints.endpoints)
+            for endpoint, detection in zip(endpoints.endpoints, detections):
+                detection.apply(endpoint)
+                for warning in detection.warnings:
+                    self._add_warning(warning, endpoint)
+        else:
+            for endpoint in endpoints.endpoints:
+                self.detect_endpoint(endpoint)
+
+    def detect_endpoint(self, endpoint: Endpoint) -> None:
+        """Detect response, pagination, payload and primary key of a single endpoint. Only looks at the
+        endpoint itself, everything across endpoints is detected afterwards.
+        """
         # order is important here, as some detections need the result of other
         # detections
-        for endpoint in endpoints.endpoints:
-            # first detect response
-            endpoint.detected_data_response = self.detect_main_response(endpoint)
+        # first detect response
+        endpoint.detected_data_response = self.detect_main_response(endpoint)
 
-            # then detect pagination
-            endpoint.detected_pagination = self.detect_pagination(endpoint)
+        # then detect pagination
+        endpoint.detected_pagination = self.detect_pagination(endpoint)
 
-            # with this info we can more safely detect the response payload
-            if endpoint.detected_data_response:
-                expect_list = (endpoint.detected_pagination is not None) or path_looks_like_list(endpoint.path)
-                endpoint.detected_data_response.detected_payload = self.detect_response_payload(
-                    endpoint.detected_data_response, expect_list=expect_list
-                )
-                self.detect_primary_key(endpoint, endpoint.detected_data_response, endpoint.path)
+        # with this info we can more safely detect the response payload
+        if endpoint.detected_data_response:
+            expect_list = (endpoint.detected_pagination is not None) or endpoint.parsed_path.looks_like_list
+            endpoint.detected_data_response.detected_payload = self.detect_response_payload(
+                endpoint.detected_data_response, expect_list=expect_list
+            )
+            self.detect_primary_key(endpoint, endpoint.detected_data_response, endpoint.parsed_path)
 
     def detect_global_pagination(self, open_api: OpenapiParser) -> None:
         """go through all detected paginators and see which one we can set as global"""
@@ -250,18 +259,17 @@ class DefaultDetector(BaseDetector):
         for e in open_api.endpoints.endpoints:
             e.detected_global_pagination = global_paginator
 
-    def detect_primary_key(self, e: Endpoint, response: Response, path: str) -> None:
+    def detect_primary_key(self, e: Endpoint, response: Response, path: ParsedPath) -> None:
         """detect the primary key from the payload"""
         if not response.detected_payload:
             return
         schema = response.detected_payload.schema
 
         # first, try to detect primary key by name, all props that are string, int or untyped are candidates
-        primary_key_candidates = [
-            prop.name
-            for prop in schema.all_properties
-            if (not prop.schema.types or set(prop.schema.types) & {"string", "integer"})
-        ]
+        primary_key_candidates: Dict[str, List[str]] = {}
+        for key, props in schema.normalized_properties_map.items():
+            if names := [p.name for p in props if not p.schema.types or set(p.schema.types) & {"string", "integer"}]:
+                primary_key_candidates[key] = names
         response.detected_primary_key = detect_primary_key_by_name(primary_key_candidates, schema.name, path)
         if response.detected_primary_key:
             return
@@ -323,9 +331,14 @@ class DefaultDetector(BaseDetector):
             # either no list expected or no list found..
             if not payload:
                 payload_path: List[str] = []
+                # recursive schemas are cycles, do not descend into a schema twice
+                seen = {id(response.schema)}
                 while len(response.schema.properties) == 1 and response.schema.properties[0].is_object:
                     # Schema contains only a single object property. The payload may be inside.
                     prop = response.schema.properties[0]
+                    if id(prop.schema) in seen:
+                        break
+                    seen.add(id(prop.schema))
                     payload_path.append(prop.name)
                     response.schema = prop.schema
                 payload = DataPropertyPath(tuple(payload_path), response.schema)
@@ -366,7 +379,7 @@ class DefaultDetector(BaseDetector):
         # if we could not find matching prop in response, we can try to find the
         # matching prop in the response with a regex
         if response_schema and len(cursor_params) == 1 and not cursor_props:
-            if prop := response_schema.nested_properties.find_property(RE_CURSOR_PROP):
+            if prop := response_schema.nested_properties.find_property(RE_CURSOR_PROP, allow_in_lists=False):
                 cursor_props.append((cursor_params[0], prop))
 
         # Prefer the least nested cursor prop
@@ -407,7 +420,7 @@ class DefaultDetector(BaseDetector):
             limit_initial = to_int(limit_param.maximum) if limit_param.maximum else to_int(limit_param.default)
         total_prop = (
             response_schema.nested_properties.find_property(
-                RE_TOTAL_PROPERTY, require_type="integer", allow_unknown_types=True
+                RE_TOTAL_PROPERTY, require_type="integer", allow_unknown_types=True, allow_in_lists=False
             )
             if response_schema
             else None
@@ -442,7 +455,9 @@ class DefaultDetector(BaseDetector):
                 "page_param": page_param.name,
             }
             total_prop = (
-                response_schema.nested_properties.find_property(RE_TOTAL_PAGE_PROPERTY, require_type="integer")
+                response_schema.nested_properties.find_property(
+                    RE_TOTAL_PAGE_PROPERTY, require_type="integer", allow_in_lists=False
+                )
                 if response_schema
                 else None
             )
@@ -461,7 +476,9 @@ class DefaultDetector(BaseDetector):
         # Detect json_links
         #
         if response_schema:
-            next_prop = response_schema.nested_properties.find_property(RE_NEXT_PROPERTY, require_type="string")
+            next_prop = response_schema.nested_properties.find_property(
+                RE_NEXT_PROPERTY, require_type="string", allow_in_lists=False
+            )
             if next_prop:
                 return Pagination(
                     paginator_config={"type": "json_response", "next_url_path": next_prop.json_path},
@@ -479,38 +496,28 @@ class DefaultDetector(BaseDetector):
 
     def detect_parent_child_relationships(self, endpoints: EndpointCollection) -> None:
         """detect parent child relationships based on path"""
-        ENDPOINT_MARKER = "<endpoint>"
 
         # save a map
         endpoint_map = endpoints.endpoints_by_path
 
         # determine if we can use normalized path parts, this means we singularize all
         # non param parts to be able to detect a relationship like /pokemons -> /pokemon/{id}
-        singularized_paths = {"/".join(utils.singularized_path_parts(p)) for p in endpoint_map.keys()}
+        singularized_paths = {e.parsed_path.singularized_parts for e in endpoint_map.values()}
         can_singularize = len(singularized_paths) == len(endpoint_map.keys())
 
+        def path_parts(endpoint: Endpoint) -> Tuple[str, ...]:
+            return endpoint.parsed_path.singularized_parts if can_singularize else endpoint.parsed_path.parts
+
         # build endpoint tree
-        tree: Tree = {}
+        tree: PathTrie[str] = PathTrie()
         for endpoint in endpoints.endpoints:
-            current_node = tree
-            parts = utils.singularized_path_parts(endpoint.path) if can_singularize else get_path_parts(endpoint.path)
-            for part in parts:
-                if part not in current_node:
-                    current_node[part] = {}
-                current_node = current_node[part]  # type: ignore
-            current_node[ENDPOINT_MARKER] = endpoint.path
+            tree.insert(path_parts(endpoint), endpoint.path)
 
         def find_nearest_list_parent(endpoint: Endpoint) -> Optional[Endpoint]:
-            parts = utils.singularized_path_parts(endpoint.path) if can_singularize else get_path_parts(endpoint.path)
-            while parts:
-                current_node = tree
-                parts.pop()
-                for part in parts:
-                    current_node = current_node[part]  # type: ignore[assignment]
-                if parent_endpoint_path := cast(str, current_node.get(ENDPOINT_MARKER)):
-                    found_endpoint = endpoint_map[parent_endpoint_path]
-                    if found_endpoint.is_list:
-                        return found_endpoint
+            for parent_endpoint_path in tree.ancestor_values(path_parts(endpoint)):
+                found_endpoint = endpoint_map[parent_endpoint_path]
+                if found_endpoint.is_list:
+                    return found_endpoint
             return None
 
         # link endpoints
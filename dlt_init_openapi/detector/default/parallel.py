@@ -0,0 +1,154 @@
+"""
+Runs the per endpoint heuristics of the detector in a pool of processes. Workers get the endpoints without
+their context and attach one built from the spec. They send back what they detected as names and property paths,
+the main process applies it to its own endpoints in endpoint order.
+"""
+
+import copy
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing.context import BaseContext
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+import openapi_schema_pydantic as osp
+
+from dlt_init_openapi.config import Config
+from dlt_init_openapi.parser.endpoints import Endpoint
+from dlt_init_openapi.parser.models import DataPropertyPath, SchemaWrapper
+from dlt_init_openapi.parser.pagination import Pagination
+from dlt_init_openapi.parser.parallel import worker_context
+
+from .warnings import BaseDetectionWarning
+
+if TYPE_CHECKING:
+    from . import DefaultDetector
+
+# chunks per worker, more chunks balance the load better
+CHUNKS_PER_JOB = 4
+
+_worker_detector: Optional["DefaultDetector"] = None
+_worker_endpoints: Sequence[Endpoint] = ()
+
+
+@dataclass
+class EndpointDetection:
+    """Result of the per endpoint heuristics. Responses are referred to by index, parameters by name
+    and schemas by their path from the response schema, so it can be sent between processes.
+    """
+
+    warnings: List[BaseDetectionWarning] = field(default_factory=list)
+    data_response_index: Optional[int] = None
+    response_schema_path: Tuple[str, ...] = ()
+    payload_path: Optional[Tuple[str, ...]] = None
+    primary_key: Optional[str] = None
+    paginator_config: Optional[Dict[str, Union[str, int]]] = None
+    pagination_param_names: List[Optional[str]] = field(default_factory=list)
+
+    @classmethod
+    def from_endpoint(cls, endpoint: Endpoint, warnings: List[BaseDetectionWarning]) -> "EndpointDetection":
+        """Describe what was detected on endpoint"""
+        detection = cls(warnings=warnings)
+        if pagination := endpoint.detected_pagination:
+            detection.paginator_config = pagination.paginator_config
+            detection.pagination_param_names = [p.name if p else None for p in pagination.pagination_params]
+        if (response := endpoint.detected_data_response) is None:
+            return detection
+        detection.data_response_index = endpoint.responses.index(response)
+        detection.primary_key = response.detected_primary_key
+        if payload := response.detected_payload:
+            detection.payload_path = payload.path
+            # the payload detection descends into single object properties
+            if response.schema is not response.content_schema:
+                detection.response_schema_path = payload.path
+        return detection
+
+    def apply(self, endpoint: Endpoint) -> None:
+        """Set the detected response, payload, primary key and pagination on endpoint"""
+        if self.paginator_config is not None:
+            endpoint.detected_pagination = Pagination(
+                paginator_config=self.paginator_config,
+                pagination_params=[endpoint.parameters[n] if n else None for n in self.pagination_param_names],
+            )
+        if self.data_response_index is None:
+            return
+        response = endpoint.responses[self.data_response_index]
+        endpoint.detected_data_response = response
+        response.detected_primary_key = self.primary_key
+        if self.payload_path is None:
+            return
+        root = response.content_schema
+        for name in self.response_schema_path:
+            response.schema = response.schema.properties_map[name].schema
+        if self.payload_path == self.response_schema_path:
+            payload_schema = response.schema
+        else:
+            payload_schema = _nested_schema(root, self.payload_path)
+        response.detected_payload = DataPropertyPath(self.payload_path, payload_schema)
+
+
+def detect_endpoints_in_parallel(
+    detector: "DefaultDetector", endpoints: List[Endpoint], mp_context: Optional[BaseContext] = None
+) -> List[EndpointDetection]:
+    """Run the per endpoint heuristics of detector in `config.jobs` processes, results are in the order of endpoints"""
+    jobs = detector.config.jobs
+    chunk_size = max(1, -(-len(endpoints) // (jobs * CHUNKS_PER_JOB)))
+    bounds = range(0, len(endpoints) + chunk_size, chunk_size)
+    chunks = [range(start, min(stop, len(endpoints))) for start, stop in zip(bounds, bounds[1:])]
+    # the endpoint and path filters are not needed to detect and may not be picklable
+    config = detector.config.copy(update={"endpoint_filter": None, "path_filter": None})
+    context = endpoints[0].context
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(chunks)),
+        mp_context=mp_context,
+        initializer=_init_worker,
+        initargs=(type(detector), config, context.spec, context.spec_raw, [_detached(e) for e in endpoints]),
+    ) as executor:
+        return [detection for chunk in executor.map(_detect_chunk, chunks) for detection in chunk]
+
+
+def _detached(endpoint: Endpoint) -> Endpoint:
+    """Copy of endpoint and its responses without the context, which can't be pickled"""
+    detached = copy.copy(endpoint)
+    detached.context = None
+    detached.responses = [copy.copy(response) for response in endpoint.responses]
+    for response in detached.responses:
+        response.context = None
+    return detached
+
+
+def _init_worker(
+    detector_cls: Type["DefaultDetector"],
+    config: Config,
+    spec: osp.OpenAPI,
+    spec_raw: Dict[str, Any],
+    endpoints: Sequence[Endpoint],
+) -> None:
+    global _worker_detector, _worker_endpoints
+    _worker_detector = detector_cls(config)
+    context = worker_context(config, spec, spec_raw)
+    for endpoint in endpoints:
+        endpoint.context = context
+        for response in endpoint.responses:
+            response.context = context
+    _worker_endpoints = endpoints
+
+
+def _detect_chunk(indices: range) -> List[EndpointDetection]:
+    detections = []
+    for index in indices:
+        endpoint = _worker_endpoints[index]
+        _worker_detector.warnings = {}
+        _worker_detector.detect_endpoint(endpoint)
+        warnings = _worker_detector.warnings.get(endpoint.id, [])
+        detections.append(EndpointDetection.from_endpoint(endpoint, warnings))
+    return detections
+
+
+def _nested_schema(schema: SchemaWrapper, path: Tuple[str, ...]) -> SchemaWrapper:
+    """Schema at a path of `NestedProperties`, without discovering all nested properties of schema"""
+    for part in path:
+        if not schema.is_object and part == "[*]":
+            schema = schema.array_item
+        else:
+            schema = schema.all_properties_map[part].schema
+    return schema
@@ -1,22 +1,25 @@
-from typing import List, Optional
+from typing import Mapping, Optional, Sequence
 
-from dlt_init_openapi.utils import paths
+from dlt_init_openapi.utils.misc import normalize_name
+from dlt_init_openapi.utils.paths import ParsedPath
 
 from .const import PRIMARY_KEY_SUFFIXES, PRIMARY_KEY_WORD_SEPARATORS, PRIMAY_KEY_NAMES
 from .utils import get_word_variations
 
 
 def detect_primary_key_by_name(
-    candidates: List[str], model_name: Optional[str] = None, path: Optional[str] = None
+    candidates: Mapping[str, Sequence[str]], model_name: Optional[str] = None, path: Optional[ParsedPath] = None
 ) -> str:
-    """Try to discover the primary key by name, take into account modelname and path"""
+    """Try to discover the primary key by name, take into account modelname and path.
+    Candidates map names normalized with `normalize_name` to the property names, e.g. `{"userid": ["userId"]}`
+    """
 
     # build a list of probable names, starting with hardcorded values
     probable_names = [*PRIMAY_KEY_NAMES]
 
     # last path var is a good probably name
     # TODO: maybe only use it if we think it is not a collection endpoint?
-    if path_vars := paths.get_path_var_names(path):
+    if path and (path_vars := path.var_names):
         probable_names.append(path_vars[-1])
 
     # gather some base words from model name and url and create variations
@@ -28,7 +31,7 @@ def detect_primary_key_by_name(
 
     # last non path var element is a good basename
     # TODO: maybe only take if we think this is not collection endpoint?
-    if non_var_parts := paths.get_non_var_path_parts(path):
+    if path and (non_var_parts := path.non_var_parts):
         words.append(non_var_parts[-1])
 
     # build primary key candidates
@@ -39,11 +42,9 @@ def detect_primary_key_by_name(
                     probable_names.append(f"{word_variation}{separator}{suffix}")
                     probable_names.append(f"{suffix}{separator}{word_variation}")
 
-    # TODO: resolve camelcasing / snakecasing differences
-
     for pname in probable_names:
-        for candidate in candidates:
-            if candidate.lower() == pname.lower():
-                return candidate
+        if names := candidates.get(normalize_name(pname)):
+            # prefer the name that only differs in case
+            return next((name for name in names if name.lower() == pname.lower()), names[0])
 
     return None
@@ -2,11 +2,8 @@
 
 from typing import Any, List
 
-import inflector  # type: ignore
-
 from dlt_init_openapi.utils import paths
-
-inf = inflector.English()
+from dlt_init_openapi.utils.inflection import inf
 
 
 def get_word_variations(word: str) -> List[str]:
@@ -18,8 +15,7 @@ def get_word_variations(word: str) -> List[str]:
 
 
 def singularized_path_parts(path: str) -> List[str]:
-    path_parts = paths.get_path_parts(path)
-    return [inf.singularize(p) if not paths.is_path_var(p) else p for p in path_parts]
+    return list(paths.ParsedPath.from_path(path).singularized_parts)
 
 
 def to_int(value: Any) -> int:
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Any, Dict, List, Tuple
 
 
 class DltOpenAPIException(Exception):
@@ -11,6 +11,7 @@ class DltOpenAPITerminalException(DltOpenAPIException):
 
 class DltOpenAPINot30Exception(DltOpenAPITerminalException):
     def __init__(self, swagger_detected: bool = False) -> None:
+        self.swagger_detected = swagger_detected
 
         swagger_helper = "If this is a Swagger/OpenAPI 2.0 or earlier spec, "
         if swagger_detected:
@@ -28,24 +29,53 @@ class DltOpenAPINot30Exception(DltOpenAPITerminalException):
             "The spec you selected does not appear to be an OpenAPI 3.0 spec. " + swagger_helper + convert_helper
         )
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return type(self), (self.swagger_detected,)
+
 
 class DltInvalidSpecException(DltOpenAPITerminalException):
-    def __init__(self) -> None:
+    def __init__(self, path_errors: Dict[str, str] = None) -> None:
+        self.path_errors = path_errors or {}
+        details = "".join(f"\n\nPath {path} is invalid: {error}" for path, error in self.path_errors.items())
 
         super().__init__(
             "Could not validate selected spec, please provide a valid YAML or JSON OpenAPI 3.0 or higher spec."
+            + details
         )
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return type(self), (self.path_errors,)
+
 
 class DltUnparseableSpecException(DltOpenAPITerminalException):
     def __init__(self) -> None:
 
         super().__init__("Could not parse selected spec, please provide a valid YAML or JSON document.")
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return type(self), ()
+
+
+class DltSpecFileNotFoundException(DltOpenAPITerminalException):
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+        super().__init__(
+            f"Could not find {name} in the provided spec. Please make sure all files referenced by the spec "
+            + "are in the same directory or archive."
+        )
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return type(self), (self.name,)
+
 
 class DltNoEndpointsDiscovered(DltOpenAPITerminalException):
     def __init__(self, enabled_methods: List[str]):
+        self.enabled_methods = enabled_methods
         super().__init__(
             f"Did not find any endpoint with http methods {enabled_methods} in provided OpenAPI spec. "
             + "Please check your spec if endpoints with these methods exist or add additional methods in your config."
         )
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return type(self), (self.enabled_methods,)
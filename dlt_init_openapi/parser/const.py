@@ -1,4 +0,0 @@
-#
-# Some settings
-#
-MAX_RECURSION_DEPTH = 6
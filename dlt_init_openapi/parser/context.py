@@ -1,10 +1,23 @@
-from typing import Any, Dict, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Type, TypeVar, Union
 
 import openapi_schema_pydantic as osp
 import referencing
+import referencing.exceptions
 import referencing.jsonschema
 
+from dlt_init_openapi.exceptions import DltSpecFileNotFoundException
 from dlt_init_openapi.parser.config import Config
+from dlt_init_openapi.parser.pointer_index import JsonPointerIndex
+from dlt_init_openapi.parser.schema_hash import schema_hash
+from dlt_init_openapi.parser.spec_files import SpecFiles, name_from_external_ref
+from dlt_init_openapi.utils.lru_cache import LRUCache
+
+if TYPE_CHECKING:
+    from dlt_init_openapi.parser.models import SchemaWrapper
+    from dlt_init_openapi.parser.parameters import Parameter
+
+TSchemaWrapperKey = Tuple[str, Optional[str]]
+TParameterKey = Tuple[str, Optional[str]]
 
 TComponentClass = Union[
     osp.Schema,
@@ -17,33 +30,129 @@ TComponentClass = Union[
     osp.RequestBody,
 ]
 
+TComponent = TypeVar("TComponent", osp.Schema, osp.Parameter, osp.Response, osp.PathItem)
+
 
 class OpenapiContext:
     spec: osp.OpenAPI
     spec_raw: Dict[str, Any]
     config: Config
 
-    _component_cache: Dict[str, Dict[str, Any]] = {}
-
-    def __init__(self, config: Config, spec: osp.OpenAPI, spec_raw: Dict[str, Any]) -> None:
+    def __init__(
+        self, config: Config, spec: osp.OpenAPI, spec_raw: Dict[str, Any], spec_files: Optional[SpecFiles] = None
+    ) -> None:
         self.config = config
         self.spec = spec
         self.spec_raw = spec_raw
 
+        # local refs are resolved from the index, the resolver handles everything else
+        self._pointer_index = JsonPointerIndex(self.spec_raw)
+
         # setup ref resolver
         resource = referencing.Resource(  # type: ignore[var-annotated, call-arg]
             contents=self.spec_raw, specification=referencing.jsonschema.DRAFT202012
         )
-        registry = referencing.Registry().with_resource(resource=resource, uri="")
+        # other files of the spec are loaded on first reference
+        registry: referencing.Registry[Any] = (
+            referencing.Registry(retrieve=spec_files.retrieve)  # type: ignore[call-arg]
+            if spec_files
+            else referencing.Registry()
+        )
+        registry = registry.with_resource(resource=resource, uri="")
         self._resolver = registry.resolver()
+        # resolved refs and the models parsed from them, bounded for long running processes.
+        # structural hashes of referenced schemas are kept with the parsed models, see schema_hash
+        self._component_cache: LRUCache[str, Dict[str, Any]] = LRUCache(config.component_cache_size)
+        self._parsed_component_cache: LRUCache[Tuple[str, str], Any] = LRUCache(config.component_cache_size)
+
+        # wrappers built from references, shared by all endpoints using the same component
+        self._schema_wrapper_cache: Dict[TSchemaWrapperKey, "SchemaWrapper"] = {}
+        # wrappers that are registered but whose children are still being built, outermost first
+        self._schema_wrappers_in_progress: List[TSchemaWrapperKey] = []
+        # wrappers in progress that miss members composed of a wrapper further out, they are not shared
+        self._incomplete_schema_wrappers: Set[TSchemaWrapperKey] = set()
+        # parameters built from references, shared read only by all operations using them
+        self._parameter_cache: Dict[TParameterKey, "Parameter"] = {}
+
+    def compact(self) -> None:
+        """Release the spec and everything resolved from it. Only the config is still available afterwards"""
+        self.spec = None
+        self.spec_raw = None
+        self._pointer_index = None
+        self._resolver = None
+        self._component_cache.clear()
+        self._parsed_component_cache.clear()
+        self._schema_wrapper_cache = {}
+        self._parameter_cache = {}
+
+    def schema_wrapper_from_cache(self, key: TSchemaWrapperKey) -> Optional["SchemaWrapper"]:
+        return self._schema_wrapper_cache.get(key)
+
+    def begin_schema_wrapper(self, key: TSchemaWrapperKey, wrapper: "SchemaWrapper") -> None:
+        """Register a wrapper before its children are built, so references back to it resolve to the same object"""
+        self._schema_wrapper_cache[key] = wrapper
+        self._schema_wrappers_in_progress.append(key)
+
+    def end_schema_wrapper(self, key: TSchemaWrapperKey) -> None:
+        """Finish a wrapper. Incomplete wrappers and all wrappers built while they were in progress are removed
+        from the cache, they are built again when requested outside of the cycle.
+        """
+        self._schema_wrappers_in_progress.pop()
+        if key not in self._incomplete_schema_wrappers:
+            return
+        self._incomplete_schema_wrappers.discard(key)
+        # the wrapper was registered after everything that is cached before it
+        while self._schema_wrapper_cache.popitem()[0] != key:
+            pass
+
+    def schema_wrapper_in_progress(self, key: TSchemaWrapperKey) -> bool:
+        return key in self._schema_wrappers_in_progress
+
+    def drop_composed_back_reference(self, key: TSchemaWrapperKey) -> None:
+        """A member of allOf/oneOf/anyOf refers back to a wrapper in progress and is left out, all wrappers
+        built within that wrapper are incomplete. A schema composed of itself directly is not incomplete.
+        """
+        in_progress = self._schema_wrappers_in_progress
+        self._incomplete_schema_wrappers.update(in_progress[in_progress.index(key) + 1 :])  # noqa: E203
+
+    def parameter_from_cache(self, key: TParameterKey) -> Optional["Parameter"]:
+        return self._parameter_cache.get(key)
+
+    def cache_parameter(self, key: TParameterKey, parameter: "Parameter") -> None:
+        self._parameter_cache[key] = parameter
+
+    def schema_hash(self, ref: Union[osp.Reference, osp.Schema]) -> str:
+        """Structural hash of a schema, the hashes of referenced schemas are memoized by ref"""
+        if isinstance(ref, osp.Schema):
+            return schema_hash(ref)
+        key = ("schema_hash", ref.ref)
+        result = self._parsed_component_cache.get(key)
+        if result is None:
+            result = schema_hash(self.schema_from_reference(ref))
+            self._parsed_component_cache.put(key, result)
+        return result
 
     def _component_from_reference_url(self, url: str) -> Dict[str, Any]:
-        if url in self._component_cache:
-            return self._component_cache[url]
-        obj = self._resolver.lookup(url).contents
-        self._component_cache[url] = obj
+        obj = self._component_cache.get(url)
+        if obj is None:
+            obj = self._pointer_index.lookup(url)
+            if obj is None:
+                obj = self._lookup(url)
+            self._component_cache.put(url, obj)
         return obj
 
+    def _lookup(self, url: str) -> Any:
+        try:
+            return self._resolver.lookup(url).contents
+        except referencing.exceptions.Unresolvable as exc:
+            # a missing file of the spec is a problem of the spec and not of the resolver
+            if isinstance(exc.__cause__, referencing.exceptions.Unretrievable) and isinstance(
+                exc.__cause__.__cause__, DltSpecFileNotFoundException
+            ):
+                raise exc.__cause__.__cause__ from None
+            # other files can't be loaded without spec files, e.g. for a downloaded spec
+            raise DltSpecFileNotFoundException(url) from exc
+
     def _component_from_reference(self, ref: osp.Reference) -> Dict[str, Any]:
         url = ref.ref
         return self._component_from_reference_url(url)
@@ -55,6 +164,8 @@ class OpenapiContext:
                 # Refs to random places in the spec, e.g. #/paths/some~path/responses/.../schema
                 # don't generate useful names, so only take names from #/components/schemas/SchemaName refs
                 name = ref.ref.split("/components/")[-1].split("/")[-1]
+            elif not ref.ref.startswith("#"):
+                name = name_from_external_ref(ref.ref)
             else:
                 name = ""
         schema = self.schema_from_reference(ref)
@@ -64,14 +175,33 @@ class OpenapiContext:
     def response_from_reference(self, ref: Union[osp.Reference, osp.Response]) -> osp.Response:
         if isinstance(ref, osp.Response):
             return ref
-        return osp.Response.parse_obj(self._component_from_reference(ref))
+        return self._parsed_component_from_reference(osp.Response, ref)
 
     def schema_from_reference(self, ref: Union[osp.Reference, osp.Schema]) -> osp.Schema:
         if isinstance(ref, osp.Schema):
             return ref
-        return osp.Schema.parse_obj(self._component_from_reference(ref))
+        return self._parsed_component_from_reference(osp.Schema, ref)
 
     def parameter_from_reference(self, ref: Union[osp.Reference, osp.Parameter]) -> osp.Parameter:
         if isinstance(ref, osp.Parameter):
             return ref
-        return osp.Parameter.parse_obj(self._component_from_reference(ref))
+        return self._parsed_component_from_reference(osp.Parameter, ref)
+
+    def path_item_from_reference(self, path_item: osp.PathItem) -> osp.PathItem:
+        """Resolve a path item that is a ref to a path item in another place, e.g. another file"""
+        if not path_item.ref:
+            return path_item
+        return self._parsed_component_from_reference(osp.PathItem, osp.Reference(ref=path_item.ref))
+
+    def _parsed_component_from_reference(self, model: Type[TComponent], ref: osp.Reference) -> TComponent:
+        key = (model.__name__, ref.ref)
+        parsed = self._parsed_component_cache.get(key)
+        if parsed is None:
+            parsed = model.parse_obj(self._component_from_reference(ref))
+            self._parsed_component_cache.put(key, parsed)
+        return parsed
+
+    @property
+    def component_cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Size, hits and misses of the caches of resolved and parsed components"""
+        return {"resolved": self._component_cache.stats(), "parsed": self._parsed_component_cache.stats()}
@@ -0,0 +1,77 @@
+"""
+A cheap index of the endpoints in a spec, built from the raw document without validating or expanding any schemas
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from dlt_init_openapi.utils import paths
+
+
+@dataclass
+class IndexedEndpoint:
+    method: str
+    path: str
+    operation_id: Optional[str]
+    summary: Optional[str]
+
+
+@dataclass
+class EndpointIndex:
+    endpoints: List[IndexedEndpoint]
+    paths: List[str]
+    """Paths with included endpoints in spec order, paths defined in other files are included as well"""
+
+    @classmethod
+    def from_spec_raw(cls, spec_raw: Dict[str, Any], include_methods: Iterable[str]) -> "EndpointIndex":
+        endpoints: List[IndexedEndpoint] = []
+        paths: List[str] = []
+        for path, path_item in (spec_raw.get("paths") or {}).items():
+            if not isinstance(path_item, dict):
+                continue
+            if "$ref" in path_item or any(isinstance(path_item.get(m), dict) for m in include_methods):
+                paths.append(path)
+            for method in include_methods:
+                if not isinstance(operation := path_item.get(method), dict):
+                    continue
+                endpoints.append(
+                    IndexedEndpoint(
+                        method=method.upper(),
+                        path=path,
+                        operation_id=operation.get("operationId"),
+                        summary=operation.get("summary") or path_item.get("summary"),
+                    )
+                )
+        return cls(endpoints=endpoints, paths=paths)
+
+    def matching(self, patterns: List[str]) -> "EndpointIndex":
+        """Index of the paths matching any of the regex patterns"""
+        return EndpointIndex(
+            endpoints=[e for e in self.endpoints if path_matches(e.path, patterns)],
+            paths=[path for path in self.paths if path_matches(path, patterns)],
+        )
+
+    def select_paths(self, patterns: List[str]) -> Set[str]:
+        """Get paths matching any of the regex patterns together with the paths of their possible parents.
+        Parents are needed to detect transformers, so all indexed paths that are a prefix of a selected path
+        are included, also if they only match after singularizing e.g. /pokemons -> /pokemon/{id}
+        """
+        all_paths = self.paths
+        selected = {path for path in all_paths if path_matches(path, patterns)}
+
+        prefixes: Set[Tuple[str, ...]] = set()
+        for path in selected:
+            for parts in _path_keys(path):
+                prefixes.update(parts[:i] for i in range(1, len(parts)))
+
+        return selected | {path for path in all_paths if any(parts in prefixes for parts in _path_keys(path))}
+
+
+def path_matches(path: str, patterns: Iterable[str]) -> bool:
+    return any(re.search(p, path) for p in patterns)
+
+
+def _path_keys(path: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    parsed_path = paths.ParsedPath.from_path(path)
+    return parsed_path.parts, parsed_path.singularized_parts
@@ -7,15 +7,18 @@ import openapi_schema_pydantic as osp
 from loguru import logger
 
 from dlt_init_openapi.parser.context import OpenapiContext
-from dlt_init_openapi.parser.models import DataPropertyPath, SchemaWrapper
+from dlt_init_openapi.parser.endpoint_index import EndpointIndex, path_matches
+from dlt_init_openapi.parser.models import DataPropertyPath, SchemaWrapper, iter_schema_graph
 from dlt_init_openapi.parser.pagination import Pagination
 from dlt_init_openapi.parser.parameters import Parameter
-from dlt_init_openapi.utils.paths import get_path_var_names, path_looks_like_list
+from dlt_init_openapi.utils.paths import ParsedPath
+from dlt_init_openapi.utils.slots import add_slots
 
 TMethod = Literal["GET", "POST", "PUT", "PATCH"]
 
 
-@dataclass
+@add_slots
+@dataclass(frozen=True)
 class TransformerSetting:
     path_parameter_name: str
     parent_property: DataPropertyPath
@@ -25,17 +28,54 @@ class TransformerSetting:
         return {self.path_parameter_name: self.parent_property.json_path}
 
 
+@add_slots
 @dataclass
 class Response:
     osp_response: osp.Response
-    schema: Optional[SchemaWrapper]
+    context: OpenapiContext
     status_code: str
     description: str
+    osp_schema: Optional[Union[osp.Reference, osp.Schema]] = None
+    """Schema of the json content, only expanded into a wrapper when the response is used"""
     # detected values
     detected_payload: Optional[DataPropertyPath] = None
     detected_primary_key: Optional[str] = None
 
+    _content_schema: Optional[SchemaWrapper] = field(default=None, init=False)
+    _schema: Optional[SchemaWrapper] = field(default=None, init=False)
+
+    @property
+    def content_schema(self) -> Optional[SchemaWrapper]:
+        """Schema of the json content"""
+        return self.expand_content_schema()
+
+    def expand_content_schema(self) -> Optional[SchemaWrapper]:
+        """Build the schema of the json content on first use, the context of the response is needed for that"""
+        if self._content_schema is None and self.osp_schema is not None:
+            self._content_schema = SchemaWrapper.from_reference(self.osp_schema, self.context)
+        return self._content_schema
 
+    @property
+    def schema(self) -> Optional[SchemaWrapper]:
+        """Schema the payload is in, the content schema unless a detector replaced it with a nested one"""
+        return self._schema if self._schema is not None else self.content_schema
+
+    @schema.setter
+    def schema(self, schema: Optional[SchemaWrapper]) -> None:
+        self._schema = schema
+
+    @property
+    def expanded_schemas(self) -> List[SchemaWrapper]:
+        """Schemas of this response that were expanded so far"""
+        return [s for s in (self._content_schema, self._schema) if s is not None]
+
+    def compact(self) -> None:
+        self.osp_response = None
+        self.osp_schema = None
+        self.context = None
+
+
+@add_slots
 @dataclass()
 class Endpoint:
     osp_operation: osp.Operation
@@ -64,11 +104,20 @@ class Endpoint:
     detected_children: List["Endpoint"] = field(default_factory=list)
     detected_transformer_settings: Optional[TransformerSetting] = None
 
+    _parsed_path: Optional[ParsedPath] = field(default=None, init=False)
+
     @property
     def id(self) -> str:
         """unique identifier"""
         return self.operation_id
 
+    @property
+    def parsed_path(self) -> ParsedPath:
+        """The path split into its parts"""
+        if self._parsed_path is None:
+            self._parsed_path = ParsedPath.from_path(self.path)
+        return self._parsed_path
+
     @property
     def payload(self) -> Optional[DataPropertyPath]:
         """gets payload dataproperty path if detected"""
@@ -77,7 +126,7 @@ class Endpoint:
     @property
     def is_list(self) -> bool:
         """if we know the payload, we can discover from there, if not assume list if last path part is not arg"""
-        return self.payload.is_list if self.payload else path_looks_like_list(self.path)
+        return self.payload.is_list if self.payload else self.parsed_path.looks_like_list
 
     @property
     def parent(self) -> Optional["Endpoint"]:
@@ -118,7 +167,7 @@ class Endpoint:
     @property
     def unresolvable_path_param_names(self) -> List[str]:
         """returns a list of path param names with params that are resolvable via the parent excluded"""
-        params = get_path_var_names(self.path)
+        params = self.parsed_path.var_names
         transformer_param = self.transformer.path_parameter_name if self.transformer else None
         return [p for p in params if p != transformer_param]
 
@@ -182,18 +231,19 @@ class Endpoint:
         for status_code, response_ref in osp_operation.responses.items() or []:
             # find json content schema
             response_schema = context.response_from_reference(response_ref)
-            content_schema: Optional[SchemaWrapper] = None
+            content_schema: Optional[Union[osp.Reference, osp.Schema]] = None
             for content_type, media_type in (response_schema.content or {}).items():
                 if (content_type.endswith("json") or content_type == "*/*") and media_type.media_type_schema:
-                    content_schema = SchemaWrapper.from_reference(media_type.media_type_schema, context)
+                    content_schema = media_type.media_type_schema
                     break
 
             responses.append(
                 Response(
                     osp_response=response_schema,
-                    schema=content_schema,
+                    context=context,
                     status_code=status_code,
                     description=response_schema.description,
+                    osp_schema=content_schema,
                 )
             )
 
@@ -233,6 +283,25 @@ class EndpointCollection:
         """Endpoints by path"""
         return {ep.id: ep for ep in self.endpoints}
 
+    def compact(self) -> None:
+        """Release the openapi models of all endpoints, their parameters and schemas, see Project.compact"""
+        roots: List[SchemaWrapper] = []
+        for endpoint in self.endpoints:
+            endpoint.osp_operation = None
+            for response in endpoint.responses:
+                # responses that were never used stay unexpanded
+                roots.extend(response.expanded_schemas)
+                response.compact()
+                if response.detected_payload:
+                    roots.append(response.detected_payload.prop)
+            for parameter in endpoint.parameters.values():
+                parameter.compact()
+                roots.append(parameter.schema)
+            if endpoint.transformer:
+                roots.append(endpoint.transformer.parent_property.prop)
+        for schema in iter_schema_graph(roots):
+            schema.compact()
+
     def set_ids_to_render(self, ids: Set[str]) -> None:
         selected_ids = set()
         ids_to_render = set()
@@ -251,23 +320,49 @@ class EndpointCollection:
 
     @classmethod
     def from_context(cls, context: OpenapiContext) -> "EndpointCollection":
-        endpoints: list[Endpoint] = []
-        for path, path_item in context.spec.paths.items():
-            for op_name in context.config.include_methods:
-                if not (operation := getattr(path_item, op_name)):
-                    continue
-                logger.info(f"Found endpoint {op_name.upper()} {path}")
-                endpoints.append(
-                    Endpoint.from_operation(
-                        method=cast(TMethod, op_name.upper()),
-                        path=path,
-                        osp_operation=operation,
-                        path_level_parameters=[
-                            Parameter.from_reference(param, context) for param in path_item.parameters or []
-                        ],
-                        path_summary=path_item.summary,
-                        path_description=path_item.description,
-                        context=context,
-                    )
+        selected_paths: Optional[Set[str]] = None
+        if context.config.include_paths:
+            index = EndpointIndex.from_spec_raw(context.spec_raw, context.config.include_methods)
+            selected_paths = index.select_paths(context.config.include_paths)
+            logger.info(f"Parsing {len(selected_paths)} of {len(index.paths)} paths selected by include_paths")
+        paths = [path for path in context.spec.paths if selected_paths is None or path in selected_paths]
+        if context.config.jobs > 1 and len(paths) > 1:
+            from dlt_init_openapi.parser.parallel import endpoints_from_paths_in_parallel
+
+            endpoints = endpoints_from_paths_in_parallel(paths, context)
+        else:
+            endpoints = endpoints_from_paths(paths, context)
+        # paths that were only parsed as possible parents are rendered if a selected endpoint needs them
+        ids_to_render = {
+            e.id
+            for e in endpoints
+            if not context.config.include_paths or path_matches(e.path, context.config.include_paths)
+        }
+        return cls(endpoints=endpoints, endpoint_ids_to_render=ids_to_render)
+
+
+def endpoints_from_paths(paths: List[str], context: OpenapiContext) -> List[Endpoint]:
+    """Parse the endpoints of the included methods of the given paths, in order"""
+    endpoints: List[Endpoint] = []
+    for path in paths:
+        path_item = context.path_item_from_reference(context.spec.paths[path])
+        # parameters of the path are shared by all of its operations
+        path_level_parameters: Optional[List[Parameter]] = None
+        for op_name in context.config.include_methods:
+            if not (operation := getattr(path_item, op_name)):
+                continue
+            logger.info(f"Found endpoint {op_name.upper()} {path}")
+            if path_level_parameters is None:
+                path_level_parameters = [Parameter.from_reference(p, context) for p in path_item.parameters or []]
+            endpoints.append(
+                Endpoint.from_operation(
+                    method=cast(TMethod, op_name.upper()),
+                    path=path,
+                    osp_operation=operation,
+                    path_level_parameters=path_level_parameters,
+                    path_summary=path_item.summary,
+                    path_description=path_item.description,
+                    context=context,
                 )
-        return cls(endpoints=endpoints, endpoint_ids_to_render={e.id for e in endpoints})
+            )
+    return endpoints
@@ -0,0 +1,124 @@
+"""
+Loaders that turn the raw bytes of a spec document into python objects
+"""
+
+import json
+import re
+from abc import abstractmethod
+from typing import Any, Dict, List, Literal
+
+import yaml
+from loguru import logger
+
+from dlt_init_openapi.exceptions import DltUnparseableSpecException
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+TSpecFormat = Literal["json", "yaml"]
+
+RE_FIRST_NON_WHITESPACE = re.compile(rb"(?:\xef\xbb\xbf)?\s*(\S)")
+
+
+class SpecLoader:
+    """Parses a document from bytes, subclass and add to `JSON_LOADERS` or `YAML_LOADERS` to plug in a backend"""
+
+    name: str = ""
+
+    @property
+    def available(self) -> bool:
+        """Whether the backend can be used in the current environment"""
+        return True
+
+    @abstractmethod
+    def load(self, data: bytes) -> Any:
+        """Parse data into python objects, raises on invalid documents"""
+
+
+class OrjsonLoader(SpecLoader):
+    """Parses JSON straight from bytes with the optional orjson package"""
+
+    name = "orjson"
+
+    @property
+    def available(self) -> bool:
+        return orjson is not None
+
+    def load(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class JsonLoader(SpecLoader):
+    """Parses JSON with the standard library, bytes are decoded by json itself"""
+
+    name = "json"
+
+    def load(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class CYamlLoader(SpecLoader):
+    """Parses YAML with the libyaml C extension, produces the same output as `YamlLoader`"""
+
+    name = "libyaml"
+
+    @property
+    def available(self) -> bool:
+        return bool(getattr(yaml, "__with_libyaml__", False))
+
+    def load(self, data: bytes) -> Any:
+        return yaml.load(data, Loader=yaml.CBaseLoader)
+
+
+class YamlLoader(SpecLoader):
+    """Parses YAML with the pure python loader"""
+
+    name = "pyyaml"
+
+    def load(self, data: bytes) -> Any:
+        return yaml.load(data, Loader=yaml.BaseLoader)
+
+
+# loaders in order of preference, the first available one is used
+JSON_LOADERS: List[SpecLoader] = [OrjsonLoader(), JsonLoader()]
+YAML_LOADERS: List[SpecLoader] = [CYamlLoader(), YamlLoader()]
+
+
+def available_loaders(loaders: List[SpecLoader]) -> List[SpecLoader]:
+    """Get available loaders from given list in order of preference"""
+    return [loader for loader in loaders if loader.available]
+
+
+def sniff_format(data: bytes) -> TSpecFormat:
+    """Guess the format of the document from the first non-whitespace byte"""
+    match = RE_FIRST_NON_WHITESPACE.match(data)
+    if match and match.group(1) in (b"{", b"["):
+        return "json"
+    return "yaml"
+
+
+def load_spec(data: bytes) -> Dict[str, Any]:
+    """Parse spec document, raises DltUnparseableSpecException if this is not possible"""
+    try:
+        if sniff_format(data) == "json":
+            # the fast backends are stricter than the standard library (e.g. NaN, huge ints),
+            # so fall through to the next backend before giving up on JSON
+            for loader in available_loaders(JSON_LOADERS):
+                logger.info(f"Trying to parse spec as JSON with {loader.name}")
+                try:
+                    result = loader.load(data)
+                    logger.success("Parsed spec as JSON")
+                    return result
+                except ValueError:
+                    logger.info("No valid JSON found")
+            # a yaml document may also start with a flow mapping, so try yaml next
+
+        loader = available_loaders(YAML_LOADERS)[0]
+        logger.info(f"Trying to parse spec as YAML with {loader.name}")
+        result = loader.load(data)
+        logger.success("Parsed spec as YAML")
+        return result
+    except Exception as exc:
+        raise DltUnparseableSpecException() from exc
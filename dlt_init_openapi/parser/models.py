@@ -2,24 +2,39 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from itertools import chain
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Literal, Optional, Sequence, Tuple, TypeVar, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 import openapi_schema_pydantic as osp
-from dlt.common.utils import digest128
 
 from dlt_init_openapi.parser.types import DataType, TOpenApiType
-from dlt_init_openapi.utils.misc import unique_list
+from dlt_init_openapi.utils.misc import normalize_name, unique_list
+from dlt_init_openapi.utils.slots import add_slots
 
 if TYPE_CHECKING:
-    from dlt_init_openapi.parser.context import OpenapiContext
-
-from .const import MAX_RECURSION_DEPTH
+    from dlt_init_openapi.parser.context import OpenapiContext, TSchemaWrapperKey
 
 TSchemaType = Literal["boolean", "object", "array", "number", "string", "integer"]
 
 
-@dataclass
+@add_slots
+@dataclass(frozen=True)
 class DataPropertyPath:
     """Describes a json path to a property"""
 
@@ -50,9 +65,13 @@ class DataPropertyPath:
         return f"DataPropertyPath {self.path}: {self.prop.name}"
 
 
-@dataclass
+@add_slots
+@dataclass(eq=False, repr=False, frozen=True)
 class SchemaWrapper:
-    """Wraps an openapi Schema to add useful attributes and methods"""
+    """Wraps an openapi Schema to add useful attributes and methods.
+    Wrappers form a graph that may contain cycles, so they compare by identity. They are frozen once built,
+    so the property maps and nested properties derived from them are computed once and cached.
+    """
 
     osp_schema: osp.Schema
     ref: Optional[osp.Reference]
@@ -63,16 +82,13 @@ class SchemaWrapper:
     description: Optional[str]
     """Description from schema ref or schema.description property"""
 
-    properties: List["Property"]
+    properties: Tuple["Property", ...]
 
     types: List[TSchemaType]
     nullable: bool
     default: Optional[Any]
     """Default value of the schema (optional)"""
 
-    nested_properties: NestedProperties
-    hash_key: str
-
     type_format: Optional[str] = None
     """Format (e.g. datetime, uuid) as an extension of the data type"""
 
@@ -80,24 +96,32 @@ class SchemaWrapper:
     """Maximum value for number type if applicable"""
 
     array_item: Optional["SchemaWrapper"] = None
-    all_of: List["SchemaWrapper"] = field(default_factory=list)
-    any_of: List["SchemaWrapper"] = field(default_factory=list)
-    one_of: List["SchemaWrapper"] = field(default_factory=list)
+    all_of: Tuple["SchemaWrapper", ...] = ()
+    any_of: Tuple["SchemaWrapper", ...] = ()
+    one_of: Tuple["SchemaWrapper", ...] = ()
 
     enum_values: Optional[List[Any]] = None
-    examples: List[Any] = field(default_factory=list)
+    examples: Tuple[Any, ...] = ()
+
+    _properties_map: Optional[Dict[str, "Property"]] = field(default=None, init=False)
+    _all_properties_map: Optional[Dict[str, "Property"]] = field(default=None, init=False)
+    _normalized_properties_map: Optional[Dict[str, Tuple["Property", ...]]] = field(default=None, init=False)
+    _nested_properties: Optional["NestedProperties"] = field(default=None, init=False)
 
     def __getitem__(self, item: str) -> "Property":
         try:
-            return next(prop for prop in self.properties if prop.name == item)
-        except StopIteration:
+            return self.properties_map[item]
+        except KeyError:
             raise KeyError(f"No property with name {item} in {self.name}")
 
     def __contains__(self, item: str) -> bool:
-        return any(prop.name == item for prop in self.properties)
+        return item in self.properties_map
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.properties_map)
 
-    def __iter__(self) -> Iterable["str"]:
-        return (prop.name for prop in self.properties)
+    def __repr__(self) -> str:
+        return f"SchemaWrapper(name={self.name!r}, types={self.types!r}, ref={self.ref.ref if self.ref else None!r})"
 
     @property
     def has_properties(self) -> bool:
@@ -108,14 +132,35 @@ class SchemaWrapper:
         """All properties of root model and any/oneOf schemas in union"""
         return list(self.all_properties_map.values())
 
+    @property
+    def properties_map(self) -> Dict[str, "Property"]:
+        """Properties of root model by name"""
+        if self._properties_map is None:
+            object.__setattr__(self, "_properties_map", {p.name: p for p in self.properties})
+        return self._properties_map  # type: ignore[return-value]
+
     @property
     def all_properties_map(self) -> Dict[str, "Property"]:
         """All properties of root model and any/oneOf schemas in union"""
-        props = {p.name: p for p in self.properties}
-        for child in self.any_of + self.one_of:
-            for prop in child.all_properties:
-                props[prop.name] = prop
-        return props
+        if self._all_properties_map is None:
+            props = self.properties_map
+            if self.any_of or self.one_of:
+                props = dict(props)
+                for child in self.any_of + self.one_of:
+                    props.update(child.all_properties_map)
+            object.__setattr__(self, "_all_properties_map", props)
+        return self._all_properties_map  # type: ignore[return-value]
+
+    @property
+    def normalized_properties_map(self) -> Dict[str, Tuple["Property", ...]]:
+        """All properties by their name normalized with `normalize_name`, in the order of `all_properties`"""
+        if self._normalized_properties_map is None:
+            props: Dict[str, Tuple["Property", ...]] = {}
+            for prop in self.all_properties_map.values():
+                key = normalize_name(prop.name)
+                props[key] = props.get(key, ()) + (prop,)
+            object.__setattr__(self, "_normalized_properties_map", props)
+        return self._normalized_properties_map  # type: ignore[return-value]
 
     @property
     def is_object(self) -> bool:
@@ -126,7 +171,7 @@ class SchemaWrapper:
         return "array" in self.types
 
     @property
-    def union_schemas(self) -> List["SchemaWrapper"]:
+    def union_schemas(self) -> Tuple["SchemaWrapper", ...]:
         return self.any_of + self.one_of
 
     @property
@@ -137,38 +182,61 @@ class SchemaWrapper:
     def type_hint(self) -> str:
         return DataType.from_schema(self).type_hint
 
-    @classmethod
-    def from_reference_guarded(
-        cls,
-        schema_ref: Union[osp.Schema, osp.Reference],
-        context: "OpenapiContext",
-        parent_properties: Optional[Sequence["Property"]] = None,
-        level: int = 0,
-    ) -> Optional["SchemaWrapper"]:
-        if level >= MAX_RECURSION_DEPTH:
-            return None
-        level += 1
-        return cls.from_reference(schema_ref, context, level=level)
+    @property
+    def nested_properties(self) -> "NestedProperties":
+        """Flattened paths of all properties in the schema tree, discovered on first access.
+        Only a few schemas are ever searched this way, so it's not done for every wrapper up front.
+        """
+        if self._nested_properties is None:
+            nested_properties = NestedProperties()
+            object.__setattr__(self, "_nested_properties", nested_properties)
+            nested_properties.discover_nested_properties(self)
+        return self._nested_properties  # type: ignore[return-value]
+
+    @property
+    def children(self) -> Iterator["SchemaWrapper"]:
+        """Schemas of the properties, the array item and the allOf/oneOf/anyOf members"""
+        yield from (prop.schema for prop in self.properties)
+        if self.array_item:
+            yield self.array_item
+        yield from chain(self.all_of, self.one_of, self.any_of)
+
+    def compact(self) -> None:
+        """Release the openapi schema and the nested properties discovered for detection"""
+        object.__setattr__(self, "osp_schema", None)
+        object.__setattr__(self, "_nested_properties", None)
 
     @classmethod
     def from_reference(
         cls,
         schema_ref: Union[osp.Schema, osp.Reference],
         context: "OpenapiContext",
-        level: int = 0,
         parent_properties: Optional[Sequence["Property"]] = None,
     ) -> "SchemaWrapper":
         """Create a Schema wrapper from openapi Schema or reference.
-        Recursively generates properties and nested allOf/anyOf/oneOf schemas up to max nesting level
+        Recursively generates properties and nested allOf/anyOf/oneOf schemas. Referenced schemas are built
+        once per context and shared, a reference back to a schema that is still being built closes a cycle
+        in the resulting graph instead of being expanded again.
 
         Args:
             schema_ref: The openapi schema or reference (`$ref`) object pointing to a schema
             context: The parser context
-            level: Current recursion level. Used to prevent infinite recursion cycles.
         """
+        # Union members depend on the parent properties and are not shared.
+        cache_key: Optional[TSchemaWrapperKey] = None
+        if isinstance(schema_ref, osp.Reference) and not parent_properties:
+            cache_key = (schema_ref.ref, schema_ref.description)
+            if cached_wrapper := context.schema_wrapper_from_cache(cache_key):
+                return cached_wrapper
+            # register the wrapper before expanding the children, so back references resolve to it.
+            # it is filled in once all children are built
+            wrapper = cls.__new__(cls)
+            context.begin_schema_wrapper(cache_key, wrapper)
+
         name, schema = context.schema_and_name_from_reference(schema_ref)
 
-        all_of = _remove_nones([cls.from_reference_guarded(ref, context, level=level) for ref in schema.allOf or []])
+        # a schema can't be composed of itself, so back references are dropped from allOf/oneOf/anyOf
+        all_of = cls._composed_from(schema.allOf, context)
 
         if not name:
             for sub in all_of:
@@ -180,34 +248,21 @@ class SchemaWrapper:
         property_map.update({prop.name: prop for prop in chain.from_iterable(s.properties for s in all_of)})
         required_props = set(schema.required or [])
 
-        _props_list = _remove_nones(
-            [
-                Property.from_reference_guarded(name, ref, name in required_props, context, level=level)
-                for name, ref in (schema.properties or {}).items()
-            ]
-        )
+        _props_list = [
+            Property.from_reference(name, ref, name in required_props, context)
+            for name, ref in (schema.properties or {}).items()
+        ]
 
         property_map.update({prop.name: prop for prop in _props_list})
 
-        properties = list(property_map.values())
+        properties = tuple(property_map.values())
 
-        one_of = _remove_nones(
-            [
-                cls.from_reference_guarded(ref, context, parent_properties=properties, level=level)
-                for ref in schema.oneOf or []
-            ]
-        )
-
-        any_of = _remove_nones(
-            [
-                cls.from_reference_guarded(ref, context, parent_properties=properties, level=level)
-                for ref in schema.anyOf or []
-            ]
-        )
+        one_of = cls._composed_from(schema.oneOf, context)
+        any_of = cls._composed_from(schema.anyOf, context)
 
         array_item: Optional["SchemaWrapper"] = None
         if schema.items:
-            array_item = cls.from_reference_guarded(schema.items, context, level=level)
+            array_item = cls.from_reference(schema.items, context)
 
         # Single type in OAI 3.0, list of types in 3.1
         # Nullable does not exist in 3.1, instead types: ["string", "null"]
@@ -224,7 +279,7 @@ class SchemaWrapper:
         if "null" in schema_types:
             nullable = True
             schema_types.remove("null")
-        wrapper = cls(
+        fields = dict(
             osp_schema=schema,
             name=name,
             description=schema_ref.description or schema.description,
@@ -237,18 +292,33 @@ class SchemaWrapper:
             nullable=nullable,
             array_item=array_item,
             default=schema.default,
-            nested_properties=NestedProperties(),
-            hash_key=digest128(schema.json(sort_keys=True)),
             type_format=schema.schema_format,
             maximum=schema.maximum,
             enum_values=schema.enum,
-            examples=([schema.example] if schema.example else schema.examples) or [],
+            examples=(schema.example,) if schema.example else tuple(schema.examples or ()),
         )
-        wrapper.nested_properties.discover_nested_properties(wrapper)
+        if cache_key:
+            cls.__init__(wrapper, **fields)  # type: ignore[arg-type]
+            context.end_schema_wrapper(cache_key)
+        else:
+            wrapper = cls(**fields)  # type: ignore[arg-type]
         return wrapper
 
+    @classmethod
+    def _composed_from(
+        cls, refs: Optional[List[Union[osp.Schema, osp.Reference]]], context: "OpenapiContext"
+    ) -> Tuple["SchemaWrapper", ...]:
+        members = []
+        for ref in refs or ():
+            if isinstance(ref, osp.Reference) and context.schema_wrapper_in_progress(key := (ref.ref, ref.description)):
+                context.drop_composed_back_reference(key)
+                continue
+            members.append(cls.from_reference(ref, context))
+        return tuple(members)
+
 
-@dataclass
+@add_slots
+@dataclass(frozen=True)
 class Property:
     name: str
     required: bool
@@ -267,35 +337,43 @@ class Property:
         return DataType.from_property(self).type_hint
 
     @classmethod
-    def from_reference_guarded(
+    def from_reference(
         cls,
         name: str,
         schema_ref: Union[osp.Schema, osp.Reference],
         required: bool,
         context: "OpenapiContext",
-        level: int = 0,
     ) -> "Property":
-        if level >= MAX_RECURSION_DEPTH:
-            return None
-        schema = SchemaWrapper.from_reference_guarded(schema_ref, context, level=level)
+        schema = SchemaWrapper.from_reference(schema_ref, context)
         return cls(name=name, required=required, schema=schema)
 
 
-T = TypeVar("T", bound=Any)
-
-
-def _remove_nones(seq: Iterable[Optional[T]]) -> List[T]:
-    return [x for x in seq if x is not None]
+def iter_schema_graph(roots: Iterable[SchemaWrapper]) -> Iterator[SchemaWrapper]:
+    """Yield every schema reachable from roots once"""
+    seen: Set[int] = set()
+    stack = list(roots)
+    while stack:
+        schema = stack.pop()
+        if id(schema) in seen:
+            continue
+        seen.add(id(schema))
+        yield schema
+        stack.extend(schema.children)
 
 
 class NestedProperties:
     """Creates flattened path: schema mappings of all properties within a schema"""
 
+    __slots__ = ("object_properties", "list_properties", "all_properties", "required_properties", "_optional", "_index")
+
     def __init__(self) -> None:
         self.object_properties: Dict[Tuple[str, ...], SchemaWrapper] = {}
         self.list_properties: Dict[Tuple[str, ...], SchemaWrapper] = {}
         self.all_properties: Dict[Tuple[str, ...], SchemaWrapper] = {}
-        self.required_properties: List[Tuple[str, ...]] = []  # Paths of required properties
+        self.required_properties: Set[Tuple[str, ...]] = set()  # Paths of required properties
+        # whether a path or any of its parents is optional, filled in during discovery
+        self._optional: Dict[Tuple[str, ...], bool] = {}
+        self._index: Optional[_NestedPropertiesIndex] = None
 
     def __getitem__(self, item: Tuple[str, ...]) -> SchemaWrapper:
         return self.all_properties[item]
@@ -317,54 +395,111 @@ class NestedProperties:
 
     def is_optional(self, path: Tuple[str, ...]) -> bool:
         """Check whether the property itself or any of its parents is nullable"""
-        check_path = list(path)
-        while check_path:
-            prop_schema = self.all_properties.get(tuple(check_path))
-            # The property is either listed in required properties in openapi, or the property accepts null as a value
-            if prop_schema and (tuple(check_path) not in self.required_properties or prop_schema.nullable):
-                return True
-            check_path.pop()
-        return False
+        # all parents of a discovered path are discovered, so unknown paths take the value of their closest parent
+        while path and path not in self._optional:
+            path = path[:-1]
+        return self._optional.get(path, False)
 
     def find_property(
-        self, pattern: re.Pattern[str], require_type: Optional[TOpenApiType] = None, allow_unknown_types: bool = True
+        self,
+        pattern: re.Pattern[str],
+        require_type: Optional[TOpenApiType] = None,
+        allow_unknown_types: bool = True,
+        allow_in_lists: bool = True,
     ) -> Optional[DataPropertyPath]:
-        candidates = []
-        unknown_type_candidates = []
-        for path, schema in self.items():
-            if not path or not pattern.match(path[-1]):
+        """Find the least nested property whose name matches pattern. Properties of the required type are
+        preferred over properties without a type. Patterns that match a list of names like `^(next|more)$` are
+        looked up by name in the index, other patterns are matched against all paths from least nested on.
+        """
+        if self._index is None:
+            self._index = _NestedPropertiesIndex(self.all_properties)
+
+        names = literal_alternatives(pattern)
+        paths = self._index.paths if names is None else self._index.named(names)
+        unknown_type_candidate: Optional[DataPropertyPath] = None
+        for path in paths:
+            if not path or (names is None and not pattern.match(path[-1])):
                 continue
-            if require_type:
-                if require_type in schema.types:
-                    candidates.append((path, schema))
-                elif not schema.types and allow_unknown_types:
-                    unknown_type_candidates.append((path, schema))
-            else:
-                candidates.append((path, schema))
-
-        # prefer least nested path
-        candidates.sort(key=lambda item: len(item[0]))
-        unknown_type_candidates.sort(key=lambda item: len(item[0]))
-
-        if candidates:
-            return DataPropertyPath(*candidates[0])
-        elif unknown_type_candidates:
-            return DataPropertyPath(*unknown_type_candidates[0])
-        return None
-
-    def discover_nested_properties(self, schema: SchemaWrapper, path: Tuple[str, ...] = ()) -> None:
-        """Traverse into full property tree and build a map of path to prop for better detection later"""
-        self.all_properties[path] = schema
+            if not allow_in_lists and "[*]" in path:
+                continue
+            schema = self.all_properties[path]
+            if not require_type or require_type in schema.types:
+                return DataPropertyPath(path, schema)
+            if not schema.types and allow_unknown_types and unknown_type_candidate is None:
+                unknown_type_candidate = DataPropertyPath(path, schema)
+        return unknown_type_candidate
+
+    def discover_nested_properties(
+        self, schema: SchemaWrapper, path: Tuple[str, ...] = (), _ancestors: Optional[Set[int]] = None
+    ) -> None:
+        """Traverse into full property tree and build a map of path to prop for better detection later.
+        Schemas that are already on the current path are back edges of a cycle and are not traversed again.
+        """
+        self._index = None
+        self._add_path(path, schema)
+        ancestors = _ancestors if _ancestors is not None else set()
+        if id(schema) in ancestors:
+            return
+        ancestors.add(id(schema))
         if schema.is_object:
             self.object_properties[path] = schema
             for prop in schema.all_properties:
                 prop_path = path + (prop.name,)
-                self.all_properties[prop_path] = prop.schema
                 if prop.required:
-                    self.required_properties.append(prop_path)
+                    self.required_properties.add(prop_path)
+                self._add_path(prop_path, prop.schema)
                 if prop.is_list or prop.is_object:
-                    self.discover_nested_properties(prop.schema, prop_path)
+                    self.discover_nested_properties(prop.schema, prop_path, ancestors)
         elif schema.is_list and schema.array_item is not None:
             array_item = schema.array_item
             self.list_properties[path] = array_item
-            self.discover_nested_properties(array_item, path + ("[*]",))
+            self.discover_nested_properties(array_item, path + ("[*]",), ancestors)
+        ancestors.remove(id(schema))
+
+    def _add_path(self, path: Tuple[str, ...], schema: SchemaWrapper) -> None:
+        self.all_properties[path] = schema
+        if path:
+            # The property is either listed in required properties in openapi, or the property accepts null as a value
+            self._optional[path] = (
+                self._optional.get(path[:-1], False) or path not in self.required_properties or schema.nullable
+            )
+
+
+class _NestedPropertiesIndex:
+    """Paths of nested properties ordered from least to most nested and grouped by lower cased property name.
+    Paths of the same depth keep their discovery order.
+
+    The groups are not split by type. An index lives as long as one schema and serves a few lookups, the
+    candidates of a name are few, so checking their types costs less than building groups per type.
+    """
+
+    __slots__ = ("paths", "by_name")
+
+    def __init__(self, all_properties: Dict[Tuple[str, ...], SchemaWrapper]) -> None:
+        # sort is stable, so paths of the same depth stay in discovery order
+        self.paths = sorted(all_properties, key=len)
+        self.by_name: Dict[str, List[Tuple[int, Tuple[str, ...]]]] = {}
+        for rank, path in enumerate(self.paths):
+            if path:
+                self.by_name.setdefault(path[-1].lower(), []).append((rank, path))
+
+    def named(self, names: Iterable[str]) -> List[Tuple[str, ...]]:
+        """Paths of properties with any of the lower cased names, least nested first"""
+        ranked = sorted(chain.from_iterable(self.by_name.get(name, ()) for name in names))
+        return [path for _, path in ranked]
+
+
+# alternatives need parentheses, `^next|more$` is `(^next)|(more$)`
+RE_LITERAL_ALTERNATIVES = re.compile(r"^\^(?:(\w+)|\((\w+(?:\|\w+)*)\))\$$")
+
+
+@lru_cache(maxsize=None)
+def literal_alternatives(pattern: re.Pattern[str]) -> Optional[FrozenSet[str]]:
+    """Lower cased names matched by a case insensitive pattern like `^(next|next_url)$`,
+    None if the pattern matches anything else
+    """
+    if not pattern.flags & re.IGNORECASE:
+        return None
+    if not (match := RE_LITERAL_ALTERNATIVES.match(pattern.pattern)):
+        return None
+    return frozenset(name.lower() for name in (match.group(1) or match.group(2)).split("|"))
@@ -1,50 +1,51 @@
-import json
+import re
 import sys
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import openapi_schema_pydantic as osp
-import yaml
 from loguru import logger
-from yaml import BaseLoader
-
-from dlt_init_openapi.exceptions import (
-    DltInvalidSpecException,
-    DltNoEndpointsDiscovered,
-    DltOpenAPINot30Exception,
-    DltUnparseableSpecException,
-)
+from pydantic import ValidationError
+
+from dlt_init_openapi.exceptions import DltInvalidSpecException, DltNoEndpointsDiscovered, DltOpenAPINot30Exception
 from dlt_init_openapi.parser.config import Config
 from dlt_init_openapi.parser.context import OpenapiContext
+from dlt_init_openapi.parser.endpoint_index import EndpointIndex
 from dlt_init_openapi.parser.endpoints import EndpointCollection
 from dlt_init_openapi.parser.info import OpenApiInfo
+from dlt_init_openapi.parser.loader import load_spec
 from dlt_init_openapi.parser.pagination import Pagination
+from dlt_init_openapi.parser.prune import prune_spec
 from dlt_init_openapi.parser.security import SecurityScheme
+from dlt_init_openapi.parser.spec_cache import SpecCache
+from dlt_init_openapi.parser.spec_files import SpecFiles, absolutize_refs, open_spec_files
+from dlt_init_openapi.parser.validation import validate_spec_per_path
 
 
 class OpenapiParser:
     info: OpenApiInfo
     context: OpenapiContext = None
+    spec_raw: Dict[str, Any] = None
     endpoints: EndpointCollection = None
     security_schemes: Dict[str, SecurityScheme] = {}
+    spec_files: Optional[SpecFiles] = None
 
     global_security_name: str = None
 
     detected_global_security_scheme: SecurityScheme = None
     detected_global_pagination: Pagination = None
 
-    def __init__(self, config: Config) -> None:
+    def __init__(self, config: Config, spec_files: Optional[SpecFiles] = None) -> None:
         self.config = config
+        # opened from `config.spec_path` when parsing if not passed in, closed by the parser
+        self.spec_files = spec_files
 
     def parse(self, data: bytes) -> None:
 
-        self.spec_raw = self._load_yaml_or_json(data)
         self.security_schemes = {}
-        logger.info("Validating spec structure")
-        try:
-            spec = osp.OpenAPI.parse_obj(self.spec_raw)
-        except Exception as e:
-            raise DltInvalidSpecException() from e
-        logger.success("Spec validation successful")
+        # refs to other files are resolved relative to the spec file
+        if self.spec_files is None and self.config.spec_path:
+            self.spec_files = open_spec_files(self.config.spec_path, self.config.spec_root)
+        spec = self._load_and_validate(data)
 
         if not self.config.allow_openapi_2:
             # check if this is openapi 3.0
@@ -56,8 +57,12 @@ class OpenapiParser:
             if not openapi_version or not openapi_version.startswith("3"):
                 raise DltOpenAPINot30Exception(swagger_detected=False)
 
+        if self.config.path_filter:
+            # selected after the cache lookup, the selection is not part of the cached spec
+            self._select_paths(self.spec_raw)
+
         logger.info("Extracting openapi metadata")
-        self.context = OpenapiContext(self.config, spec, self.spec_raw)
+        self.context = OpenapiContext(self.config, spec, self.spec_raw, self.spec_files)
         self.info = OpenApiInfo.from_context(self.context)
         logger.success("Completed extracting openapi metadata and credentials.")
 
@@ -77,27 +82,94 @@ class OpenapiParser:
         logger.info("Parsing openapi endpoints")
         self.endpoints = EndpointCollection.from_context(self.context)
         logger.success(f"Completed parsing endpoints. {len(self.endpoints.endpoints)} endpoints found.")
+        logger.debug(f"Component cache stats: {self.context.component_cache_stats}")
 
         if len(self.endpoints.endpoints) == 0:
             raise DltNoEndpointsDiscovered(self.config.include_methods)
 
-    def _load_yaml_or_json(self, data: bytes) -> Dict[str, Any]:
-        logger.info("Trying to parse spec as JSON")
-        try:
-            data_size = sys.getsizeof(data)
-            if data_size > 1000000:
-                mb = round(data_size / 1000000)
-                logger.warning(f"Spec is around {mb} mb, so parsing might take a while.")
+    def compact(self) -> None:
+        """Release the raw spec and the openapi models, see Project.compact"""
+        self.spec_raw = None
+        self.close()
+        self.endpoints.compact()
+        self.context.compact()
+
+    def close(self) -> None:
+        """Close the files of the spec, referenced files can't be loaded afterwards"""
+        if self.spec_files:
+            self.spec_files.close()
+            self.spec_files = None
+
+    def _load_and_validate(self, data: bytes) -> osp.OpenAPI:
+        """Load and validate spec, sets spec_raw and returns the validated model"""
+        cache = SpecCache(self.config) if self.config.use_cache else None
+        cache_key = cache.key(data, self.spec_files) if cache else None
+        if cache and (cached := cache.get(cache_key)):
+            logger.success("Loaded validated spec from cache")
+            self.spec_raw, spec = cached
+            return spec
+
+        self.spec_raw = self._load_yaml_or_json(data)
+        if self.spec_files:
+            absolutize_refs(self.spec_raw, self.spec_files.root_uri, self.spec_files.root_uri)
+        if self.config.prune_spec:
+            self.spec_raw = self._prune(self.spec_raw)
+        logger.info("Validating spec structure")
+        if self.config.validate_per_path:
+            spec = self._validate_per_path(self.spec_raw)
+        else:
             try:
-                result = json.loads(data.decode())
-                logger.success("Parsed spec as JSON")
-                return result
-            except ValueError:
-                logger.info("No valid JSON found")
-                pass
-            logger.info("Trying to parse spec as YAML")
-            result = yaml.load(data, Loader=BaseLoader)
-            logger.success("Parsed spec as YAML")
-            return result
-        except Exception as exc:
-            raise DltUnparseableSpecException() from exc
+                spec = osp.OpenAPI.parse_obj(self.spec_raw)
+            except Exception as e:
+                raise DltInvalidSpecException() from e
+        logger.success("Spec validation successful")
+
+        if cache:
+            cache.put(cache_key, self.spec_raw, spec)
+        return spec
+
+    def _validate_per_path(self, spec_raw: Dict[str, Any]) -> osp.OpenAPI:
+        """Validate path by path, invalid paths fail the validation only if they are included"""
+        try:
+            result = validate_spec_per_path(spec_raw, self.config.jobs)
+        except ValidationError as e:
+            raise DltInvalidSpecException() from e
+        if not result.errors:
+            return result.spec
+        index = EndpointIndex.from_spec_raw(spec_raw, self.config.include_methods)
+        included = index.select_paths(self.config.include_paths) if self.config.include_paths else set(index.paths)
+        if included_errors := {path: error for path, error in result.errors.items() if path in included}:
+            raise DltInvalidSpecException(included_errors)
+        for path, error in result.errors.items():
+            logger.warning(f"Skipping invalid path {path}, it is not included: {error}")
+        return result.spec
+
+    def _select_paths(self, spec_raw: Dict[str, Any]) -> None:
+        """Let the path filter select from an index of the included paths, the selected paths are included"""
+        if not isinstance(spec_raw, dict) or not isinstance(spec_raw.get("paths") or {}, dict):
+            # validation reports it
+            return
+        index = EndpointIndex.from_spec_raw(spec_raw, self.config.include_methods)
+        if self.config.include_paths:
+            index = index.matching(self.config.include_paths)
+        selected_paths = self.config.path_filter(index)
+        if not selected_paths:
+            logger.warning("You have not selected any paths, all paths will be parsed.")
+            return
+        self.config.include_paths = [f"^{re.escape(path)}$" for path in index.paths if path in selected_paths]
+
+    def _prune(self, spec_raw: Dict[str, Any]) -> Dict[str, Any]:
+        logger.info("Pruning parts of the spec not reachable from included endpoints")
+        result = prune_spec(spec_raw, self.config.include_methods, self.config.include_paths)
+        kb = round(result.pruned_bytes / 1000)
+        logger.success(
+            f"Pruned {result.pruned_operations} operations and {result.pruned_components} components ({kb} kb)"
+        )
+        return result.spec_raw
+
+    def _load_yaml_or_json(self, data: bytes) -> Dict[str, Any]:
+        data_size = sys.getsizeof(data)
+        if data_size > 1000000:
+            mb = round(data_size / 1000000)
+            logger.warning(f"Spec is around {mb} mb, so parsing might take a while.")
+        return load_spec(data)
@@ -0,0 +1,71 @@
+"""
+Parses the paths of a spec in a pool of processes. Every worker builds its own context from the validated spec,
+the endpoints are sent back per chunk of paths and merged in spec order.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from typing import Any, Dict, List, Optional
+
+import openapi_schema_pydantic as osp
+
+from dlt_init_openapi.parser.config import Config
+from dlt_init_openapi.parser.context import OpenapiContext
+from dlt_init_openapi.parser.endpoints import Endpoint, endpoints_from_paths
+from dlt_init_openapi.parser.spec_files import open_spec_files
+
+# chunks per worker, more chunks balance the load better but share less schemas per chunk
+CHUNKS_PER_JOB = 4
+
+_worker_context: Optional[OpenapiContext] = None
+
+
+def endpoints_from_paths_in_parallel(
+    paths: List[str], context: OpenapiContext, mp_context: Optional[BaseContext] = None
+) -> List[Endpoint]:
+    """Parse the endpoints of paths in `config.jobs` processes. The result is in the same order as
+    a serial run. Schemas are shared within a chunk of paths only, the endpoints are attached to `context`.
+    """
+    jobs = context.config.jobs
+    chunk_size = max(1, -(-len(paths) // (jobs * CHUNKS_PER_JOB)))
+    bounds = range(0, len(paths) + chunk_size, chunk_size)
+    chunks = [paths[start:stop] for start, stop in zip(bounds, bounds[1:])]
+    # the endpoint and path filters are not needed to parse and may not be picklable
+    config = context.config.copy(update={"endpoint_filter": None, "path_filter": None})
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(chunks)),
+        mp_context=mp_context,
+        initializer=_init_worker,
+        initargs=(config, context.spec, context.spec_raw),
+    ) as executor:
+        endpoints = [endpoint for chunk in executor.map(_parse_chunk, chunks) for endpoint in chunk]
+    for endpoint in endpoints:
+        endpoint.context = context
+        for response in endpoint.responses:
+            response.context = context
+    return endpoints
+
+
+def worker_context(config: Config, spec: osp.OpenAPI, spec_raw: Dict[str, Any]) -> OpenapiContext:
+    """Context for a pool worker. A context can't be sent to a worker, its resolver can't be pickled"""
+    # files of the spec are opened again, open archives can't be shared between processes
+    spec_files = open_spec_files(config.spec_path, config.spec_root) if config.spec_path else None
+    return OpenapiContext(config, spec, spec_raw, spec_files)
+
+
+def _init_worker(config: Config, spec: osp.OpenAPI, spec_raw: Dict[str, Any]) -> None:
+    global _worker_context
+    _worker_context = worker_context(config, spec, spec_raw)
+
+
+def _parse_chunk(paths: List[str]) -> List[Endpoint]:
+    endpoints = endpoints_from_paths(paths, _worker_context)
+    # the main process attaches its own context
+    for endpoint in endpoints:
+        endpoint.context = None
+        for response in endpoint.responses:
+            # success responses are the ones detected as data responses, so they are expanded here
+            if response.status_code == "default" or response.status_code.startswith("2"):
+                response.expand_content_schema()
+            response.context = None
+    return endpoints
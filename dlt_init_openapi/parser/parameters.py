@@ -3,14 +3,16 @@ from typing import Any, List, Literal, Optional, Union, cast
 
 import openapi_schema_pydantic as osp
 
-from dlt_init_openapi.parser.context import OpenapiContext
+from dlt_init_openapi.parser.context import OpenapiContext, TParameterKey
 from dlt_init_openapi.parser.models import DataPropertyPath, SchemaWrapper, TSchemaType
 from dlt_init_openapi.parser.types import compare_openapi_types
+from dlt_init_openapi.utils.slots import add_slots
 
 TParamIn = Literal["query", "header", "path", "cookie"]
 
 
-@dataclass
+@add_slots
+@dataclass(frozen=True)
 class Parameter:
     name: str
     description: Optional[str]
@@ -40,6 +42,9 @@ class Parameter:
     def maximum(self) -> Optional[float]:
         return self.schema.maximum
 
+    def compact(self) -> None:
+        object.__setattr__(self, "osp_parameter", None)
+
     def _matches_type(self, schema: SchemaWrapper) -> bool:
         return compare_openapi_types(self.types, self.type_format, schema.types, schema.type_format)
 
@@ -60,6 +65,14 @@ class Parameter:
 
     @classmethod
     def from_reference(cls, param_ref: Union[osp.Reference, osp.Parameter], context: OpenapiContext) -> "Parameter":
+        """Create a parameter from an openapi parameter or reference. Referenced parameters are built once
+        per context and shared by all operations using them.
+        """
+        cache_key: Optional[TParameterKey] = None
+        if isinstance(param_ref, osp.Reference):
+            cache_key = (param_ref.ref, param_ref.description)
+            if cached_parameter := context.parameter_from_cache(cache_key):
+                return cached_parameter
         osp_parameter = context.parameter_from_reference(param_ref)
 
         # if there is no schema attached, fall back to string
@@ -71,7 +84,7 @@ class Parameter:
         location = osp_parameter.param_in
         required = osp_parameter.required
 
-        return cls(
+        parameter = cls(
             name=osp_parameter.name,
             description=description,
             osp_parameter=osp_parameter,
@@ -80,3 +93,6 @@ class Parameter:
             required=required,
             style=osp_parameter.style,
         )
+        if cache_key:
+            context.cache_parameter(cache_key, parameter)
+        return parameter
@@ -0,0 +1,58 @@
+"""
+Index of the JSON pointers of a spec so local refs resolve with a dict lookup
+"""
+
+from typing import Any, Dict, Iterable, Optional
+from urllib.parse import unquote
+
+
+class JsonPointerIndex:
+    """Maps `#/...` pointers to the nodes of a document.
+
+    The entries below the given roots, e.g. `#/components/schemas/Pet`, are indexed in one pass up front,
+    as this is where almost all refs point to. Other pointers like `#/paths/...` or pointers into an entry
+    are resolved on first use and then added to the index.
+    """
+
+    def __init__(self, document: Dict[str, Any], roots: Iterable[str] = ("components",)) -> None:
+        self.document = document
+        self._nodes: Dict[str, Any] = {}
+        for root in roots:
+            if not isinstance(sections := document.get(root), dict):
+                continue
+            for section_name, section in sections.items():
+                if not isinstance(section, dict):
+                    continue
+                prefix = f"#/{escape(root)}/{escape(section_name)}/"
+                for name, node in section.items():
+                    self._nodes[prefix + escape(str(name))] = node
+
+    def lookup(self, ref: str) -> Optional[Any]:
+        """Get the node a local ref points to, returns None if it can't be resolved"""
+        if (node := self._nodes.get(ref)) is not None:
+            return node
+        if not ref.startswith("#/"):
+            return None
+        node = self.document
+        for part in ref[2:].split("/"):
+            part = unescape(unquote(part))
+            if isinstance(node, dict) and part in node:
+                node = node[part]
+            elif isinstance(node, list) and part.isdigit() and int(part) < len(node):
+                node = node[int(part)]
+            else:
+                return None
+        if isinstance(node, (dict, list)):
+            self._nodes[ref] = node
+        return node
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+
+def escape(part: str) -> str:
+    return part.replace("~", "~0").replace("/", "~1")
+
+
+def unescape(part: str) -> str:
+    return part.replace("~1", "/").replace("~0", "~")
@@ -0,0 +1,139 @@
+"""
+Drops the parts of a raw spec that no included endpoint can reach, so only what is used gets validated and parsed
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import unquote
+
+from dlt_init_openapi.parser.endpoint_index import EndpointIndex
+from dlt_init_openapi.parser.pointer_index import unescape
+
+HTTP_METHODS = {"get", "put", "post", "delete", "options", "head", "patch", "trace"}
+
+# sections that are looked up by name and not by $ref
+KEEP_COMPONENT_SECTIONS = {"securitySchemes"}
+
+
+@dataclass
+class PruneResult:
+    spec_raw: Dict[str, Any]
+    pruned_operations: int = 0
+    pruned_components: int = 0
+    pruned_bytes: int = 0
+
+
+def prune_spec(
+    spec_raw: Dict[str, Any], include_methods: List[str], include_paths: Optional[List[str]] = None
+) -> PruneResult:
+    """Keep operations of the included methods and paths and everything they reference via `$ref`.
+    Webhooks and unreferenced components are dropped, all other top level sections are kept as they are.
+    The spec passed in is not modified. Documents that are not a mapping or have no mapping of paths or components
+    are returned as they are, validation reports them.
+    """
+    if not isinstance(spec_raw, dict):
+        return PruneResult(spec_raw=spec_raw)
+    paths: Dict[str, Any] = spec_raw.get("paths") or {}
+    components: Dict[str, Any] = spec_raw.get("components") or {}
+    if not isinstance(paths, dict) or not isinstance(components, dict):
+        return PruneResult(spec_raw=spec_raw)
+    selected_paths = (
+        EndpointIndex.from_spec_raw(spec_raw, include_methods).select_paths(include_paths) if include_paths else None
+    )
+
+    # included operations are the roots of the reachable graph
+    kept_paths: Dict[str, Dict[str, Any]] = {}
+    for path, path_item in paths.items():
+        if not isinstance(path_item, dict) or (selected_paths is not None and path not in selected_paths):
+            continue
+        kept_item = {k: v for k, v in path_item.items() if k not in HTTP_METHODS or k in include_methods}
+        if "$ref" in kept_item or any(m in kept_item for m in include_methods):
+            kept_paths[path] = kept_item
+
+    kept_components: Dict[str, Dict[str, Any]] = {
+        section: items for section, items in components.items() if section in KEEP_COMPONENT_SECTIONS
+    }
+    stack: List[Any] = list(kept_paths.values())
+    seen_refs = set()
+    has_external_refs = False
+    while stack:
+        for ref in iter_refs(stack.pop()):
+            if ref in seen_refs:
+                continue
+            seen_refs.add(ref)
+            if not ref.startswith("#/"):
+                has_external_refs = True
+                continue
+            parts = _pointer_parts(ref)
+            if len(parts) >= 3 and parts[0] == "components":
+                section, name = parts[1], parts[2]
+                section_items = kept_components.setdefault(section, {})
+                target = (components.get(section) or {}).get(name)
+                if target is not None and name not in section_items:
+                    section_items[name] = target
+                    stack.append(target)
+            elif len(parts) >= 2 and parts[0] == "paths" and isinstance(path_item := paths.get(parts[1]), dict):
+                # refs into other operations keep the whole operation, so the kept part is still a valid document
+                kept_item = kept_paths.setdefault(
+                    parts[1], {k: v for k, v in path_item.items() if k not in HTTP_METHODS}
+                )
+                methods = [parts[2]] if len(parts) >= 3 and parts[2] in HTTP_METHODS else HTTP_METHODS
+                for method in methods:
+                    if method in path_item and method not in kept_item:
+                        kept_item[method] = path_item[method]
+                        stack.append(path_item[method])
+
+    # other files may refer back to any component of this document
+    if has_external_refs:
+        kept_components = components
+
+    result = PruneResult(spec_raw={k: v for k, v in spec_raw.items() if k != "webhooks"})
+    if "paths" in spec_raw:
+        result.spec_raw["paths"] = {path: kept_paths[path] for path in paths if path in kept_paths}
+    if "components" in spec_raw:
+        result.spec_raw["components"] = {section: kept_components.get(section, {}) for section in components}
+
+    dropped: List[Any] = [spec_raw["webhooks"]] if "webhooks" in spec_raw else []
+    for path, path_item in paths.items():
+        if not isinstance(path_item, dict):
+            continue
+        kept_item = kept_paths.get(path, {})
+        for method in HTTP_METHODS:
+            if method in path_item and method not in kept_item:
+                result.pruned_operations += 1
+                dropped.append(path_item[method])
+    for section, items in components.items():
+        if not isinstance(items, dict) or section in KEEP_COMPONENT_SECTIONS:
+            continue
+        kept_section = kept_components.get(section) or {}
+        for name, item in items.items():
+            if name not in kept_section:
+                result.pruned_components += 1
+                dropped.append(item)
+    result.pruned_bytes = sum(len(json.dumps(item, default=str)) for item in dropped)
+    return result
+
+
+def iter_refs(obj: Any) -> Iterator[str]:
+    """Yield all refs in obj, including discriminator mappings"""
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            ref = current.get("$ref")
+            if isinstance(ref, str):
+                yield ref
+            discriminator = current.get("discriminator")
+            if isinstance(discriminator, dict) and isinstance(mapping := discriminator.get("mapping"), dict):
+                for target in mapping.values():
+                    if isinstance(target, str):
+                        # plain names refer to schemas
+                        yield target if "#" in target or "/" in target else f"#/components/schemas/{target}"
+            stack.extend(current.values())
+        elif isinstance(current, list):
+            stack.extend(current)
+
+
+def _pointer_parts(ref: str) -> Tuple[str, ...]:
+    return tuple(unescape(unquote(p)) for p in ref[2:].split("/"))
@@ -0,0 +1,67 @@
+"""
+Structural hash of openapi schemas, computed bottom up so every node of a schema tree is serialized once
+"""
+
+import json
+from typing import Any, Dict, Iterator
+
+import openapi_schema_pydantic as osp
+from dlt.common.utils import digest128
+
+# fields of a schema that hold other schemas
+SCHEMA_FIELDS = {
+    name
+    for name, field in osp.Schema.__fields__.items()
+    if "Schema" in str(field.outer_type_) or "Reference" in str(field.outer_type_)
+}
+
+
+def schema_hash(schema: osp.Schema) -> str:
+    """Hash of the schema and all of its inline sub schemas. Referenced schemas contribute their ref only.
+
+    Sub schemas are hashed first, without recursion, so deeply nested schemas don't exhaust the stack.
+    """
+    hashes: Dict[int, str] = {}
+    stack = [(schema, False)]
+    while stack:
+        node, children_done = stack.pop()
+        if children_done:
+            hashes[id(node)] = _node_hash(node, hashes)
+        elif id(node) not in hashes:
+            stack.append((node, True))
+            stack.extend((child, False) for child in _sub_schemas(node))
+    return hashes[id(schema)]
+
+
+def _node_hash(schema: osp.Schema, hashes: Dict[int, str]) -> str:
+    own = schema.json(sort_keys=True, exclude=SCHEMA_FIELDS)
+    children = {
+        name: _child_hash(value, hashes)
+        for name in sorted(SCHEMA_FIELDS)
+        if (value := getattr(schema, name)) is not None
+    }
+    return digest128(own + json.dumps(children, sort_keys=True))
+
+
+def _sub_schemas(schema: osp.Schema) -> Iterator[osp.Schema]:
+    values = [getattr(schema, name) for name in SCHEMA_FIELDS]
+    while values:
+        value = values.pop()
+        if isinstance(value, osp.Schema):
+            yield value
+        elif isinstance(value, list):
+            values.extend(value)
+        elif isinstance(value, dict):
+            values.extend(value.values())
+
+
+def _child_hash(value: Any, hashes: Dict[int, str]) -> Any:
+    if isinstance(value, osp.Schema):
+        return hashes[id(value)]
+    if isinstance(value, osp.Reference):
+        return {"$ref": value.ref}
+    if isinstance(value, list):
+        return [_child_hash(v, hashes) for v in value]
+    if isinstance(value, dict):
+        return {k: _child_hash(v, hashes) for k, v in value.items()}
+    return value
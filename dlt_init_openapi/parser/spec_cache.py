@@ -0,0 +1,76 @@
+import hashlib
+import json
+import pickle
+import zlib
+from importlib.metadata import version
+from typing import Any, Dict, Optional, Tuple
+
+import openapi_schema_pydantic as osp
+from loguru import logger
+
+from dlt_init_openapi.parser.config import Config
+from dlt_init_openapi.parser.spec_files import SpecFiles
+from dlt_init_openapi.utils.disk_cache import DEFAULT_CACHE_DIR, DiskCache
+
+# bump when the layout of cached entries changes
+SPEC_CACHE_FORMAT_VERSION = 1
+
+# config fields that change what gets loaded and validated, they are part of the cache key
+SPEC_CACHE_CONFIG_FIELDS: Tuple[str, ...] = ("prune_spec", "include_methods", "include_paths", "validate_per_path")
+
+# pickled models are only valid for the library versions that created them
+SPEC_CACHE_LIBRARIES = ("openapi-schema-pydantic", "pydantic")
+
+
+class SpecCache:
+    """On disk cache of loaded and validated specs, addressed by the hash of the document and the relevant config"""
+
+    def __init__(self, config: Config) -> None:
+        self.config = config
+        budget_dir = config.cache_dir or DEFAULT_CACHE_DIR
+        # specs and downloads share the size of the cache
+        self.disk_cache = DiskCache(
+            budget_dir / "specs",
+            max_size=config.cache_max_size_mb * 1024 * 1024,
+            suffix=".pickle.z",
+            budget_dir=budget_dir,
+        )
+
+    def key(self, data: bytes, spec_files: Optional[SpecFiles] = None) -> str:
+        """Key of the document data. Refs of a document read from spec_files are relative to its root document,
+        so the name of the root is part of the key, where the files are is not.
+        """
+        key_source: Dict[str, Any] = {
+            "format": SPEC_CACHE_FORMAT_VERSION,
+            "config": {f: getattr(self.config, f) for f in SPEC_CACHE_CONFIG_FIELDS},
+            "libraries": {lib: version(lib) for lib in SPEC_CACHE_LIBRARIES},
+        }
+        if spec_files:
+            key_source["spec_files"] = {"root": spec_files.root}
+        digest = hashlib.sha256(data)
+        digest.update(json.dumps(key_source, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[Dict[str, Any], osp.OpenAPI]]:
+        """Get loaded spec and validated model, returns None on a miss"""
+        stored = self.disk_cache.get(key)
+        if stored is None:
+            return None
+        try:
+            spec_raw, spec = pickle.loads(zlib.decompress(stored))
+        except Exception:
+            logger.warning("Could not read cached spec, removing it from cache")
+            self.disk_cache.remove(key)
+            return None
+        return spec_raw, spec
+
+    def put(self, key: str, spec_raw: Dict[str, Any], spec: osp.OpenAPI) -> None:
+        try:
+            stored = zlib.compress(pickle.dumps((spec_raw, spec), protocol=pickle.HIGHEST_PROTOCOL), level=1)
+            self.disk_cache.put(key, stored)
+        except Exception as exc:
+            # the cache is an optimization only, never fail a run because of it
+            logger.warning(f"Could not write spec to cache: {exc}")
+
+    def clear(self) -> None:
+        self.disk_cache.clear()
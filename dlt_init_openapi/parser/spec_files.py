@@ -0,0 +1,208 @@
+"""
+Specs that are split into several files, read from a directory or an archive. Files are loaded on first reference,
+so they stay open until the spec is parsed and detected.
+"""
+
+import posixpath
+import tarfile
+import zipfile
+from abc import abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import unquote, urljoin, urlsplit
+
+import referencing
+import referencing.jsonschema
+from loguru import logger
+from referencing.exceptions import NoSuchResource
+
+from dlt_init_openapi.exceptions import DltSpecFileNotFoundException
+from dlt_init_openapi.parser.loader import load_spec
+
+# files of a spec are addressed by file uris relative to the root of the directory or archive
+BASE_URI = "file:///"
+
+# names of the root document if a directory or archive contains several specs
+ROOT_DOCUMENT_NAMES = ["openapi", "swagger", "spec", "api", "index"]
+SPEC_FILE_SUFFIXES = [".yaml", ".yml", ".json"]
+
+ARCHIVE_SUFFIXES = [".zip", ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz"]
+
+
+class SpecFiles:
+    """Files of a spec, read by their path relative to the root of the spec. Close them when done, they can be
+    used as a context manager.
+    """
+
+    # directory or archive the files are read from
+    path: Path
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+        self._documents: Dict[str, Any] = {}
+
+    @property
+    def root_uri(self) -> str:
+        return BASE_URI + self.root
+
+    @abstractmethod
+    def names(self) -> List[str]:
+        """Paths of all files relative to the root of the spec"""
+
+    @abstractmethod
+    def read(self, name: str) -> bytes:
+        """Read the file at a path relative to the root of the spec"""
+
+    def close(self) -> None:
+        """Release the files, referenced files can't be loaded afterwards"""
+
+    def __enter__(self) -> "SpecFiles":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def load(self, uri: str) -> Any:
+        """Load and parse the file behind an absolute uri, each file is read only once"""
+        if uri in self._documents:
+            return self._documents[uri]
+        name = _name_from_uri(uri)
+        logger.info(f"Loading referenced spec file {name}")
+        try:
+            data = self.read(name)
+        except (OSError, KeyError) as exc:
+            raise DltSpecFileNotFoundException(name) from exc
+        document = load_spec(data)
+        absolutize_refs(document, uri, self.root_uri)
+        self._documents[uri] = document
+        return document
+
+    def retrieve(self, uri: str) -> referencing.Resource:  # type: ignore[type-arg]
+        """Retrieve callback for the referencing registry"""
+        if not uri.startswith(BASE_URI):
+            # remote refs are not supported
+            raise NoSuchResource(ref=uri)  # type: ignore[call-arg]
+        return referencing.Resource(  # type: ignore[call-arg]
+            contents=self.load(uri), specification=referencing.jsonschema.DRAFT202012
+        )
+
+    def find_root(self) -> str:
+        """Find the root document among the files with spec suffixes"""
+        candidates = [n for n in self.names() if any(n.endswith(s) for s in SPEC_FILE_SUFFIXES)]
+        # prefer files in the top most folder
+        candidates.sort(key=lambda n: (n.count("/"), n))
+        for root_name in ROOT_DOCUMENT_NAMES:
+            for name in candidates:
+                if posixpath.splitext(posixpath.basename(name))[0].lower() == root_name:
+                    return name
+        top_level = [n for n in candidates if "/" not in n]
+        if len(top_level) == 1:
+            return top_level[0]
+        raise DltSpecFileNotFoundException("openapi.yaml")
+
+
+class DirectorySpecFiles(SpecFiles):
+    def __init__(self, path: Path, root: Optional[str] = None) -> None:
+        self.path = path
+        super().__init__(root or self.find_root())
+
+    def names(self) -> List[str]:
+        return [p.relative_to(self.path).as_posix() for p in self.path.rglob("*") if p.is_file()]
+
+    def read(self, name: str) -> bytes:
+        return (self.path / name).read_bytes()
+
+
+class ZipSpecFiles(SpecFiles):
+    def __init__(self, path: Path, root: Optional[str] = None) -> None:
+        self.path = path
+        self.archive = zipfile.ZipFile(path)
+        self.members = {_normalize_name(i.filename): i for i in self.archive.infolist() if not i.is_dir()}
+        super().__init__(root or self.find_root())
+
+    def names(self) -> List[str]:
+        return list(self.members)
+
+    def read(self, name: str) -> bytes:
+        return self.archive.read(self.members[name])
+
+    def close(self) -> None:
+        self.archive.close()
+
+
+class TarSpecFiles(SpecFiles):
+    def __init__(self, path: Path, root: Optional[str] = None) -> None:
+        self.path = path
+        self.archive = tarfile.open(path)
+        self.members = {_normalize_name(m.name): m for m in self.archive.getmembers() if m.isfile()}
+        super().__init__(root or self.find_root())
+
+    def names(self) -> List[str]:
+        return list(self.members)
+
+    def read(self, name: str) -> bytes:
+        f = self.archive.extractfile(self.members[name])
+        if f is None:
+            raise KeyError(name)
+        with f:
+            return f.read()
+
+    def close(self) -> None:
+        self.archive.close()
+
+
+def is_archive(path: Path) -> bool:
+    return any(path.name.lower().endswith(s) for s in ARCHIVE_SUFFIXES)
+
+
+def open_spec_files(path: Path, root: Optional[str] = None) -> SpecFiles:
+    """Open the spec at path. Single files are read from their folder, so refs to files next to them resolve."""
+    path = Path(path)
+    if path.is_dir():
+        return DirectorySpecFiles(path, root)
+    if is_archive(path):
+        if zipfile.is_zipfile(path):
+            return ZipSpecFiles(path, root)
+        return TarSpecFiles(path, root)
+    return DirectorySpecFiles(path.parent, path.name)
+
+
+def absolutize_refs(document: Any, base_uri: str, root_uri: str) -> None:
+    """Rewrite all refs in document, loaded from base_uri, to absolute uris in place.
+    Refs to the root document become local refs, so the same component has the same ref in every file.
+    """
+    is_root = base_uri == root_uri
+    stack = [document]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            ref = current.get("$ref")
+            if isinstance(ref, str) and not (is_root and ref.startswith("#")):
+                current["$ref"] = _absolute_ref(ref, base_uri, root_uri)
+            stack.extend(current.values())
+        elif isinstance(current, list):
+            stack.extend(current)
+
+
+def name_from_external_ref(ref: str) -> str:
+    """Name for a schema in another file, last segment of the pointer or the name of the file"""
+    parts = urlsplit(ref)
+    if parts.fragment.strip("/"):
+        return unquote(parts.fragment.rstrip("/").split("/")[-1])
+    return posixpath.splitext(posixpath.basename(unquote(parts.path)))[0]
+
+
+def _absolute_ref(ref: str, base_uri: str, root_uri: str) -> str:
+    absolute = urljoin(base_uri, ref)
+    uri, _, fragment = absolute.partition("#")
+    if uri == root_uri:
+        return "#" + fragment
+    return absolute
+
+
+def _name_from_uri(uri: str) -> str:
+    return _normalize_name(unquote(urlsplit(uri).path))
+
+
+def _normalize_name(name: str) -> str:
+    return posixpath.normpath(name).lstrip("/")
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Dict, List, Literal, Optional
+from typing import TYPE_CHECKING, Dict, List, Literal, Optional, Set
 
 if TYPE_CHECKING:
     from dlt_init_openapi.parser.models import Property, SchemaWrapper
@@ -12,7 +12,9 @@ TOpenApiType = Literal["boolean", "object", "array", "number", "string", "intege
 OATypeToPyType = {"boolean": "bool", "number": "float", "string": "str", "integer": "int"}
 
 
-def schema_to_type_hint(schema: SchemaWrapper, required: bool = True) -> str:
+def schema_to_type_hint(schema: SchemaWrapper, required: bool = True, _seen: Optional[Set[int]] = None) -> str:
+    # arrays of arrays may refer back to themselves, such items are typed as Any
+    seen = (_seen or set()) | {id(schema)}
     types = schema.types
     nullable = schema.nullable or not required
     tpl = "Optional[{}]" if nullable else "{}"
@@ -25,7 +27,8 @@ def schema_to_type_hint(schema: SchemaWrapper, required: bool = True) -> str:
         elif s_type == "object":
             union_types["Dict[str, Any]"] = None
         elif s_type == "array":
-            item_type = schema_to_type_hint(schema.array_item)
+            item = schema.array_item
+            item_type = "Any" if id(item) in seen else schema_to_type_hint(item, _seen=seen)
             py_type = f"List[{item_type}]"
             union_types[py_type] = None
 
@@ -0,0 +1,85 @@
+"""
+Validates a raw spec path by path. Everything but the paths is validated once, path items on their own and
+in a pool of processes if there are several jobs, so a problem in one path does not invalidate the whole spec.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing.context import BaseContext
+from typing import Any, Dict, List, Optional, Tuple
+
+import openapi_schema_pydantic as osp
+from pydantic import ValidationError
+
+from dlt_init_openapi.exceptions import DltInvalidSpecException
+
+# chunks per worker, more chunks balance the load better
+CHUNKS_PER_JOB = 4
+
+_worker_paths: Dict[str, Any] = {}
+
+
+@dataclass
+class PathValidationResult:
+    spec: osp.OpenAPI
+    # validation errors by path, invalid paths are not in the validated spec
+    errors: Dict[str, str] = field(default_factory=dict)
+
+
+def validate_spec_per_path(
+    spec_raw: Dict[str, Any], jobs: int = 1, mp_context: Optional[BaseContext] = None
+) -> PathValidationResult:
+    """Validate spec_raw with each path item validated on its own. Raises `DltInvalidSpecException` if spec_raw
+    or its paths are not a mapping and `ValidationError` if anything outside of the paths is invalid.
+    Path items keep the order of the spec.
+    """
+    if not isinstance(spec_raw, dict):
+        raise DltInvalidSpecException()
+    raw_paths = spec_raw.get("paths")
+    if raw_paths is None:
+        return PathValidationResult(spec=osp.OpenAPI.parse_obj(spec_raw))
+    if not isinstance(raw_paths, dict):
+        raise DltInvalidSpecException()
+    spec = osp.OpenAPI.parse_obj({**spec_raw, "paths": {}})
+    names = list(raw_paths)
+    if jobs > 1 and len(names) > 1:
+        chunk_size = max(1, -(-len(names) // (jobs * CHUNKS_PER_JOB)))
+        bounds = range(0, len(names) + chunk_size, chunk_size)
+        chunks = [names[start:stop] for start, stop in zip(bounds, bounds[1:])]
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(chunks)), mp_context=mp_context, initializer=_init_worker, initargs=(raw_paths,)
+        ) as executor:
+            validated = [item for chunk in executor.map(_validate_chunk, chunks) for item in chunk]
+    else:
+        validated = _validate_path_items(names, raw_paths)
+
+    result = PathValidationResult(spec=spec)
+    paths: Dict[str, osp.PathItem] = {}
+    for name, (path_item, error) in zip(names, validated):
+        if error is not None:
+            result.errors[name] = error
+        else:
+            paths[name] = path_item
+    spec.paths = paths
+    return result
+
+
+def _validate_path_items(
+    names: List[str], raw_paths: Dict[str, Any]
+) -> List[Tuple[Optional[osp.PathItem], Optional[str]]]:
+    validated: List[Tuple[Optional[osp.PathItem], Optional[str]]] = []
+    for name in names:
+        try:
+            validated.append((osp.PathItem.parse_obj(raw_paths[name]), None))
+        except ValidationError as e:
+            validated.append((None, str(e)))
+    return validated
+
+
+def _init_worker(raw_paths: Dict[str, Any]) -> None:
+    global _worker_paths
+    _worker_paths = raw_paths
+
+
+def _validate_chunk(names: List[str]) -> List[Tuple[Optional[osp.PathItem], Optional[str]]]:
+    return _validate_path_items(names, _worker_paths)
@@ -1,7 +1,9 @@
 from typing import TYPE_CHECKING, Callable, Set
 
 if TYPE_CHECKING:
+    from dlt_init_openapi.parser.endpoint_index import EndpointIndex
     from dlt_init_openapi.parser.endpoints import EndpointCollection
 
 
 TEndpointFilter = Callable[["EndpointCollection"], Set[str]]
+TPathFilter = Callable[["EndpointIndex"], Set[str]]
@@ -0,0 +1,97 @@
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator, List, Optional
+
+from dlt.common.configuration.paths import get_dlt_data_dir
+from loguru import logger
+
+DEFAULT_CACHE_DIR = Path(get_dlt_data_dir()) / "openapi_cache"
+
+
+class DiskCache:
+    """A folder of files addressed by key and bounded in total size.
+
+    Entries are evicted least recently used first, reads update the modification time of an entry. Caches with
+    the same `budget_dir` share max_size, entries of all files below it are evicted together.
+    """
+
+    def __init__(self, cache_dir: Path, max_size: int, suffix: str = "", budget_dir: Optional[Path] = None) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.max_size = max_size
+        self.suffix = suffix
+        self.budget_dir = Path(budget_dir) if budget_dir else None
+
+    def path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.suffix}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self.path_for(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        self.touch(key)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        with self.writer(key) as f:
+            f.write(data)
+
+    @contextmanager
+    def writer(self, key: str) -> Iterator[IO[bytes]]:
+        """Open a file to write an entry in chunks, the entry only becomes visible once the block exits"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # write to a temp file first so concurrent readers never see partial entries
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                yield f
+            os.replace(tmp_path, self.path_for(key))
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        self.evict()
+
+    def touch(self, key: str) -> None:
+        try:
+            os.utime(self.path_for(key))
+        except OSError:
+            pass
+
+    def remove(self, key: str) -> None:
+        self.path_for(key).unlink(missing_ok=True)
+
+    def entries(self) -> List[Path]:
+        if not self.cache_dir.exists():
+            return []
+        return [p for p in self.cache_dir.glob(f"*{self.suffix}") if p.is_file() and p.suffix != ".tmp"]
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache, or all caches in budget_dir, fit into max_size"""
+        entries = []
+        for path in self._budget_entries():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if total_size <= self.max_size:
+                break
+            logger.info(f"Evicting {path.name} from cache")
+            path.unlink(missing_ok=True)
+            total_size -= size
+
+    def _budget_entries(self) -> List[Path]:
+        if self.budget_dir is None:
+            return self.entries()
+        if not self.budget_dir.exists():
+            return []
+        return [p for p in self.budget_dir.rglob("*") if p.is_file() and p.suffix != ".tmp"]
+
+    def clear(self) -> None:
+        for path in self.entries():
+            path.unlink(missing_ok=True)
@@ -0,0 +1,95 @@
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+import httpx
+from loguru import logger
+
+from dlt_init_openapi.config import Config
+from dlt_init_openapi.utils.disk_cache import DEFAULT_CACHE_DIR, DiskCache
+
+
+class DownloadCache:
+    """On disk HTTP cache for spec downloads.
+
+    Stores the body of a response with its ETag and Last-Modified headers and revalidates with a conditional
+    request on the next download. A 304 response is served from disk. Bodies larger than the cache are not stored.
+    """
+
+    def __init__(self, config: Config) -> None:
+        budget_dir = config.cache_dir or DEFAULT_CACHE_DIR
+        max_size = config.cache_max_size_mb * 1024 * 1024
+        # downloads and specs share the size of the cache
+        self.bodies = DiskCache(budget_dir / "downloads", max_size=max_size, suffix=".body", budget_dir=budget_dir)
+        self.metadata = DiskCache(budget_dir / "downloads", max_size=max_size, suffix=".json", budget_dir=budget_dir)
+
+    @staticmethod
+    def key(url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def get_metadata(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.bodies.path_for(key).exists():
+            return None
+        stored = self.metadata.get(key)
+        try:
+            return json.loads(stored) if stored else None
+        except ValueError:
+            return None
+
+    def download(self, url: str, timeout: int = 60) -> bytes:
+        """Download url or serve it from the cache if the server tells us it has not changed"""
+        key = self.key(url)
+        metadata = self.get_metadata(key)
+
+        headers = {}
+        if metadata and metadata.get("etag"):
+            headers["If-None-Match"] = metadata["etag"]
+        if metadata and metadata.get("last_modified"):
+            headers["If-Modified-Since"] = metadata["last_modified"]
+
+        try:
+            with httpx.stream("GET", url, headers=headers, timeout=timeout) as response:
+                if response.status_code == 304 and metadata:
+                    logger.success("Spec not modified since last download, using cached copy")
+                    return self.bodies.get(key)
+                response.raise_for_status()
+                body = b"".join(response.iter_bytes())
+                if len(body) > self.bodies.max_size:
+                    # it would be evicted right away, together with everything else in the cache
+                    logger.info("Spec is larger than the cache, it is not cached")
+                    self.bodies.remove(key)
+                    self.metadata.remove(key)
+                else:
+                    self.bodies.put(key, body)
+                    self.metadata.put(
+                        key,
+                        json.dumps(
+                            {
+                                "url": url,
+                                "etag": response.headers.get("etag"),
+                                "last_modified": response.headers.get("last-modified"),
+                            }
+                        ).encode(),
+                    )
+        except httpx.TransportError:
+            # fall back to the last downloaded copy if the server can't be reached, error responses are raised
+            if metadata and (cached := self.bodies.get(key)) is not None:
+                logger.warning("Could not download spec, using cached copy from last download")
+                return cached
+            raise
+
+        logger.success("Download complete")
+        return body
+
+    def clear(self) -> None:
+        self.bodies.clear()
+        self.metadata.clear()
+
+
+def download_spec(url: str, timeout: int = 60) -> bytes:
+    """Download url without caching, the chunks of the body are joined once"""
+    with httpx.stream("GET", url, timeout=timeout) as response:
+        response.raise_for_status()
+        result = b"".join(response.iter_bytes())
+    logger.success("Download complete")
+    return result
@@ -0,0 +1,41 @@
+"""
+Memoized singular and plural forms of english words, the inflector applies its regex rules on every call
+"""
+
+from typing import Dict
+
+import inflector  # type: ignore
+
+from dlt_init_openapi.utils.lru_cache import LRUCache
+
+INFLECTION_CACHE_SIZE = 8192
+
+
+class Inflector:
+    """Singularizes and pluralizes words, a word is only inflected again after it was evicted from the cache"""
+
+    def __init__(self, max_size: int = INFLECTION_CACHE_SIZE) -> None:
+        self._english = inflector.English()
+        self._singular: LRUCache[str, str] = LRUCache(max_size)
+        self._plural: LRUCache[str, str] = LRUCache(max_size)
+
+    def singularize(self, word: str) -> str:
+        singular = self._singular.get(word)
+        if singular is None:
+            singular = self._english.singularize(word)
+            self._singular.put(word, singular)
+        return singular
+
+    def pluralize(self, word: str) -> str:
+        plural = self._plural.get(word)
+        if plural is None:
+            plural = self._english.pluralize(word)
+            self._plural.put(word, plural)
+        return plural
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {"singularize": self._singular.stats(), "pluralize": self._plural.stats()}
+
+
+# shared by the parser and the detectors
+inf = Inflector()
@@ -64,6 +64,11 @@ def snake_case(value: str) -> str:
     return "_".join(words).lower()
 
 
+def normalize_name(value: str) -> str:
+    """Lower case name without delimiters, so `userId`, `user_id` and `user-id` are the same"""
+    return re.sub(rf"[{DELIMITERS}]+", "", value).lower()
+
+
 def pascal_case(value: str) -> str:
     """Converts to PascalCase"""
     words = split_words(sanitize(value))
@@ -1,5 +1,85 @@
-import os.path
-from typing import Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, Generic, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+from dlt_init_openapi.utils.inflection import inf
+from dlt_init_openapi.utils.slots import add_slots
+
+T = TypeVar("T")
+
+
+@add_slots
+@dataclass(frozen=True)
+class ParsedPath:
+    """Path of an endpoint split into its parts once, see the functions below for what each part means"""
+
+    path: str
+    parts: Tuple[str, ...]
+    var_names: Tuple[str, ...]
+    non_var_parts: Tuple[str, ...]
+    singularized_parts: Tuple[str, ...]
+    """Parts with all non var parts singularized"""
+    looks_like_list: bool
+
+    @classmethod
+    def from_path(cls, path: str) -> "ParsedPath":
+        parts = get_path_parts(path)
+        is_var = [is_path_var(part) for part in parts]
+        return cls(
+            path=path,
+            parts=tuple(parts),
+            var_names=tuple(get_path_var_name(part) for part, var in zip(parts, is_var) if var),
+            non_var_parts=tuple(part for part, var in zip(parts, is_var) if not var),
+            singularized_parts=tuple(part if var else inf.singularize(part) for part, var in zip(parts, is_var)),
+            looks_like_list=bool(parts) and not is_var[-1],
+        )
+
+
+@dataclass(eq=False)
+class PathTrieNode(Generic[T]):
+    children: Dict[str, "PathTrieNode[T]"] = field(default_factory=dict)
+    value: Optional[T] = None
+    is_terminal: bool = False
+
+
+class PathTrie(Generic[T]):
+    """Trie of paths given as sequences of parts, a value can be stored for every inserted path"""
+
+    def __init__(self, paths: Iterable[Sequence[str]] = ()) -> None:
+        self.root: PathTrieNode[T] = PathTrieNode()
+        for path in paths:
+            self.insert(path)
+
+    def insert(self, path: Sequence[str], value: Optional[T] = None) -> None:
+        """Insert path, the value of a path that was inserted before is replaced"""
+        node = self.root
+        for part in path:
+            node = node.children.setdefault(part, PathTrieNode())
+        node.value = value
+        node.is_terminal = True
+
+    def ancestor_values(self, path: Sequence[str]) -> Iterator[T]:
+        """Values of the inserted proper prefixes of path, nearest first"""
+        if not path:
+            return
+        nodes = [self.root]
+        for part in path[:-1]:
+            if (node := nodes[-1].children.get(part)) is None:
+                break
+            nodes.append(node)
+        for node in reversed(nodes):
+            if node.value is not None:
+                yield node.value
+
+    def common_prefix(self, stop_at_paths: bool = True) -> Tuple[str, ...]:
+        """Longest prefix shared by all paths below it. With `stop_at_paths` the prefix does not extend past
+        an inserted path, so it is a prefix of every inserted path.
+        """
+        prefix: List[str] = []
+        node = self.root
+        while len(node.children) == 1 and not (stop_at_paths and node.is_terminal):
+            part, node = next(iter(node.children.items()))
+            prefix.append(part)
+        return tuple(prefix)
 
 
 def table_names_from_paths(paths: Iterable[str]) -> Dict[str, str]:
@@ -18,8 +98,11 @@ def table_names_from_paths(paths: Iterable[str]) -> Dict[str, str]:
     if not (paths := list(paths)):
         return {}
 
-    # normalize paths
-    api_prefix = os.path.commonpath(paths)
+    # normalize paths, the prefix is made of whole path segments like in os.path.commonpath
+    if len({p.startswith("/") for p in paths}) > 1:
+        raise ValueError("Can't mix absolute and relative paths")
+    segments = PathTrie[None](tuple(s for s in p.split("/") if s and s != ".") for p in paths)
+    api_prefix = ("/" if paths[0].startswith("/") else "") + "/".join(segments.common_prefix())
     norm_paths = [p.removeprefix(api_prefix) for p in paths]
 
     # Get all path components without slashes and without {parameters}
@@ -66,22 +149,7 @@ def find_longest_common_prefix(paths: Iterable[Tuple[str, ...]]) -> Tuple[str, .
     >>> find_longest_common_prefix({('data', '[*]', 'email', '[*]'), ('data', '[*]', 'phone', '[*]')})
     ("data", "[*]")
     """
-    paths = set(paths)
-
-    if not paths:
-        return ()
-
-    prefix = find_common_prefix(paths)
-    while True:
-        # Do multiple passes to find the most nested prefix
-        paths.discard(prefix)
-        longer_prefix = find_common_prefix(paths)
-
-        if not longer_prefix or longer_prefix == prefix:
-            break
-        prefix = longer_prefix
-
-    return prefix
+    return PathTrie[None](paths).common_prefix(stop_at_paths=False)
 
 
 def get_path_parts(path: str) -> List[str]:
@@ -0,0 +1,67 @@
+"""
+`__slots__` for dataclasses, `dataclass(slots=True)` is only available from python 3.10 on
+"""
+
+import dataclasses
+import functools
+from typing import Any, List, Type, TypeVar
+
+T = TypeVar("T")
+
+
+def add_slots(cls: Type[T]) -> Type[T]:
+    """Recreate a dataclass with slots for its fields, so instances carry no `__dict__`.
+    Apply on top of `@dataclass`. Frozen dataclasses get `__getstate__` and `__setstate__` so they can be pickled.
+    """
+    if "__slots__" in cls.__dict__:
+        raise TypeError(f"{cls.__name__} already specifies __slots__")
+    fields = dataclasses.fields(cls)  # type: ignore[arg-type]
+    field_names = tuple(f.name for f in fields)
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        # default values are kept by the generated __init__
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    # the generated __init__ leaves fields with init=False to their class attribute, which a slot replaces
+    no_init_defaults = [(f.name, f.default) for f in fields if not f.init and f.default is not dataclasses.MISSING]
+    if no_init_defaults:
+        init = cls_dict["__init__"]
+
+        @functools.wraps(init)
+        def __init__(self: Any, *args: Any, **kwargs: Any) -> None:
+            for name, default in no_init_defaults:
+                object.__setattr__(self, name, default)
+            init(self, *args, **kwargs)
+
+        cls_dict["__init__"] = __init__
+    metaclass: Any = type(cls)
+    slotted_cls: Type[T] = metaclass(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+    if cls.__dataclass_params__.frozen:  # type: ignore[attr-defined]
+        # the generated ones refer to the class that was replaced
+        slotted_cls.__setattr__ = _frozen_setattr  # type: ignore[assignment, method-assign]
+        slotted_cls.__delattr__ = _frozen_delattr  # type: ignore[assignment, method-assign]
+        slotted_cls.__getstate__ = _frozen_getstate  # type: ignore[attr-defined, method-assign]
+        slotted_cls.__setstate__ = _frozen_setstate  # type: ignore[attr-defined, method-assign]
+    return slotted_cls
+
+
+def _frozen_setattr(self: Any, name: str, value: Any) -> None:
+    raise dataclasses.FrozenInstanceError(f"cannot assign to field {name!r}")
+
+
+def _frozen_delattr(self: Any, name: str) -> None:
+    raise dataclasses.FrozenInstanceError(f"cannot delete field {name!r}")
+
+
+def _frozen_getstate(self: Any) -> List[Any]:
+    return [getattr(self, f.name) for f in dataclasses.fields(self)]
+
+
+def _frozen_setstate(self: Any, state: List[Any]) -> None:
+    for f, value in zip(dataclasses.fields(self), state):
+        # frozen dataclasses prevent setattr
+        object.__setattr__(self, f.name, value)
@@ -0,0 +1,8 @@
+from dlt.common.exceptions import DltException
+
+
+class RestApiException(DltException):
+    pass
+
+
+# class Paginator
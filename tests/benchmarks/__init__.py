@@ -0,0 +1,3 @@
+#
+# Benchmarks, these are not collected by pytest, run them with `make benchmark`
+#
@@ -0,0 +1,117 @@
+"""
+Time of the property lookups pagination detection runs on every response schema, scanning all nested
+properties compared to the name index of NestedProperties
+
+python -m tests.benchmarks.bench_find_property
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from dlt_init_openapi.config import Config
+from dlt_init_openapi.detector.default.const import (
+    RE_CURSOR_PROP,
+    RE_MATCH_ALL,
+    RE_NEXT_PROPERTY,
+    RE_TOTAL_PAGE_PROPERTY,
+    RE_TOTAL_PROPERTY,
+)
+from dlt_init_openapi.parser.context import OpenapiContext
+from dlt_init_openapi.parser.endpoints import EndpointCollection
+from dlt_init_openapi.parser.models import NestedProperties
+from dlt_init_openapi.parser.openapi_parser import OpenapiParser
+
+from .utils import best_of, get_benchmark_spec_paths, print_table
+
+LOOKUPS: List[Tuple[re.Pattern[str], Dict[str, Any]]] = [
+    (RE_MATCH_ALL, dict(require_type="array", allow_unknown_types=False)),
+    (RE_CURSOR_PROP, dict(allow_in_lists=False)),
+    (RE_TOTAL_PROPERTY, dict(require_type="integer", allow_unknown_types=True, allow_in_lists=False)),
+    (RE_TOTAL_PAGE_PROPERTY, dict(require_type="integer", allow_in_lists=False)),
+    (RE_NEXT_PROPERTY, dict(require_type="string", allow_in_lists=False)),
+]
+
+
+def scan(
+    nested: NestedProperties,
+    pattern: re.Pattern[str],
+    require_type: Optional[str] = None,
+    allow_unknown_types: bool = True,
+    allow_in_lists: bool = True,
+) -> Optional[Tuple[str, ...]]:
+    """The full scan find_property did before the index"""
+    candidates = []
+    unknown_type_candidates = []
+    for path, schema in nested.items():
+        if not path or not pattern.match(path[-1]):
+            continue
+        if not allow_in_lists and "[*]" in path:
+            continue
+        if require_type:
+            if require_type in schema.types:
+                candidates.append(path)
+            elif not schema.types and allow_unknown_types:
+                unknown_type_candidates.append(path)
+        else:
+            candidates.append(path)
+    candidates.sort(key=len)
+    unknown_type_candidates.sort(key=len)
+    return (candidates or unknown_type_candidates or [None])[0]
+
+
+def _response_nested_properties(path: str) -> List[NestedProperties]:
+    parser = OpenapiParser(Config())
+    spec = parser._load_and_validate(Path(path).read_bytes())
+    endpoints = EndpointCollection.from_context(OpenapiContext(parser.config, spec, parser.spec_raw))
+    return [
+        response.schema.nested_properties
+        for endpoint in endpoints.all_endpoints_to_render
+        for response in endpoint.responses
+        if response.schema
+    ]
+
+
+def _indexed(nested_list: List[NestedProperties]) -> List[Optional[Tuple[str, ...]]]:
+    # schemas shared by several responses are indexed once
+    for nested in nested_list:
+        nested._index = None
+    results = []
+    for nested in nested_list:
+        for pattern, kwargs in LOOKUPS:
+            found = nested.find_property(pattern, **kwargs)
+            results.append(found.path if found else None)
+    return results
+
+
+def _scanned(nested_list: List[NestedProperties]) -> List[Optional[Tuple[str, ...]]]:
+    return [scan(nested, pattern, **kwargs) for nested in nested_list for pattern, kwargs in LOOKUPS]
+
+
+def main() -> None:
+    logger.remove()
+    rows = []
+    for path in get_benchmark_spec_paths():
+        if "original_specs" not in path:
+            continue
+        nested_list = _response_nested_properties(path)
+        assert _indexed(nested_list) == _scanned(nested_list), path
+        scanned = best_of(lambda: _scanned(nested_list))  # noqa: B023
+        indexed = best_of(lambda: _indexed(nested_list))  # noqa: B023
+        rows.append(
+            [
+                os.path.basename(path),
+                sum(len(nested) for nested in nested_list),
+                f"{scanned * 1000:.1f} ms",
+                f"{indexed * 1000:.1f} ms",
+                f"{scanned / indexed:.1f}x",
+            ]
+        )
+    print_table(["spec", "paths", "scan", "index", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
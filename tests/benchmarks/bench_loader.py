@@ -0,0 +1,40 @@
+"""
+Time spent loading every spec of the test corpus with every available loader backend
+
+python -m tests.benchmarks.bench_loader
+"""
+
+import os
+from pathlib import Path
+
+from loguru import logger
+
+from dlt_init_openapi.parser.loader import JSON_LOADERS, YAML_LOADERS, available_loaders, sniff_format
+
+from .utils import best_of, get_benchmark_spec_paths, print_table
+
+
+def main() -> None:
+    logger.remove()
+    rows = []
+    for path in get_benchmark_spec_paths():
+        data = Path(path).read_bytes()
+        fmt = sniff_format(data)
+        backends = available_loaders(JSON_LOADERS if fmt == "json" else YAML_LOADERS)
+        timings = {b.name: best_of(lambda: b.load(data)) for b in backends}  # noqa: B023
+        slowest = max(timings.values())
+        for name, seconds in timings.items():
+            rows.append(
+                [
+                    os.path.basename(path),
+                    f"{len(data) // 1024} kb",
+                    name,
+                    f"{seconds * 1000:.1f} ms",
+                    f"{slowest / seconds:.1f}x",
+                ]
+            )
+    print_table(["spec", "size", "backend", "load time", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
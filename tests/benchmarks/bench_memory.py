@@ -0,0 +1,64 @@
+"""
+Peak resident memory of parsing and detecting every spec of the test corpus. Each spec is processed
+in a fresh process, so the peak of one spec does not hide the next one.
+
+python -m tests.benchmarks.bench_memory
+"""
+
+import multiprocessing
+import os
+import resource
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Tuple
+
+from .utils import get_benchmark_spec_paths, print_table
+
+
+def _max_rss() -> int:
+    """Peak resident memory of this process in bytes"""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on linux, bytes on macos
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def _parse_and_detect(path: str) -> Tuple[int, int]:
+    from loguru import logger
+
+    from dlt_init_openapi.config import Config
+    from dlt_init_openapi.detector.default import DefaultDetector
+    from dlt_init_openapi.parser.openapi_parser import OpenapiParser
+
+    logger.remove()
+    data = Path(path).read_bytes()
+    baseline = _max_rss()
+    config = Config()
+    parser = OpenapiParser(config)
+    parser.parse(data)
+    DefaultDetector(config).run(parser)
+    return baseline, _max_rss()
+
+
+def main() -> None:
+    rows = []
+    context = multiprocessing.get_context("spawn")
+    for path in get_benchmark_spec_paths():
+        if "original_specs" not in path:
+            continue
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            baseline, peak = executor.submit(_parse_and_detect, path).result()
+        rows.append(
+            [
+                os.path.basename(path),
+                f"{os.path.getsize(path) / 1024:.0f} kb",
+                f"{baseline / 1024 / 1024:.0f} mb",
+                f"{peak / 1024 / 1024:.0f} mb",
+                f"{(peak - baseline) / 1024 / 1024:.1f} mb",
+            ]
+        )
+    print_table(["spec", "size", "after imports", "peak rss", "parse + detect"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Time spent resolving every local ref of the ref heavy specs of the test corpus
+with the referencing resolver and with the JSON pointer index
+
+python -m tests.benchmarks.bench_ref_resolution
+"""
+
+import os
+from pathlib import Path
+
+import referencing
+import referencing.jsonschema
+from loguru import logger
+
+from dlt_init_openapi.parser.loader import load_spec
+from dlt_init_openapi.parser.pointer_index import JsonPointerIndex
+from dlt_init_openapi.parser.prune import iter_refs
+
+from .utils import best_of, get_benchmark_spec_paths, print_table
+
+# specs with fewer refs are not interesting here
+MIN_REFS = 100
+
+
+def main() -> None:
+    logger.remove()
+    rows = []
+    for path in get_benchmark_spec_paths():
+        spec_raw = load_spec(Path(path).read_bytes())
+        if not isinstance(spec_raw, dict):
+            continue
+        refs = sorted({ref for ref in iter_refs(spec_raw) if ref.startswith("#/")})
+        if len(refs) < MIN_REFS:
+            continue
+
+        def resolve_with_referencing() -> None:
+            resource = referencing.Resource(  # type: ignore[var-annotated, call-arg]
+                contents=spec_raw, specification=referencing.jsonschema.DRAFT202012  # noqa: B023
+            )
+            resolver = referencing.Registry().with_resource(resource=resource, uri="").resolver()
+            for ref in refs:  # noqa: B023
+                resolver.lookup(ref)
+
+        def resolve_with_index() -> None:
+            index = JsonPointerIndex(spec_raw)  # noqa: B023
+            for ref in refs:  # noqa: B023
+                index.lookup(ref)
+
+        referencing_time = best_of(resolve_with_referencing)
+        build_time = best_of(lambda: JsonPointerIndex(spec_raw))  # noqa: B023
+        index_time = best_of(resolve_with_index)
+        rows.append(
+            [
+                os.path.basename(path),
+                len(refs),
+                f"{referencing_time * 1000:.1f} ms",
+                f"{build_time * 1000:.1f} ms",
+                f"{index_time * 1000:.1f} ms",
+                f"{referencing_time / index_time:.1f}x",
+            ]
+        )
+    print_table(["spec", "refs", "referencing", "index build", "index build + lookups", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Parse time and peak memory of endpoint parsing relative to the size of the spec. Referenced schemas
+are expanded once per spec, so both should grow linearly with the spec and not with the nesting depth.
+
+python -m tests.benchmarks.bench_schema_graph
+"""
+
+import os
+import tracemalloc
+from pathlib import Path
+
+from loguru import logger
+
+from dlt_init_openapi.config import Config
+from dlt_init_openapi.parser.context import OpenapiContext
+from dlt_init_openapi.parser.endpoints import EndpointCollection
+from dlt_init_openapi.parser.openapi_parser import OpenapiParser
+
+from .utils import best_of, get_benchmark_spec_paths, print_table
+
+
+def _context_for(path: str) -> OpenapiContext:
+    parser = OpenapiParser(Config())
+    spec = parser._load_and_validate(Path(path).read_bytes())
+    return OpenapiContext(parser.config, spec, parser.spec_raw)
+
+
+def _peak_memory(path: str) -> int:
+    context = _context_for(path)
+    tracemalloc.start()
+    EndpointCollection.from_context(context)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    logger.remove()
+    rows = []
+    for path in get_benchmark_spec_paths():
+        if "original_specs" not in path:
+            continue
+        size = os.path.getsize(path)
+        context = _context_for(path)
+        timing = best_of(lambda: EndpointCollection.from_context(context), repeat=1)  # noqa: B023
+        memory = _peak_memory(path)
+        rows.append(
+            [
+                os.path.basename(path),
+                f"{size / 1024:.0f} kb",
+                f"{timing * 1000:.0f} ms",
+                f"{memory / 1024 / 1024:.1f} mb",
+                f"{timing * 1000 / (size / 1024):.2f} ms",
+                f"{memory / size:.1f}",
+            ]
+        )
+    print_table(["spec", "size", "time", "peak mem", "time per kb", "mem per byte"], rows)
+
+
+if __name__ == "__main__":
+    main()
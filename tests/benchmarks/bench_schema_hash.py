@@ -0,0 +1,63 @@
+"""
+Time of hashing every node of deeply nested inline schemas by serializing its full subtree, as every wrapper
+used to do when it was built, compared to the bottom up structural hash of the schema
+
+python -m tests.benchmarks.bench_schema_hash
+"""
+
+from typing import Any, Dict, Iterator
+
+import openapi_schema_pydantic as osp
+from dlt.common.utils import digest128
+from loguru import logger
+
+from dlt_init_openapi.parser.schema_hash import schema_hash
+
+from .utils import best_of, print_table
+
+DEPTHS = [10, 50, 100, 200]
+PROPERTIES_PER_LEVEL = 10
+
+
+def nested_schema(depth: int) -> Dict[str, Any]:
+    """An object with scalar properties and one nested object or list of objects per level"""
+    schema: Dict[str, Any] = {"type": "object", "properties": {}}
+    for level in range(depth):
+        properties: Dict[str, Any] = {
+            f"prop_{i}": {"type": "string", "description": f"level {level}"} for i in range(PROPERTIES_PER_LEVEL)
+        }
+        if level % 2:
+            properties["child"] = {"type": "array", "items": schema}
+        else:
+            properties["child"] = schema
+        schema = {"type": "object", "properties": properties}
+    return schema
+
+
+def _nodes(schema: osp.Schema) -> Iterator[osp.Schema]:
+    yield schema
+    for prop in (schema.properties or {}).values():
+        if isinstance(prop, osp.Schema):
+            yield from _nodes(prop)
+    if isinstance(schema.items, osp.Schema):
+        yield from _nodes(schema.items)
+
+
+def _hash_every_node(schema: osp.Schema) -> None:
+    for node in _nodes(schema):
+        digest128(node.json(sort_keys=True))
+
+
+def main() -> None:
+    logger.remove()
+    rows = []
+    for depth in DEPTHS:
+        schema = osp.Schema.parse_obj(nested_schema(depth))
+        legacy = best_of(lambda: _hash_every_node(schema), repeat=1)  # noqa: B023
+        structural = best_of(lambda: schema_hash(schema), repeat=1)  # noqa: B023
+        rows.append([depth, f"{legacy * 1000:.0f} ms", f"{structural * 1000:.0f} ms", f"{legacy / structural:.1f}x"])
+    print_table(["depth", "full subtree hash per node", "structural hash", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+import time
+from typing import Any, Callable, Iterable, List, Sequence
+
+from tests.integration.utils import get_all_spec_paths
+
+
+def get_benchmark_spec_paths() -> List[str]:
+    """All specs of the test corpus except the broken ones"""
+    return sorted(p for p in get_all_spec_paths() if "/error/" not in p)
+
+
+def best_of(func: Callable[[], Any], repeat: int = 3) -> float:
+    """Run func `repeat` times and return the fastest run in seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def print_table(header: Sequence[str], rows: Iterable[Sequence[Any]]) -> None:
+    """Print rows as a simple aligned table"""
+    rows = [[str(c) for c in row] for row in rows]
+    widths = [max(len(str(h)), *(len(r[i]) for r in rows)) if rows else len(str(h)) for i, h in enumerate(header)]
+    print("  ".join(str(h).ljust(w) for h, w in zip(header, widths)))
+    for row in rows:
+        print("  ".join(c.ljust(w) for c, w in zip(row, widths)))
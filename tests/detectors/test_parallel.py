@@ -0,0 +1,30 @@
+import multiprocessing
+from dataclasses import replace
+
+from dlt_init_openapi.config import Config
+from dlt_init_openapi.detector.default import DefaultDetector
+from dlt_init_openapi.detector.default.parallel import EndpointDetection, detect_endpoints_in_parallel
+from tests.integration.utils import get_parsed_project_by_case
+
+
+def test_parallel_detection_in_spawned_processes() -> None:
+    serial_detector = DefaultDetector(Config())
+    serial = get_parsed_project_by_case("artificial", "users.yml").openapi.endpoints.endpoints
+    for endpoint in serial:
+        serial_detector.detect_endpoint(endpoint)
+
+    # the endpoint filter and the resolver of the context are not picklable
+    config = Config(jobs=2, endpoint_filter=lambda _c: {"list_users"})
+    parser = get_parsed_project_by_case("artificial", "users.yml", config).openapi
+    detections = detect_endpoints_in_parallel(
+        DefaultDetector(config), parser.endpoints.endpoints, mp_context=multiprocessing.get_context("spawn")
+    )
+
+    assert [replace(d, warnings=[]) for d in detections] == [EndpointDetection.from_endpoint(e, []) for e in serial]
+    assert [[w.msg for w in d.warnings] for d in detections] == [
+        [w.msg for w in serial_detector.get_warnings().get(e.id, [])] for e in serial
+    ]
+    for endpoint, detection in zip(parser.endpoints.endpoints, detections):
+        detection.apply(endpoint)
+        assert endpoint.context is parser.context
+    assert [e.primary_key for e in parser.endpoints.endpoints] == [e.primary_key for e in serial]
@@ -1,4 +1,6 @@
 from dlt_init_openapi.detector.default import utils
+from dlt_init_openapi.detector.default.primary_key import detect_primary_key_by_name
+from dlt_init_openapi.utils.paths import ParsedPath
 
 
 def test_word_variations() -> None:
@@ -9,3 +11,11 @@ def test_word_variations() -> None:
 def test_singularized_path_parts() -> None:
     assert utils.singularized_path_parts("hello/cats") == ["hello", "cat"]
     assert utils.singularized_path_parts("hello/{cats}/cats") == ["hello", "{cats}", "cat"]
+
+
+def test_primary_key_by_normalized_name() -> None:
+    path = ParsedPath.from_path("/users/{user_id}")
+    assert detect_primary_key_by_name({"userid": ["userId"], "name": ["name"]}, "User", path) == "userId"
+    # names that only differ in case are preferred
+    assert detect_primary_key_by_name({"id": ["_id", "ID"]}, "User", path) == "ID"
+    assert detect_primary_key_by_name({"name": ["name"]}, "User", path) is None
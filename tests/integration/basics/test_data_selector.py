@@ -44,3 +44,7 @@ def test_platform_nested(data_selectors: Dict[str, Any]) -> None:
 
 def test_expect_list_but_no_list_and_no_types(data_selectors: Dict[str, Any]) -> None:
     assert data_selectors["expect_list_but_no_list_and_no_types"] == "$"
+
+
+def test_single_object_self_reference(data_selectors: Dict[str, Any]) -> None:
+    assert data_selectors["single_object_self_reference"] == "$"
@@ -1,5 +1,5 @@
 from dlt_init_openapi.config import Config
-from tests.integration.utils import get_indexed_resources
+from tests.integration.utils import get_indexed_resources, get_project_by_case
 
 
 def test_endpoint_selection() -> None:
@@ -19,3 +19,50 @@ def test_endpoint_selection() -> None:
     )
     assert len(filtered_resources.keys()) == 2
     assert list(filtered_resources.keys()) == [base_keys[0], base_keys[3]]
+
+
+def test_compact_renders_the_same_source() -> None:
+    project = get_project_by_case("artificial", "transformer.yml")
+    project.render(dry=True)
+    expected = project.renderer._render_source()  # type: ignore
+
+    project = get_project_by_case("artificial", "transformer.yml")
+    project.compact()
+    assert project.doc is None
+    assert project.openapi.spec_raw is None
+    assert project.openapi.context.spec is None
+    for endpoint in project.openapi.endpoints.endpoints:
+        assert endpoint.osp_operation is None
+        assert all(response.osp_response is None for response in endpoint.responses)
+        for parameter in endpoint.parameters.values():
+            assert parameter.osp_parameter is None
+            assert parameter.schema.osp_schema is None
+        if endpoint.payload:
+            assert endpoint.payload.prop.osp_schema is None
+
+    project.render(dry=True)
+    assert project.renderer._render_source() == expected  # type: ignore
+
+
+def test_parallel_detection_matches_serial() -> None:
+    for case in ["pagination.yml", "warnings.yml", "data_selector.yml"]:
+        serial = get_project_by_case("artificial", case)
+        parallel = get_project_by_case("artificial", case, config=Config(jobs=2))
+
+        # warnings are added in the same order
+        assert [(k, [w.msg for w in v]) for k, v in parallel.detector.get_warnings().items()] == [
+            (k, [w.msg for w in v]) for k, v in serial.detector.get_warnings().items()
+        ]
+        for serial_endpoint, parallel_endpoint in zip(
+            serial.openapi.endpoints.endpoints, parallel.openapi.endpoints.endpoints
+        ):
+            assert parallel_endpoint.id == serial_endpoint.id
+            assert parallel_endpoint.detected_pagination == serial_endpoint.detected_pagination
+            assert parallel_endpoint.primary_key == serial_endpoint.primary_key
+            if serial_endpoint.payload:
+                assert parallel_endpoint.payload.path == serial_endpoint.payload.path
+                assert parallel_endpoint.payload.name == serial_endpoint.payload.name
+
+        serial.render(dry=True)
+        parallel.render(dry=True)
+        assert parallel.renderer._render_source() == serial.renderer._render_source()  # type: ignore
@@ -1,9 +1,12 @@
+from pathlib import Path
 from typing import Any, Dict
 
 import pytest
+import yaml
 
 from dlt_init_openapi.config import Config
-from tests.integration.utils import get_indexed_resources
+from tests.cases import case_path
+from tests.integration.utils import get_detected_project_from_open_api, get_indexed_resources
 
 
 @pytest.fixture(scope="module")
@@ -41,3 +44,19 @@ def test_primary_key_by_path_variable(resources: Dict[str, Any]) -> None:
 
 def test_primary_key_from_pluralized_path_component(resources: Dict[str, Any]) -> None:
     assert resources["primary_key_from_pluralized_path_component"]["primary_key"] == "account_id"
+
+
+@pytest.mark.parametrize("first_path", ["/pets", "/cats", "/dogs"])
+def test_primary_key_of_polymorphic_cycle(first_path: str, tmp_path: Path) -> None:
+    # cat and dog are composed of pet which is one of cat or dog, the order of the paths must not matter
+    with open(case_path("artificial", "polymorphic_cycle.yml"), encoding="utf-8") as f:
+        spec = yaml.safe_load(f)
+    spec["paths"] = {first_path: spec["paths"].pop(first_path), **spec["paths"]}
+    case = tmp_path / "polymorphic_cycle.yml"
+    case.write_text(yaml.dump(spec, sort_keys=False), encoding="utf-8")
+
+    project = get_detected_project_from_open_api(str(case), Config(name_resources_by_operation=True))
+    endpoints = {endpoint.operation_id: endpoint for endpoint in project.openapi.endpoints.endpoints}
+    for name, extra in [("list_cats", "meow"), ("list_dogs", "bark")]:
+        assert [prop.name for prop in endpoints[name].payload.schema.properties] == ["id", "kind", extra]
+        assert endpoints[name].primary_key == "id"
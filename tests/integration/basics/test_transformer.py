@@ -116,3 +116,18 @@ def test_match_singularized_path(resources: Dict[str, Any]) -> None:
             },
         },
     }
+
+
+def test_transformer_parent_of_included_path() -> None:
+    resources: Dict[str, Any] = get_indexed_resources(
+        "artificial",
+        "transformer.yml",
+        config=Config(name_resources_by_operation=True, include_paths=["^/invoice/"]),
+    )
+
+    # the parent is parsed and rendered for the transformer, but not selected
+    assert set(resources) == {"invoices", "single_invoice"}
+    assert resources["invoices"]["selected"] is False
+    assert resources["single_invoice"]["endpoint"]["params"] == {
+        "invoice_id": {"type": "resolve", "resource": "invoices", "field": "invoice_id"}
+    }
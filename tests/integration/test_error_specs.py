@@ -1,15 +1,37 @@
 import pytest
 
 from dlt_init_openapi.config import Config
-from dlt_init_openapi.exceptions import DltNoEndpointsDiscovered, DltOpenAPINot30Exception, DltUnparseableSpecException
+from dlt_init_openapi.exceptions import (
+    DltNoEndpointsDiscovered,
+    DltOpenAPINot30Exception,
+    DltSpecFileNotFoundException,
+    DltUnparseableSpecException,
+)
+from dlt_init_openapi.parser.openapi_parser import OpenapiParser
+from tests.cases import case_path
 from tests.integration.utils import get_dict_by_case
 
 
 def test_no_endoint_discovered() -> None:
     with pytest.raises(DltNoEndpointsDiscovered):
+        get_dict_by_case("artificial", "transformer.yml", config=Config(include_methods=["trace"]))
+
+
+def test_referenced_file_not_found() -> None:
+    # all paths are refs to files that are not part of the test cases
+    with pytest.raises(DltSpecFileNotFoundException):
         get_dict_by_case("error", "coinpaprika.yaml")
 
 
+def test_referenced_file_without_spec_files() -> None:
+    # a downloaded spec has no files to resolve relative refs from
+    with open(case_path("error", "coinpaprika.yaml"), "rb") as f:
+        data = f.read()
+    with pytest.raises(DltSpecFileNotFoundException) as exc_info:
+        OpenapiParser(Config()).parse(data)
+    assert exc_info.value.name == "paths/key.yml#/info"
+
+
 def test_not_openapi_30() -> None:
     with pytest.raises(DltOpenAPINot30Exception):
         get_dict_by_case("error", "art_institute_chicago_api.yaml")
@@ -1,13 +1,14 @@
 import importlib
 import os
 from distutils.dir_util import copy_tree, remove_tree
-from typing import Dict, Iterable, List, Literal, Union, cast
+from typing import Any, Dict, Iterable, List, Literal, Union, cast
 
 from dlt.common.validation import validate_dict
 from dlt.extract.source import DltSource
 
 from dlt_init_openapi import Project, _get_project_for_url_or_path
 from dlt_init_openapi.config import REST_API_SOURCE_LOCATION, Config
+from dlt_init_openapi.parser.loader import load_spec
 from rest_api.typing import EndpointResource, RESTAPIConfig
 from tests.cases import case_path
 
@@ -16,7 +17,7 @@ LOCAL_DIR = "tests/_local/"
 TType = Literal["artificial", "original", "extracted", "error"]
 
 
-def get_detected_project_from_open_api(case: str, config: Config) -> Project:
+def get_parsed_project_from_open_api(case: str, config: Config) -> Project:
 
     config = config or Config()
 
@@ -25,9 +26,14 @@ def get_detected_project_from_open_api(case: str, config: Config) -> Project:
     config.spec_path = case  # type: ignore
     config.prepare()
 
-    # get project and render source into string
     project = _get_project_for_url_or_path(config=config)  # type: ignore
     project.parse()
+
+    return project
+
+
+def get_detected_project_from_open_api(case: str, config: Config) -> Project:
+    project = get_parsed_project_from_open_api(case, config)
     project.detect()
 
     return project
@@ -117,6 +123,18 @@ def get_project_by_case(type: TType, case: str, config: Config = None) -> Projec
     return get_detected_project_from_open_api(path, config)
 
 
+def get_parsed_project_by_case(type: TType, case: str, config: Config = None) -> Project:
+    """Project with the spec of the case parsed but not detected, the parser is project.openapi"""
+    path = case_path(type, case)
+    return get_parsed_project_from_open_api(path, config)
+
+
+def get_spec_raw_by_case(type: TType, case: str) -> Dict[str, Any]:
+    """Loads the spec of the case without validating it"""
+    with open(case_path(type, case), "rb") as f:
+        return load_spec(f.read())
+
+
 def get_indexed_resources(type: TType, case: str, config: Config = None) -> Dict[str, EndpointResource]:
     """get all found resources indexed by name"""
     rendered_dict = get_dict_by_case(type, case, config=config)
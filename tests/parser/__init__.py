@@ -0,0 +1 @@
+# Parser internals
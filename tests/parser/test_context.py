@@ -0,0 +1,38 @@
+import openapi_schema_pydantic as osp
+
+from dlt_init_openapi.config import Config
+from dlt_init_openapi.parser.context import OpenapiContext
+from tests.integration.utils import get_parsed_project_by_case
+
+
+def _context(case: str, config: Config = None) -> OpenapiContext:
+    return get_parsed_project_by_case("artificial", case, config).openapi.context
+
+
+def test_component_cache_is_per_context() -> None:
+    # both specs have a Pet schema
+    ref = osp.Reference(ref="#/components/schemas/Pet")
+
+    context = _context("polymorphic_cycle.yml")
+    other_context = _context("nested_properties.yml")
+
+    assert set(context.schema_from_reference(ref).properties) == {"id", "kind"}
+    assert set(other_context.schema_from_reference(ref).properties) == {"id"}
+
+
+def test_parsed_components_are_cached() -> None:
+    context = _context("users.yml")
+    ref = osp.Reference(ref="#/components/parameters/Id")
+
+    stats = context.component_cache_stats["parsed"]
+    assert context.parameter_from_reference(ref) is context.parameter_from_reference(ref)
+    assert context.component_cache_stats["parsed"]["hits"] >= stats["hits"] + 1
+
+
+def test_component_cache_is_bounded() -> None:
+    context = _context("users.yml", Config(component_cache_size=1))
+    context.schema_from_reference(osp.Reference(ref="#/components/schemas/User"))
+    context.schema_from_reference(osp.Reference(ref="#/components/schemas/Address"))
+
+    assert context.component_cache_stats["resolved"]["size"] == 1
+    assert context.component_cache_stats["parsed"]["size"] == 1
@@ -0,0 +1,60 @@
+from typing import Set
+
+from dlt_init_openapi.config import Config
+from dlt_init_openapi.parser.endpoint_index import EndpointIndex
+from dlt_init_openapi.parser.endpoints import EndpointCollection
+from tests.integration.utils import get_parsed_project_by_case, get_spec_raw_by_case
+
+
+def _endpoints(config: Config) -> EndpointCollection:
+    return get_parsed_project_by_case("artificial", "users.yml", config).openapi.endpoints
+
+
+def test_index_from_raw_spec() -> None:
+    index = EndpointIndex.from_spec_raw(get_spec_raw_by_case("artificial", "users.yml"), ["get", "post"])
+
+    assert index.paths == ["/users", "/users/{id}", "/me"]
+    assert [(e.method, e.operation_id) for e in index.endpoints] == [
+        ("GET", "list_users"),
+        ("GET", "get_user"),
+        ("GET", "get_me"),
+    ]
+
+
+def test_select_paths_with_parents() -> None:
+    index = EndpointIndex.from_spec_raw(get_spec_raw_by_case("artificial", "users.yml"), ["get"])
+
+    assert index.select_paths(["^/users/{id}$"]) == {"/users", "/users/{id}"}
+    assert index.select_paths(["me"]) == {"/me"}
+    assert index.select_paths(["nothing"]) == set()
+
+
+def test_parse_included_paths_only() -> None:
+    endpoints = _endpoints(Config(include_paths=["{id}"]))
+
+    assert set(endpoints.endpoints_by_id) == {"list_users", "get_user"}
+    # the parent is only parsed to detect transformers
+    assert endpoints.endpoint_ids_to_render == {"get_user"}
+
+
+def test_path_filter_selects_from_index() -> None:
+    offered = []
+
+    def path_filter(index: EndpointIndex) -> Set[str]:
+        offered.append(index.paths)
+        return {"/users/{id}"}
+
+    config = Config(path_filter=path_filter, include_paths=["users"])
+    endpoints = _endpoints(config)
+
+    # only included paths are offered, the selected ones become the included paths
+    assert offered == [["/users", "/users/{id}"]]
+    assert config.include_paths == ["^/users/\\{id\\}$"]
+    assert set(endpoints.endpoints_by_id) == {"list_users", "get_user"}
+    assert endpoints.endpoint_ids_to_render == {"get_user"}
+
+
+def test_empty_path_selection_parses_all_paths() -> None:
+    endpoints = _endpoints(Config(path_filter=lambda _index: set()))
+
+    assert endpoints.endpoint_ids_to_render == {"list_users", "get_user", "get_me"}
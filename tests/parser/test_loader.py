@@ -0,0 +1,55 @@
+import json
+import math
+from typing import List
+
+import pytest
+import yaml
+
+from dlt_init_openapi.exceptions import DltUnparseableSpecException
+from dlt_init_openapi.parser import loader
+from dlt_init_openapi.parser.loader import load_spec, sniff_format
+
+SPEC = {"openapi": "3.0.0", "info": {"title": "test", "version": "1"}, "paths": {}}
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        (b'{"a": 1}', "json"),
+        (b"  \n\t[1, 2]", "json"),
+        (b'\xef\xbb\xbf{"a": 1}', "json"),
+        (b"openapi: 3.0.0", "yaml"),
+        (b"# comment\n{a: 1}", "yaml"),
+        (b"", "yaml"),
+    ],
+)
+def test_sniff_format(data: bytes, expected: str) -> None:
+    assert sniff_format(data) == expected
+
+
+def test_load_json_and_yaml() -> None:
+    assert load_spec(json.dumps(SPEC).encode()) == SPEC
+    # the yaml loader does not convert scalars
+    assert load_spec(yaml.dump(SPEC).encode()) == SPEC
+
+
+def test_load_yaml_flow_mapping() -> None:
+    # starts like json but is only valid yaml
+    assert load_spec(b"{openapi: 3.0.0, paths: {}}") == {"openapi": "3.0.0", "paths": {}}
+
+
+def test_json_backend_fallback() -> None:
+    # NaN is accepted by the standard library but not by all fast backends
+    assert math.isnan(load_spec(b'{"value": NaN}')["value"])
+
+
+@pytest.mark.parametrize("backends", [loader.JSON_LOADERS, loader.YAML_LOADERS])
+def test_backends_produce_same_result(backends: List[loader.SpecLoader]) -> None:
+    data = json.dumps(SPEC).encode()
+    results = [b.load(data) for b in loader.available_loaders(backends)]
+    assert all(r == results[0] for r in results)
+
+
+def test_not_parseable() -> None:
+    with pytest.raises(DltUnparseableSpecException):
+        load_spec(b"{ this: is: not: valid")
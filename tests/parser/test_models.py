@@ -0,0 +1,160 @@
+import re
+from dataclasses import FrozenInstanceError
+from typing import Dict
+
+import pytest
+
+from dlt_init_openapi.config import Config
+from dlt_init_openapi.parser.endpoints import Endpoint
+from dlt_init_openapi.parser.models import SchemaWrapper, literal_alternatives
+from tests.integration.utils import get_parsed_project_by_case
+
+
+def _main_schema(endpoint: Endpoint) -> SchemaWrapper:
+    return endpoint.responses[0].schema
+
+
+def _endpoints(case: str, config: Config = None) -> Dict[str, Endpoint]:
+    return get_parsed_project_by_case("artificial", case, config).openapi.endpoints.endpoints_by_id
+
+
+def test_referenced_schemas_are_shared() -> None:
+    endpoints = _endpoints("users.yml")
+
+    user = _main_schema(endpoints["get_user"])
+    assert user.name == "User"
+    assert _main_schema(endpoints["get_me"]) is user
+
+
+def test_referenced_and_path_parameters_are_shared() -> None:
+    endpoints = _endpoints("users.yml", Config(include_methods=["get", "put"]))
+
+    assert endpoints["list_users"].parameters["limit"] is endpoints["get_me"].parameters["limit"]
+    assert endpoints["get_user"].parameters["fields"] is endpoints["put_user"].parameters["fields"]
+
+
+def test_recursive_schema_is_a_cycle() -> None:
+    endpoints = _endpoints("users.yml")
+
+    user = _main_schema(endpoints["get_user"])
+    # the recursive reference points back to the same wrapper instead of a copy at a deeper level
+    assert user["friends"].schema.array_item is user
+    assert _main_schema(endpoints["list_users"]).array_item is user
+
+    # nested properties stop at the back edge
+    nested = user.nested_properties
+    assert ("friends", "[*]") in nested
+    assert ("friends", "[*]", "friends") not in nested
+    assert ("address", "street") in nested
+
+
+def test_nested_properties_are_discovered_on_first_access() -> None:
+    endpoints = _endpoints("users.yml")
+
+    user = _main_schema(endpoints["get_user"])
+    address = user["address"].schema
+    assert user._nested_properties is None
+    assert address._nested_properties is None
+
+    nested = user.nested_properties
+    assert user.nested_properties is nested
+    # discovering the parent does not discover the children
+    assert address._nested_properties is None
+    assert ("street",) in address.nested_properties
+
+
+def test_response_schemas_are_expanded_on_first_access() -> None:
+    ok, not_found = _endpoints("users.yml")["get_user"].responses
+
+    assert ok.expanded_schemas == []
+    assert not_found.expanded_schemas == []
+    user = ok.schema
+    assert user.name == "User"
+    assert ok.content_schema is user
+    assert not_found.expanded_schemas == []
+
+    # replacing the schema keeps the content schema
+    ok.schema = user["address"].schema
+    assert ok.content_schema is user
+    assert ok.expanded_schemas == [user, user["address"].schema]
+
+
+@pytest.mark.parametrize(
+    "pattern,expected",
+    [
+        (re.compile(r"^(next|next_url|More)$", re.IGNORECASE), {"next", "next_url", "more"}),
+        (re.compile(r"^total$", re.IGNORECASE), {"total"}),
+        (re.compile(r"^(total)$", re.IGNORECASE), {"total"}),
+        # alternation binds weaker than the anchors
+        (re.compile(r"^next|more$", re.IGNORECASE), None),
+        (re.compile(r"^(next|next_url)$"), None),
+        (re.compile(r"^(next|.*_url)$", re.IGNORECASE), None),
+        (re.compile(r"(next|more)", re.IGNORECASE), None),
+        (re.compile(r".*", re.IGNORECASE), None),
+    ],
+)
+def test_literal_alternatives(pattern: re.Pattern[str], expected: object) -> None:
+    assert literal_alternatives(pattern) == expected
+
+
+def test_find_property_prefers_least_nested_and_typed() -> None:
+    nested = _main_schema(_endpoints("nested_properties.yml")["list_items"]).nested_properties
+
+    def find(pattern: str, **kwargs: object) -> object:
+        found = nested.find_property(re.compile(pattern, re.IGNORECASE), **kwargs)  # type: ignore[arg-type]
+        return found.path if found else None
+
+    # same depth keeps the order of the properties
+    assert find(r"^(next|more)$", require_type="string") == ("more",)
+    assert find(r"^(next|more)$") == ("more",)
+    assert find(r"^(count|total)$", require_type="integer") == ("meta", "total")
+    assert find(r"^(count|total)$", require_type="integer", allow_unknown_types=False) == ("meta", "total")
+    assert find(r"^count$", require_type="integer") == ("count",)
+    assert find(r"^count$", require_type="integer", allow_unknown_types=False) is None
+    assert find(r"^next$", require_type="string", allow_in_lists=False) == ("meta", "Next")
+    assert find(r".*", require_type="array", allow_unknown_types=False) == ("items",)
+    assert find(r"^n.xt$", require_type="string") == ("meta", "Next")
+
+
+def test_is_optional() -> None:
+    nested = _main_schema(_endpoints("nested_properties.yml")["get_order"]).nested_properties
+
+    assert not nested.is_optional(())
+    assert not nested.is_optional(("id",))
+    assert nested.is_optional(("note",))
+    assert not nested.is_optional(("customer", "id"))
+    # nullable
+    assert nested.is_optional(("customer", "email"))
+    # required in an optional parent
+    assert nested.is_optional(("shipping", "city"))
+    # list items
+    assert not nested.is_optional(("lines",))
+    assert nested.is_optional(("lines", "[*]", "sku"))
+    # unknown paths take the value of their closest parent
+    assert not nested.is_optional(("customer", "unknown"))
+    assert nested.is_optional(("shipping", "unknown"))
+
+
+def test_property_maps_are_cached() -> None:
+    schema = _main_schema(_endpoints("nested_properties.yml")["get_pet"])
+
+    assert list(schema) == ["id"]
+    assert "bark" not in schema
+    assert schema["id"].schema.types == ["integer"]
+    with pytest.raises(KeyError):
+        schema["bark"]
+    # union members override properties of the same name
+    assert list(schema.all_properties_map) == ["id", "bark", "meow"]
+    assert schema.all_properties_map["id"].schema.types == ["string"]
+    assert schema.all_properties_map is schema.all_properties_map
+
+    with pytest.raises(FrozenInstanceError):
+        schema.name = "Cat"  # type: ignore[misc]
+
+
+def test_normalized_properties_map() -> None:
+    user = _main_schema(_endpoints("users.yml")["get_user"])
+
+    assert [p.name for p in user.normalized_properties_map["id"]] == ["id"]
+    assert user.normalized_properties_map is user.normalized_properties_map
+    assert "friends" in user.normalized_properties_map
@@ -0,0 +1,70 @@
+import multiprocessing
+import zipfile
+from pathlib import Path
+
+from dlt_init_openapi import _get_document
+from dlt_init_openapi.config import Config
+from dlt_init_openapi.parser.openapi_parser import OpenapiParser
+from dlt_init_openapi.parser.parallel import endpoints_from_paths_in_parallel
+from tests.integration.utils import get_parsed_project_by_case, get_project_by_case
+from tests.parser.test_spec_files import FILES, _write_dir
+
+
+def _parser(config: Config = None) -> OpenapiParser:
+    return get_parsed_project_by_case("artificial", "users.yml", config).openapi
+
+
+def test_parallel_parsing_matches_serial() -> None:
+    serial = _parser().endpoints.endpoints
+    parser = _parser(Config(jobs=2))
+    parallel = parser.endpoints.endpoints
+
+    assert [e.id for e in parallel] == [e.id for e in serial]
+    for serial_endpoint, parallel_endpoint in zip(serial, parallel):
+        assert parallel_endpoint.context is parser.context
+        assert list(parallel_endpoint.parameters) == list(serial_endpoint.parameters)
+        serial_schema = serial_endpoint.responses[0].schema
+        parallel_schema = parallel_endpoint.responses[0].schema
+        assert parallel_schema.name == serial_schema.name
+        assert list(parallel_schema.nested_properties.all_properties) == list(
+            serial_schema.nested_properties.all_properties
+        )
+
+
+def test_parallel_parsing_of_polymorphic_cycle_matches_serial() -> None:
+    # members of the cycle are complete no matter which chunk of paths builds them first
+    serial = get_project_by_case("artificial", "polymorphic_cycle.yml")
+    parallel = get_project_by_case("artificial", "polymorphic_cycle.yml", config=Config(jobs=2))
+
+    serial.render(dry=True)
+    parallel.render(dry=True)
+    assert parallel.renderer._render_source() == serial.renderer._render_source()  # type: ignore
+
+
+def test_parallel_parsing_in_spawned_processes() -> None:
+    parser = _parser(Config(jobs=2, endpoint_filter=lambda _c: {"list_users"}))
+
+    endpoints = endpoints_from_paths_in_parallel(
+        list(parser.spec_raw["paths"]), parser.context, mp_context=multiprocessing.get_context("spawn")
+    )
+
+    assert [e.id for e in endpoints] == ["list_users", "get_user", "get_me"]
+    assert all(e.context is parser.context for e in endpoints)
+    assert endpoints[0].responses[0].schema.array_item.name == "User"
+
+
+def test_parallel_parsing_of_spec_archive(tmp_path: Path) -> None:
+    spec_dir = _write_dir(tmp_path / "spec")
+    with zipfile.ZipFile(tmp_path / "spec.zip", "w") as archive:
+        for name in FILES:
+            archive.write(spec_dir / name, name)
+
+    config = Config(spec_path=tmp_path / "spec.zip", jobs=2)
+    parser = OpenapiParser(config)
+    parser.parse(_get_document(config=config))
+
+    endpoints = parser.endpoints.endpoints_by_id
+    assert list(endpoints) == ["list_users", "get_user"]
+    # refs into other files are resolved by the workers
+    assert endpoints["list_users"].responses[0].schema.array_item["address"].schema.name == "Address"
+    assert endpoints["get_user"].responses[0].schema["error"].schema.name == "Error"
@@ -0,0 +1,47 @@
+from pathlib import Path
+
+import pytest
+import referencing
+import referencing.jsonschema
+
+from dlt_init_openapi.parser.loader import load_spec
+from dlt_init_openapi.parser.pointer_index import JsonPointerIndex
+from dlt_init_openapi.parser.prune import iter_refs
+from tests.cases import case_path
+
+DOCUMENT = {
+    "paths": {"/users/{id}": {"get": {"parameters": [{"name": "id"}, {"name": "q"}]}}},
+    "components": {"schemas": {"Pet": {"type": "object"}, "a/b~c": {"type": "string"}}},
+}
+
+
+@pytest.mark.parametrize(
+    "ref,expected",
+    [
+        ("#/components/schemas/Pet", {"type": "object"}),
+        ("#/components/schemas/a~1b~0c", {"type": "string"}),
+        ("#/components/schemas/Pet/type", "object"),
+        ("#/paths/~1users~1{id}/get/parameters/1", {"name": "q"}),
+        ("#/paths/~1users~1%7Bid%7D/get/parameters/0", {"name": "id"}),
+        ("#/components/schemas/Cat", None),
+        ("#/paths/~1users~1{id}/get/parameters/2", None),
+        ("other.yaml#/components/schemas/Pet", None),
+    ],
+)
+def test_lookup(ref: str, expected: object) -> None:
+    assert JsonPointerIndex(DOCUMENT).lookup(ref) == expected
+
+
+@pytest.mark.parametrize("case", ["spotify.json", "asana_oas.yaml", "newspilot.yml"])
+def test_same_as_referencing(case: str) -> None:
+    spec_raw = load_spec(Path(case_path("original", case)).read_bytes())
+    resource = referencing.Resource(  # type: ignore[var-annotated, call-arg]
+        contents=spec_raw, specification=referencing.jsonschema.DRAFT202012
+    )
+    resolver = referencing.Registry().with_resource(resource=resource, uri="").resolver()
+    index = JsonPointerIndex(spec_raw)
+
+    for ref in iter_refs(spec_raw):
+        if not ref.startswith("#/"):
+            continue
+        assert index.lookup(ref) is resolver.lookup(ref).contents
@@ -0,0 +1,78 @@
+import copy
+from typing import Any, Dict
+
+import pytest
+
+from dlt_init_openapi.config import Config
+from dlt_init_openapi.exceptions import DltInvalidSpecException
+from dlt_init_openapi.parser.openapi_parser import OpenapiParser
+from dlt_init_openapi.parser.prune import prune_spec
+from tests.integration.utils import get_parsed_project_by_case, get_spec_raw_by_case
+
+
+def _spec_with_writes() -> Dict[str, Any]:
+    return get_spec_raw_by_case("artificial", "users_with_writes.yml")
+
+
+def test_prune_unreachable() -> None:
+    spec = _spec_with_writes()
+    original = copy.deepcopy(spec)
+
+    result = prune_spec(spec, ["get"])
+
+    pruned = result.spec_raw
+    assert spec == original
+    assert list(pruned["paths"]) == ["/users", "/users/{id}", "/me", "/pets"]
+    assert "post" not in pruned["paths"]["/users"]
+    assert "delete" not in pruned["paths"]["/pets"]
+    assert "webhooks" not in pruned
+    assert set(pruned["components"]["schemas"]) == {"User", "Address", "Cat", "Dog"}
+    assert pruned["components"]["parameters"] == spec["components"]["parameters"]
+    # looked up by name and not by ref
+    assert pruned["components"]["securitySchemes"] == spec["components"]["securitySchemes"]
+
+    assert result.pruned_operations == 2
+    assert result.pruned_components == 2
+    assert result.pruned_bytes > 0
+
+
+def test_prune_keeps_referenced_operations() -> None:
+    spec = _spec_with_writes()
+    spec["paths"]["/me"]["get"]["responses"] = {"$ref": "#/paths/~1users/post/responses"}
+
+    pruned = prune_spec(spec, ["get"]).spec_raw
+
+    # the whole operation is kept, so it is still valid
+    assert pruned["paths"]["/users"]["post"] == spec["paths"]["/users"]["post"]
+    assert "NewUser" in pruned["components"]["schemas"]
+
+
+def test_prune_included_paths() -> None:
+    pruned = prune_spec(_spec_with_writes(), ["get"], include_paths=["^/pets"]).spec_raw
+
+    assert list(pruned["paths"]) == ["/pets"]
+    assert set(pruned["components"]["schemas"]) == {"Cat", "Dog"}
+    assert pruned["components"]["parameters"] == {}
+
+
+def test_unreachable_invalid_parts_are_not_validated() -> None:
+    # the schema of the request body of the write is not valid
+    parser = get_parsed_project_by_case("artificial", "users_with_writes.yml").openapi
+    assert set(parser.endpoints.endpoints_by_id) == {"list_users", "get_user", "get_me", "list_pets"}
+    assert parser.security_schemes["token"].scheme == "bearer"
+
+    # without pruning the full document is validated
+    with pytest.raises(DltInvalidSpecException):
+        get_parsed_project_by_case("artificial", "users_with_writes.yml", Config(prune_spec=False))
+
+
+@pytest.mark.parametrize("spec_raw", ["just a string", [1, 2], {"openapi": "3.0.0", "paths": [1, 2]}])
+def test_documents_that_are_no_mappings_are_not_pruned(spec_raw: Any) -> None:
+    assert prune_spec(spec_raw, ["get"], include_paths=["^/users"]).spec_raw is spec_raw
+
+
+@pytest.mark.parametrize("data", [b"just a string", b"- 1\n- 2\n", b"openapi: 3.0.0\npaths: [1, 2]\n"])
+def test_documents_that_are_no_mappings_are_invalid(data: bytes) -> None:
+    parser = OpenapiParser(Config(include_paths=["^/users"]))
+    with pytest.raises(DltInvalidSpecException):
+        parser.parse(data)
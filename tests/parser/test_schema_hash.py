@@ -0,0 +1,65 @@
+from typing import Any, Dict
+
+import openapi_schema_pydantic as osp
+
+from dlt_init_openapi.config import Config
+from dlt_init_openapi.parser.context import OpenapiContext
+from dlt_init_openapi.parser.schema_hash import schema_hash
+
+PET: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "owner": {"$ref": "#/components/schemas/Owner"},
+    },
+}
+
+
+def test_equal_schemas_hash_equal() -> None:
+    assert schema_hash(osp.Schema.parse_obj(PET)) == schema_hash(osp.Schema.parse_obj(PET))
+
+
+def test_changes_in_sub_schemas_change_the_hash() -> None:
+    pet_hash = schema_hash(osp.Schema.parse_obj(PET))
+
+    changed_items = {
+        **PET,
+        "properties": {**PET["properties"], "tags": {"type": "array", "items": {"type": "integer"}}},
+    }
+    assert schema_hash(osp.Schema.parse_obj(changed_items)) != pet_hash
+
+    changed_ref = {**PET, "properties": {**PET["properties"], "owner": {"$ref": "#/components/schemas/User"}}}
+    assert schema_hash(osp.Schema.parse_obj(changed_ref)) != pet_hash
+
+    renamed = {**PET, "properties": {"pet_id" if k == "id" else k: v for k, v in PET["properties"].items()}}
+    assert schema_hash(osp.Schema.parse_obj(renamed)) != pet_hash
+
+    # the same properties on a schema and its items are different schemas
+    as_items = {"type": "array", "items": {"type": "object", "properties": {"id": {"type": "integer"}}}}
+    as_properties = {"type": "array", "properties": {"id": {"type": "integer"}}}
+    assert schema_hash(osp.Schema.parse_obj(as_items)) != schema_hash(osp.Schema.parse_obj(as_properties))
+
+
+def test_hashes_of_referenced_schemas_are_memoized_by_ref() -> None:
+    spec_raw = {
+        "openapi": "3.0.0",
+        "info": {"title": "pets", "version": "1"},
+        "paths": {},
+        "components": {"schemas": {"Pet": PET, "Tag": {"type": "string"}}},
+    }
+    context = OpenapiContext(Config(component_cache_size=2), osp.OpenAPI.parse_obj(spec_raw), spec_raw)
+    pet = osp.Reference(ref="#/components/schemas/Pet")
+    assert context.schema_hash(pet) == schema_hash(osp.Schema.parse_obj(PET))
+    assert ("schema_hash", pet.ref) in context._parsed_component_cache
+
+    # hashes are evicted together with the parsed components
+    context.schema_hash(osp.Reference(ref="#/components/schemas/Tag"))
+    assert ("schema_hash", pet.ref) not in context._parsed_component_cache
+
+
+def test_deeply_nested_schema() -> None:
+    schema: Dict[str, Any] = {"type": "string"}
+    for _ in range(300):
+        schema = {"type": "object", "properties": {"child": schema}}
+    assert schema_hash(osp.Schema.parse_obj(schema))
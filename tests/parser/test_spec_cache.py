@@ -0,0 +1,125 @@
+import os
+from pathlib import Path
+from typing import List, Set
+
+import openapi_schema_pydantic as osp
+from pytest_mock import MockerFixture
+
+from dlt_init_openapi.config import Config
+from dlt_init_openapi.parser.endpoint_index import EndpointIndex
+from dlt_init_openapi.parser.openapi_parser import OpenapiParser
+from dlt_init_openapi.parser.spec_cache import SpecCache
+from dlt_init_openapi.parser.spec_files import open_spec_files
+from dlt_init_openapi.utils.disk_cache import DiskCache
+from tests.cases import case_path
+
+
+def test_spec_cache_roundtrip(tmp_path: Path) -> None:
+    cache = SpecCache(Config(cache_dir=tmp_path))
+    spec_raw = {"openapi": "3.0.0", "info": {"title": "test", "version": "1"}, "paths": {}}
+    spec = osp.OpenAPI.parse_obj(spec_raw)
+
+    key = cache.key(b"some document")
+    assert cache.key(b"some document") == key
+    assert cache.key(b"other document") != key
+
+    assert cache.get(key) is None
+    cache.put(key, spec_raw, spec)
+    assert cache.get(key) == (spec_raw, spec)
+
+    cache.clear()
+    assert cache.get(key) is None
+
+
+def test_spec_cache_key_of_spec_files(tmp_path: Path) -> None:
+    cache = SpecCache(Config(cache_dir=tmp_path))
+    for name in ["a/openapi.yaml", "a/schemas/openapi.yaml", "b/openapi.yaml"]:
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_bytes(b"some document")
+
+    keys = {
+        cache.key(b"some document"),
+        cache.key(b"some document", open_spec_files(tmp_path / "a")),
+        # refs are relative to the root document
+        cache.key(b"some document", open_spec_files(tmp_path / "a", "schemas/openapi.yaml")),
+    }
+    assert len(keys) == 3
+    # the same spec in another place has the same key
+    assert cache.key(b"some document", open_spec_files(tmp_path / "b")) in keys
+
+
+def test_spec_cache_corrupted_entry(tmp_path: Path) -> None:
+    cache = SpecCache(Config(cache_dir=tmp_path))
+    key = cache.key(b"some document")
+    cache.disk_cache.put(key, b"not a cache entry")
+    assert cache.get(key) is None
+    assert not cache.disk_cache.entries()
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path, max_size=25)
+    for i, key in enumerate(["a", "b"]):
+        cache.put(key, b"0123456789")
+        os.utime(cache.path_for(key), (i, i))
+
+    # reading "a" makes "b" the least recently used entry
+    assert cache.get("a") == b"0123456789"
+    cache.put("c", b"0123456789")
+
+    assert sorted(p.name for p in cache.entries()) == ["a", "c"]
+
+
+def test_disk_caches_share_budget(tmp_path: Path) -> None:
+    specs = DiskCache(tmp_path / "specs", max_size=25, budget_dir=tmp_path)
+    downloads = DiskCache(tmp_path / "downloads", max_size=25, budget_dir=tmp_path)
+    specs.put("a", b"0123456789")
+    os.utime(specs.path_for("a"), (0, 0))
+    downloads.put("b", b"0123456789")
+    os.utime(downloads.path_for("b"), (1, 1))
+
+    specs.put("c", b"0123456789")
+
+    # the least recently used entry of both caches is evicted
+    assert [p.name for p in downloads.entries()] == ["b"]
+    assert [p.name for p in specs.entries()] == ["c"]
+
+
+def test_parser_uses_cache(tmp_path: Path, mocker: MockerFixture) -> None:
+    data = Path(case_path("artificial", "pagination.yml")).read_bytes()
+    config = Config(use_cache=True, cache_dir=tmp_path)
+
+    OpenapiParser(config).parse(data)
+    spy = mocker.spy(osp.OpenAPI, "parse_obj")
+    parser = OpenapiParser(config)
+    parser.parse(data)
+
+    spy.assert_not_called()
+    assert len(parser.endpoints.endpoints) > 1
+
+
+def test_path_selection_is_made_on_cached_spec(tmp_path: Path, mocker: MockerFixture) -> None:
+    data = Path(case_path("artificial", "pagination.yml")).read_bytes()
+    offered: List[List[str]] = []
+
+    def select(position: int) -> Config:
+        def path_filter(index: EndpointIndex) -> Set[str]:
+            offered.append(index.paths)
+            return {index.paths[position]}
+
+        return Config(use_cache=True, cache_dir=tmp_path, path_filter=path_filter)
+
+    first = OpenapiParser(select(0))
+    first.parse(data)
+    spy = mocker.spy(osp.OpenAPI, "parse_obj")
+    second = OpenapiParser(select(1))
+    second.parse(data)
+
+    # the spec is not loaded again for another selection and all paths are offered
+    spy.assert_not_called()
+    assert offered[0] == offered[1]
+    assert [e.path for e in first.endpoints.endpoints if e.id in first.endpoints.endpoint_ids_to_render] == [
+        offered[0][0]
+    ]
+    assert [e.path for e in second.endpoints.endpoints if e.id in second.endpoints.endpoint_ids_to_render] == [
+        offered[0][1]
+    ]
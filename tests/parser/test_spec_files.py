@@ -0,0 +1,175 @@
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from dlt_init_openapi import _get_document, _get_project_for_url_or_path
+from dlt_init_openapi.config import Config
+from dlt_init_openapi.exceptions import DltSpecFileNotFoundException
+from dlt_init_openapi.parser.openapi_parser import OpenapiParser
+from dlt_init_openapi.parser.spec_files import DirectorySpecFiles, ZipSpecFiles, absolutize_refs, open_spec_files
+
+FILES = {
+    "openapi.yaml": """
+openapi: 3.0.0
+info:
+  title: users
+  version: "1"
+paths:
+  /users:
+    $ref: paths/users.yaml
+  /users/{id}:
+    get:
+      operationId: get_user
+      parameters:
+        - {name: id, in: path, required: true, schema: {type: integer}}
+      responses:
+        "200":
+          description: OK
+          content:
+            application/json:
+              schema:
+                $ref: ./schemas/user.yaml
+components:
+  schemas:
+    Error:
+      type: object
+      properties:
+        message: {type: string}
+""",
+    "paths/users.yaml": """
+get:
+  operationId: list_users
+  responses:
+    "200":
+      description: OK
+      content:
+        application/json:
+          schema:
+            type: array
+            items:
+              $ref: ../schemas/user.yaml
+""",
+    "schemas/user.yaml": """
+type: object
+properties:
+  id: {type: integer}
+  address:
+    $ref: "common.yaml#/Address"
+  error:
+    $ref: "../openapi.yaml#/components/schemas/Error"
+""",
+    "schemas/common.yaml": """
+Address:
+  type: object
+  properties:
+    street: {type: string}
+""",
+}
+
+
+def _write_dir(path: Path) -> Path:
+    for name, content in FILES.items():
+        (path / name).parent.mkdir(parents=True, exist_ok=True)
+        (path / name).write_text(content)
+    return path
+
+
+def _parse(spec_path: Path) -> OpenapiParser:
+    config = Config(spec_path=spec_path)
+    parser = OpenapiParser(config)
+    parser.parse(_get_document(config=config))
+    return parser
+
+
+def _assert_users_spec(parser: OpenapiParser) -> None:
+    endpoints = parser.endpoints.endpoints_by_id
+    assert set(endpoints) == {"list_users", "get_user"}
+
+    user = endpoints["get_user"].responses[0].schema
+    assert user.name == "user"
+    assert endpoints["list_users"].responses[0].schema.array_item is user
+    assert user["address"].schema.name == "Address"
+    assert user["address"].schema["street"].schema.types == ["string"]
+    # refs back to the root document resolve to the local component
+    assert user["error"].schema.name == "Error"
+    assert user["error"].schema.ref.ref == "#/components/schemas/Error"
+
+
+def test_spec_directory(tmp_path: Path, mocker: MockerFixture) -> None:
+    read = mocker.spy(DirectorySpecFiles, "read")
+
+    _assert_users_spec(_parse(_write_dir(tmp_path)))
+
+    # every file is read once
+    names = [call.args[1] for call in read.call_args_list]
+    assert sorted(names) == sorted(FILES)
+
+
+def test_root_file_in_directory(tmp_path: Path) -> None:
+    _assert_users_spec(_parse(_write_dir(tmp_path) / "openapi.yaml"))
+
+
+def test_spec_archives(tmp_path: Path) -> None:
+    spec_dir = _write_dir(tmp_path / "spec")
+
+    with zipfile.ZipFile(tmp_path / "spec.zip", "w") as archive:
+        for name in FILES:
+            archive.write(spec_dir / name, name)
+    _assert_users_spec(_parse(tmp_path / "spec.zip"))
+
+    with tarfile.open(tmp_path / "spec.tar.gz", "w:gz") as tar:
+        tar.add(spec_dir, arcname="spec")
+    _assert_users_spec(_parse(tmp_path / "spec.tar.gz"))
+
+
+def test_spec_archive_is_opened_once_and_closed(tmp_path: Path, mocker: MockerFixture) -> None:
+    spec_dir = _write_dir(tmp_path / "spec")
+    with zipfile.ZipFile(tmp_path / "spec.zip", "w") as archive:
+        for name in FILES:
+            archive.write(spec_dir / name, name)
+    opened = mocker.spy(ZipSpecFiles, "__init__")
+
+    with _get_project_for_url_or_path(config=Config(spec_path=tmp_path / "spec.zip")) as project:
+        project.parse()
+        spec_files = project.openapi.spec_files
+        assert isinstance(spec_files, ZipSpecFiles)
+        _assert_users_spec(project.openapi)
+
+    assert opened.call_count == 1
+    assert project.openapi.spec_files is None
+    assert spec_files.archive.fp is None
+
+
+def test_missing_file(tmp_path: Path) -> None:
+    spec_dir = _write_dir(tmp_path)
+    (spec_dir / "schemas" / "common.yaml").unlink()
+
+    parser = _parse(spec_dir)
+    # response schemas are expanded when they are first used
+    with pytest.raises(DltSpecFileNotFoundException):
+        parser.endpoints.endpoints_by_id["list_users"].responses[0].schema
+
+
+def test_find_root(tmp_path: Path) -> None:
+    _write_dir(tmp_path)
+    assert open_spec_files(tmp_path).root == "openapi.yaml"
+
+    (tmp_path / "openapi.yaml").rename(tmp_path / "users.yaml")
+    assert open_spec_files(tmp_path).root == "users.yaml"
+    assert open_spec_files(tmp_path, "paths/users.yaml").root == "paths/users.yaml"
+
+
+def test_absolutize_refs() -> None:
+    document = {
+        "a": {"$ref": "#/components/schemas/A"},
+        "b": [{"$ref": "../common.yaml#/B"}, {"$ref": "../openapi.yaml#/components/schemas/C"}],
+    }
+    absolutize_refs(document, "file:///schemas/user.yaml", "file:///openapi.yaml")
+
+    assert document == {
+        "a": {"$ref": "file:///schemas/user.yaml#/components/schemas/A"},
+        "b": [{"$ref": "file:///common.yaml#/B"}, {"$ref": "#/components/schemas/C"}],
+    }
@@ -0,0 +1,78 @@
+import json
+import multiprocessing
+from typing import Any
+
+import openapi_schema_pydantic as osp
+import pytest
+
+from dlt_init_openapi.config import Config
+from dlt_init_openapi.exceptions import DltInvalidSpecException
+from dlt_init_openapi.parser.openapi_parser import OpenapiParser
+from dlt_init_openapi.parser.validation import validate_spec_per_path
+from tests.integration.utils import get_parsed_project_by_case, get_spec_raw_by_case
+
+# all paths of the invalid path case except /broken are valid
+VALID_PATHS = ["/users", "/users/{id}", "/me", "/pets"]
+
+
+def _parser(config: Config = None) -> OpenapiParser:
+    return get_parsed_project_by_case("error", "invalid_path.yml", config).openapi
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_validate_per_path_matches_full_validation(jobs: int) -> None:
+    spec_raw = get_spec_raw_by_case("artificial", "users.yml")
+    result = validate_spec_per_path(spec_raw, jobs=jobs)
+
+    assert result.errors == {}
+    assert result.spec == osp.OpenAPI.parse_obj(spec_raw)
+    assert list(result.spec.paths) == list(spec_raw["paths"])
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_validate_per_path_reports_invalid_paths(jobs: int) -> None:
+    result = validate_spec_per_path(get_spec_raw_by_case("error", "invalid_path.yml"), jobs=jobs)
+
+    assert list(result.errors) == ["/broken"]
+    assert "description" in result.errors["/broken"]
+    assert list(result.spec.paths) == VALID_PATHS
+
+
+def test_validate_per_path_in_spawned_processes() -> None:
+    result = validate_spec_per_path(
+        get_spec_raw_by_case("error", "invalid_path.yml"), jobs=2, mp_context=multiprocessing.get_context("spawn")
+    )
+
+    assert list(result.errors) == ["/broken"]
+    assert list(result.spec.paths) == VALID_PATHS
+
+
+def test_invalid_path_that_is_not_included_is_skipped() -> None:
+    config = Config(validate_per_path=True, include_paths=["^/users$"], prune_spec=False)
+
+    parser = _parser(config)
+
+    assert "/broken" not in parser.context.spec.paths
+    assert [e.id for e in parser.endpoints.endpoints] == ["list_users"]
+
+
+def test_invalid_included_path_fails_with_its_error() -> None:
+    with pytest.raises(DltInvalidSpecException) as exc_info:
+        _parser(Config(validate_per_path=True))
+
+    assert list(exc_info.value.path_errors) == ["/broken"]
+    assert "Path /broken is invalid" in str(exc_info.value)
+
+    # a full validation fails without details
+    with pytest.raises(DltInvalidSpecException) as exc_info:
+        _parser()
+    assert exc_info.value.path_errors == {}
+
+
+@pytest.mark.parametrize("spec_raw", ["just a string", [1, 2], {"openapi": "3.0.0", "paths": [1, 2]}])
+def test_validate_per_path_fails_for_no_mappings(spec_raw: Any) -> None:
+    with pytest.raises(DltInvalidSpecException):
+        validate_spec_per_path(spec_raw)
+
+    with pytest.raises(DltInvalidSpecException):
+        OpenapiParser(Config(validate_per_path=True, prune_spec=False)).parse(json.dumps(spec_raw).encode())
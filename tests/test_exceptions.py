@@ -0,0 +1,31 @@
+import pickle
+
+import pytest
+
+from dlt_init_openapi.exceptions import (
+    DltInvalidSpecException,
+    DltNoEndpointsDiscovered,
+    DltOpenAPIException,
+    DltOpenAPINot30Exception,
+    DltSpecFileNotFoundException,
+    DltUnparseableSpecException,
+)
+
+
+@pytest.mark.parametrize(
+    "exception",
+    [
+        DltOpenAPINot30Exception(swagger_detected=True),
+        DltInvalidSpecException({"/users": "field required"}),
+        DltUnparseableSpecException(),
+        DltSpecFileNotFoundException("schemas/user.yaml"),
+        DltNoEndpointsDiscovered(["get"]),
+    ],
+)
+def test_exceptions_survive_pickling(exception: DltOpenAPIException) -> None:
+    # exceptions raised in pool workers are pickled to get to the main process
+    unpickled = pickle.loads(pickle.dumps(exception))
+
+    assert type(unpickled) is type(exception)
+    assert str(unpickled) == str(exception)
+    assert vars(unpickled) == vars(exception)
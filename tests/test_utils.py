@@ -69,6 +69,11 @@ def test_kebab_case():
     assert misc.kebab_case("keep_alive") == "keep-alive"
 
 
+def test_normalize_name():
+    assert misc.normalize_name("userId") == misc.normalize_name("user_id") == misc.normalize_name("User-ID") == "userid"
+    assert misc.normalize_name("_id") == "id"
+
+
 def test_sanitize():
     assert misc.sanitize("some.thing*~with lots_- of weird things}=") == "some.thingwith lots_- of weird things"
 
@@ -0,0 +1,128 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+import httpx
+import pytest
+
+from dlt_init_openapi import _get_document
+from dlt_init_openapi.config import Config
+from dlt_init_openapi.utils.download_cache import DownloadCache, download_spec
+
+
+class SpecServer(ThreadingHTTPServer):
+    body: bytes = b"openapi: 3.0.0"
+    etag: str = '"v1"'
+    last_modified: str = "Wed, 21 Oct 2015 07:28:00 GMT"
+    error_status: int = 0
+    requests: List[Dict[str, Any]]
+
+
+class SpecHandler(BaseHTTPRequestHandler):
+    server: SpecServer
+
+    def do_GET(self) -> None:
+        self.server.requests.append(dict(self.headers))
+        if self.server.error_status:
+            self.send_response(self.server.error_status)
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == self.server.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", self.server.etag)
+        self.send_header("Last-Modified", self.server.last_modified)
+        self.send_header("Content-Length", str(len(self.server.body)))
+        self.end_headers()
+        self.wfile.write(self.server.body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def spec_server() -> Iterator[SpecServer]:
+    server = SpecServer(("127.0.0.1", 0), SpecHandler)
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server: SpecServer) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}/spec.yaml"
+
+
+def test_conditional_download(tmp_path: Path, spec_server: SpecServer) -> None:
+    cache = DownloadCache(Config(cache_dir=tmp_path))
+    url = _url(spec_server)
+
+    assert cache.download(url) == b"openapi: 3.0.0"
+    assert "If-None-Match" not in spec_server.requests[0]
+
+    # unchanged spec is revalidated and served from disk
+    assert cache.download(url) == b"openapi: 3.0.0"
+    assert spec_server.requests[1]["If-None-Match"] == '"v1"'
+    assert spec_server.requests[1]["If-Modified-Since"] == spec_server.last_modified
+
+    # changed spec is downloaded again
+    spec_server.body = b"openapi: 3.1.0"
+    spec_server.etag = '"v2"'
+    assert cache.download(url) == b"openapi: 3.1.0"
+    assert cache.download(url) == b"openapi: 3.1.0"
+    assert len(spec_server.requests) == 4
+
+    cache.clear()
+    assert cache.download(url) == b"openapi: 3.1.0"
+    assert "If-None-Match" not in spec_server.requests[4]
+
+
+def test_cached_copy_used_when_server_unreachable(tmp_path: Path, spec_server: SpecServer) -> None:
+    cache = DownloadCache(Config(cache_dir=tmp_path))
+    url = _url(spec_server)
+    cache.download(url)
+
+    spec_server.shutdown()
+    spec_server.server_close()
+    assert cache.download(url, timeout=1) == b"openapi: 3.0.0"
+
+
+def test_body_larger_than_cache_is_not_cached(tmp_path: Path, spec_server: SpecServer) -> None:
+    cache = DownloadCache(Config(cache_dir=tmp_path, cache_max_size_mb=1))
+    url = _url(spec_server)
+    cache.download(url)
+
+    spec_server.body = b"x" * 2 * 1024 * 1024
+    spec_server.etag = '"v2"'
+    assert cache.download(url) == spec_server.body
+    assert cache.get_metadata(cache.key(url)) is None
+    # nothing to revalidate, the spec is downloaded again
+    assert cache.download(url) == spec_server.body
+    assert "If-None-Match" not in spec_server.requests[2]
+
+
+@pytest.mark.parametrize("status", [404, 500])
+def test_error_responses_are_raised(tmp_path: Path, spec_server: SpecServer, status: int) -> None:
+    cache = DownloadCache(Config(cache_dir=tmp_path))
+    url = _url(spec_server)
+    cache.download(url)
+
+    spec_server.error_status = status
+    with pytest.raises(httpx.HTTPStatusError):
+        cache.download(url)
+
+
+def test_download_without_cache(spec_server: SpecServer) -> None:
+    assert download_spec(_url(spec_server)) == b"openapi: 3.0.0"
+
+
+def test_get_document_from_url(tmp_path: Path, spec_server: SpecServer) -> None:
+    config = Config(spec_url=_url(spec_server), use_cache=True, cache_dir=tmp_path)
+    assert _get_document(config=config) == b"openapi: 3.0.0"
+    assert _get_document(config=config) == b"openapi: 3.0.0"
+    assert spec_server.requests[1]["If-None-Match"] == '"v1"'
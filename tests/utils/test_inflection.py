@@ -0,0 +1,24 @@
+from dlt_init_openapi.utils.inflection import Inflector
+
+
+def test_inflects_each_word_once() -> None:
+    inf = Inflector()
+    assert inf.singularize("pokemons") == "pokemon"
+    assert inf.singularize("pokemons") == "pokemon"
+    assert inf.pluralize("account") == "accounts"
+
+    stats = inf.stats()
+    assert stats["singularize"]["hits"] == 1
+    assert stats["singularize"]["misses"] == 1
+    assert stats["pluralize"]["misses"] == 1
+
+
+def test_cache_is_bounded() -> None:
+    inf = Inflector(max_size=2)
+    for word in ["cats", "dogs", "birds"]:
+        inf.singularize(word)
+
+    assert inf.stats()["singularize"]["size"] == 2
+    # evicted words are inflected again
+    assert inf.singularize("cats") == "cat"
+    assert inf.stats()["singularize"]["misses"] == 4
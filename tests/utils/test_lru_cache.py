@@ -0,0 +1,27 @@
+from dlt_init_openapi.utils.lru_cache import LRUCache
+
+
+def test_evicts_least_recently_used() -> None:
+    cache: LRUCache[str, int] = LRUCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    # b is the least recently used entry now
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_counts_hits_and_misses() -> None:
+    cache: LRUCache[str, int] = LRUCache(max_size=10)
+    assert cache.get("a") is None
+    cache.put("a", 1)
+    cache.get("a")
+    cache.get("a")
+
+    assert cache.stats() == {"size": 1, "max_size": 10, "hits": 2, "misses": 1}
+    cache.clear()
+    assert cache.stats() == {"size": 0, "max_size": 10, "hits": 0, "misses": 0}
@@ -3,6 +3,8 @@ from typing import List, Tuple
 import pytest
 
 from dlt_init_openapi.utils.paths import (
+    ParsedPath,
+    PathTrie,
     find_longest_common_prefix,
     get_non_var_path_parts,
     get_path_parts,
@@ -119,3 +121,35 @@ def test_path_looks_like_list() -> None:
     assert path_looks_like_list("") is False
     assert path_looks_like_list("hello/{var1}/my/path/{var2}") is False
     assert path_looks_like_list("hello/{var1}/my/path/") is True
+
+
+def test_parsed_path() -> None:
+    parsed = ParsedPath.from_path("/pokemons/{id}/abilities.json")
+
+    assert parsed.parts == ("pokemons", "{id}", "abilities")
+    assert parsed.var_names == ("id",)
+    assert parsed.non_var_parts == ("pokemons", "abilities")
+    assert parsed.singularized_parts == ("pokemon", "{id}", "ability")
+    assert parsed.looks_like_list is True
+    assert ParsedPath.from_path("/pokemons/{id}").looks_like_list is False
+    assert ParsedPath.from_path("").looks_like_list is False
+
+
+def test_path_trie_ancestor_values() -> None:
+    trie: PathTrie[str] = PathTrie()
+    for path in ["/users", "/users/{id}", "/users/{id}/posts/{post_id}", "/"]:
+        trie.insert(get_path_parts(path), path)
+
+    assert list(trie.ancestor_values(get_path_parts("/users/{id}/posts/{post_id}"))) == ["/users/{id}", "/users"]
+    # prefixes that are no path are skipped
+    assert list(trie.ancestor_values(get_path_parts("/users/{id}/comments"))) == ["/users/{id}", "/users"]
+    assert list(trie.ancestor_values(get_path_parts("/users"))) == []
+    assert list(trie.ancestor_values(())) == []
+
+
+def test_path_trie_common_prefix() -> None:
+    trie: PathTrie[None] = PathTrie([("api", "v2", "users"), ("api", "v2"), ("api", "v2", "users", "{id}")])
+
+    assert trie.common_prefix() == ("api", "v2")
+    assert trie.common_prefix(stop_at_paths=False) == ("api", "v2", "users", "{id}")
+    assert PathTrie[None]().common_prefix() == ()
@@ -0,0 +1,63 @@
+import pickle
+from dataclasses import FrozenInstanceError, dataclass, field
+from typing import List, Optional, Tuple
+
+import pytest
+
+from dlt_init_openapi.utils.slots import add_slots
+
+
+@add_slots
+@dataclass(frozen=True, eq=False)
+class Node:
+    name: str
+    children: Tuple["Node", ...] = ()
+    parent: Optional["Node"] = None
+    _cached: Optional[str] = field(default=None, init=False)
+
+
+@add_slots
+@dataclass
+class Counter:
+    name: str
+    values: List[int] = field(default_factory=list)
+
+
+def test_slotted_dataclass() -> None:
+    node = Node("root")
+    assert not hasattr(node, "__dict__")
+    assert node.children == ()
+    # fields that are not passed to init still get their default
+    assert node._cached is None
+    assert Node.__qualname__ == "Node"
+
+    with pytest.raises(FrozenInstanceError):
+        node.name = "other"  # type: ignore[misc]
+    with pytest.raises(FrozenInstanceError):
+        node.other = 1  # type: ignore[attr-defined]
+    with pytest.raises(FrozenInstanceError):
+        del node.name
+
+    counter = Counter("a")
+    counter.values.append(1)
+    counter.name = "b"
+    assert counter == Counter("b", [1])
+
+
+def test_pickle_frozen_cycle() -> None:
+    root = Node("root")
+    child = Node("child", parent=root)
+    object.__setattr__(root, "children", (child,))
+
+    restored = pickle.loads(pickle.dumps(root))
+    assert restored.name == "root"
+    assert restored.children[0].parent is restored
+    assert pickle.loads(pickle.dumps(Counter("a", [1]))) == Counter("a", [1])
+
+
+def test_rejects_slotted_class() -> None:
+    class Slotted:
+        __slots__ = ("a",)
+
+    with pytest.raises(TypeError):
+        add_slots(dataclass(Slotted))